@@ -3,9 +3,11 @@ Alert system for important property events
 Alert system for important property events
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 
+from ..shared.metrics import timed
+
 class AlertChecker:
     """
     Checks various conditions and generates alerts
@@ -20,11 +22,12 @@ class AlertChecker:
             "maintenance_due": 30  # 30 days until maintenance
         }
     
-    def check_price_alerts(self, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def check_price_alerts(self, property_data: Dict[str, Any], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
         Checks price-related alerts
         Checks price-related alerts
         """
+        now = now or datetime.now()
         alerts = []
         
         current_price = property_data.get("current_price", 0)
@@ -38,17 +41,18 @@ class AlertChecker:
                     "type": "price_drop",
                     "severity": "high",
                     "message": f"Price drop of {abs(price_change)*100:.1f}% detected",
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "property_id": property_data.get("id")
                 })
         
         return alerts
     
-    def check_market_alerts(self, market_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def check_market_alerts(self, market_data: Dict[str, Any], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
         Checks market-related alerts
         Checks market-related alerts
         """
+        now = now or datetime.now()
         alerts = []
         
         volatility = market_data.get("volatility", 0)
@@ -57,43 +61,51 @@ class AlertChecker:
                 "type": "market_volatility",
                 "severity": "medium",
                 "message": f"High market volatility: {volatility*100:.1f}%",
-                "timestamp": datetime.now(),
+                "timestamp": now,
                 "market_id": market_data.get("id")
             })
         
         return alerts
     
-    def check_maintenance_alerts(self, property_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def check_maintenance_alerts(self, property_data: Dict[str, Any], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """
         Checks maintenance-related alerts
         Checks maintenance-related alerts
         """
+        now = now or datetime.now()
         alerts = []
         
         next_maintenance = property_data.get("next_maintenance_date")
         if next_maintenance:
-            days_until_maintenance = (next_maintenance - datetime.now()).days
+            days_until_maintenance = (next_maintenance - now).days
             
             if days_until_maintenance <= self.alert_thresholds["maintenance_due"]:
                 alerts.append({
                     "type": "maintenance_due",
                     "severity": "medium",
                     "message": f"Maintenance due in {days_until_maintenance} days",
-                    "timestamp": datetime.now(),
+                    "timestamp": now,
                     "property_id": property_data.get("id")
                 })
         
         return alerts
     
-    def check_all_alerts(self, property_data: Dict[str, Any], market_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    @timed("alerts")
+    def check_all_alerts(
+        self,
+        property_data: Dict[str, Any],
+        market_data: Dict[str, Any],
+        now: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
         """
         Checks all alert types
-        Checks all alert types
+        All checks use the same clock reading, `now` if given
         """
+        now = now or datetime.now()
         all_alerts = []
         
-        all_alerts.extend(self.check_price_alerts(property_data))
-        all_alerts.extend(self.check_market_alerts(market_data))
-        all_alerts.extend(self.check_maintenance_alerts(property_data))
+        all_alerts.extend(self.check_price_alerts(property_data, now))
+        all_alerts.extend(self.check_market_alerts(market_data, now))
+        all_alerts.extend(self.check_maintenance_alerts(property_data, now))
         
         return all_alerts 
\ No newline at end of file
@@ -0,0 +1,228 @@
+"""
+Change detection for alerts
+Persisted last-seen state so alert runs only evaluate changed records
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import logging
+
+from .check import AlertChecker
+from ..shared.models import Alert
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# SQLite limits the number of bound parameters per statement
+_LOOKUP_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS property_state (
+    property_id TEXT PRIMARY KEY,
+    current_price REAL,
+    previous_price REAL,
+    next_maintenance_date TEXT,
+    maintenance_due_at TEXT,
+    price_alerted_at_price REAL,
+    maintenance_alerted_for TEXT
+);
+CREATE INDEX IF NOT EXISTS property_state_due ON property_state (maintenance_due_at);
+CREATE TABLE IF NOT EXISTS market_state (
+    market_id TEXT PRIMARY KEY,
+    volatility REAL,
+    volatility_alerted INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+def _record_id(value: Any) -> Optional[str]:
+    # Feeds may carry numeric ids; state keys and Alert ids are strings
+    return None if value is None else str(value)
+
+def _alert(fields: Dict[str, Any]) -> Alert:
+    return Alert(**dict(
+        fields,
+        property_id=_record_id(fields.get("property_id")),
+        market_id=_record_id(fields.get("market_id"))
+    ))
+
+def _batches(values: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+class AlertStateStore:
+    """
+    SQLite-backed last-seen state per property_id and market_id
+    Stores last price, volatility, maintenance date and what was already alerted
+    """
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or Settings.ALERT_STATE_PATH
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+    
+    def close(self) -> None:
+        self.connection.close()
+    
+    def _load(self, table: str, key: str, ids: Sequence[str]) -> Dict[str, sqlite3.Row]:
+        rows = {}
+        for batch in _batches(list(ids), _LOOKUP_BATCH):
+            placeholders = ",".join("?" * len(batch))
+            cursor = self.connection.execute(
+                f"SELECT * FROM {table} WHERE {key} IN ({placeholders})", list(batch)
+            )
+            for row in cursor:
+                rows[row[key]] = row
+        return rows
+    
+    def load_properties(self, property_ids: Sequence[str]) -> Dict[str, sqlite3.Row]:
+        return self._load("property_state", "property_id", property_ids)
+    
+    def load_markets(self, market_ids: Sequence[str]) -> Dict[str, sqlite3.Row]:
+        return self._load("market_state", "market_id", market_ids)
+    
+    def maintenance_due(self, now: datetime, exclude: Iterable[str] = ()) -> List[sqlite3.Row]:
+        """
+        Returns unchanged properties whose maintenance window opened since the last run
+        Uses the maintenance_due_at index, so cost follows the number of due records
+        """
+        excluded = set(exclude)
+        cursor = self.connection.execute(
+            "SELECT * FROM property_state WHERE maintenance_due_at < ? "
+            "AND (maintenance_alerted_for IS NULL OR maintenance_alerted_for != next_maintenance_date)",
+            (now.isoformat(),)
+        )
+        return [row for row in cursor if row["property_id"] not in excluded]
+    
+    def save_properties(self, rows: List[Tuple]) -> None:
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO property_state VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+        )
+    
+    def save_markets(self, rows: List[Tuple]) -> None:
+        self.connection.executemany("INSERT OR REPLACE INTO market_state VALUES (?, ?, ?)", rows)
+    
+    def commit(self) -> None:
+        self.connection.commit()
+
+class IncrementalAlertChecker:
+    """
+    Evaluates alerts only for records whose inputs changed since the last run
+    Alerts already raised for the same state are suppressed
+    """
+    
+    def __init__(self, store: AlertStateStore, checker: Optional[AlertChecker] = None):
+        self.store = store
+        self.checker = checker or AlertChecker()
+        self.last_run_stats: Dict[str, int] = {}
+    
+    def _maintenance_due_at(self, next_maintenance: Optional[datetime]) -> Optional[str]:
+        if not next_maintenance:
+            return None
+        # check_maintenance_alerts fires once (next - now).days <= threshold, i.e. strictly
+        # less than threshold + 1 days ahead
+        return _iso(next_maintenance - timedelta(days=self.checker.alert_thresholds["maintenance_due"] + 1))
+    
+    def run(
+        self,
+        property_records: Iterable[Dict[str, Any]],
+        market_records: Iterable[Dict[str, Any]] = (),
+        now: Optional[datetime] = None
+    ) -> List[Alert]:
+        """
+        Checks changed properties and markets and persists their new state
+        Records without an id carry no state and are always evaluated
+        """
+        now = now or datetime.now()
+        alerts: List[Alert] = []
+        stats = {"properties": 0, "dirty_properties": 0, "markets": 0, "dirty_markets": 0, "suppressed": 0}
+        
+        properties = list(property_records)
+        stats["properties"] = len(properties)
+        stored = self.store.load_properties([_record_id(record["id"]) for record in properties if record.get("id")])
+        property_rows = []
+        
+        for record in properties:
+            property_id = _record_id(record.get("id"))
+            next_maintenance = record.get("next_maintenance_date")
+            current = (record.get("current_price"), record.get("previous_price"), _iso(next_maintenance))
+            previous_state = stored.get(property_id) if property_id else None
+            
+            if previous_state is not None and current == (
+                previous_state["current_price"], previous_state["previous_price"], previous_state["next_maintenance_date"]
+            ):
+                continue
+            stats["dirty_properties"] += 1
+            
+            price_alerted = previous_state["price_alerted_at_price"] if previous_state is not None else None
+            maintenance_alerted = previous_state["maintenance_alerted_for"] if previous_state is not None else None
+            
+            price_alerts = self.checker.check_price_alerts(record, now)
+            if price_alerts and price_alerted == record.get("current_price"):
+                stats["suppressed"] += len(price_alerts)
+            else:
+                alerts.extend(_alert(alert) for alert in price_alerts)
+            price_alerted = record.get("current_price") if price_alerts else None
+            
+            maintenance_alerts = self.checker.check_maintenance_alerts(record, now)
+            if maintenance_alerts and maintenance_alerted == current[2]:
+                stats["suppressed"] += len(maintenance_alerts)
+            elif maintenance_alerts:
+                alerts.extend(_alert(alert) for alert in maintenance_alerts)
+                maintenance_alerted = current[2]
+            
+            if property_id:
+                property_rows.append((
+                    property_id, current[0], current[1], current[2],
+                    self._maintenance_due_at(next_maintenance), price_alerted, maintenance_alerted
+                ))
+        
+        # Unchanged properties can still become due as time passes
+        dirty_ids = {row[0] for row in property_rows}
+        for row in self.store.maintenance_due(now, exclude=dirty_ids):
+            record = {"id": row["property_id"], "next_maintenance_date": datetime.fromisoformat(row["next_maintenance_date"])}
+            maintenance_alerts = self.checker.check_maintenance_alerts(record, now)
+            if maintenance_alerts:
+                alerts.extend(_alert(alert) for alert in maintenance_alerts)
+                property_rows.append((
+                    row["property_id"], row["current_price"], row["previous_price"], row["next_maintenance_date"],
+                    row["maintenance_due_at"], row["price_alerted_at_price"], row["next_maintenance_date"]
+                ))
+        
+        markets = list(market_records)
+        stats["markets"] = len(markets)
+        stored_markets = self.store.load_markets([_record_id(record["id"]) for record in markets if record.get("id")])
+        market_rows = []
+        
+        for record in markets:
+            market_id = _record_id(record.get("id"))
+            previous_state = stored_markets.get(market_id) if market_id else None
+            if previous_state is not None and previous_state["volatility"] == record.get("volatility"):
+                continue
+            stats["dirty_markets"] += 1
+            
+            market_alerts = self.checker.check_market_alerts(record, now)
+            already_alerted = previous_state is not None and bool(previous_state["volatility_alerted"])
+            if market_alerts and already_alerted:
+                stats["suppressed"] += len(market_alerts)
+            else:
+                alerts.extend(_alert(alert) for alert in market_alerts)
+            
+            if market_id:
+                market_rows.append((market_id, record.get("volatility"), int(bool(market_alerts))))
+        
+        self.store.save_properties(property_rows)
+        self.store.save_markets(market_rows)
+        self.store.commit()
+        
+        stats["alerts"] = len(alerts)
+        self.last_run_stats = stats
+        logger.info(f"Alert run: {stats}")
+        return alerts
@@ -0,0 +1,116 @@
+"""
+Streaming alert evaluation over large property and market feeds
+Streaming alert evaluation over large property and market feeds
+"""
+
+import itertools
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .check import AlertChecker
+from ..shared.models import Alert
+
+DEFAULT_CHUNK_SIZE = 4096
+
+_MICROSECONDS_PER_DAY = 86400 * 10**6
+
+def _record_id(value: Any) -> Optional[str]:
+    # Feeds may carry numeric ids; Alert ids are strings
+    return None if value is None else str(value)
+
+def _suburb_key(record: Dict[str, Any]) -> str:
+    return str(record.get("suburb") or "").strip().lower()
+
+def _chunks(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(records)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def index_markets(market_records: Iterable[Dict[str, Any]]) -> Dict[str, Tuple[float, Optional[str]]]:
+    """
+    Reduces a market feed to (volatility, id) per suburb
+    Memory grows with the number of suburbs, not with the portfolio
+    """
+    markets = {}
+    for record in market_records:
+        markets[_suburb_key(record)] = (float(record.get("volatility") or 0), _record_id(record.get("id")))
+    return markets
+
+def _price_changes(chunk: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+    current = np.array([record.get("current_price") or 0 for record in chunk], dtype=np.float64)
+    previous = np.array([record.get("previous_price") or 0 for record in chunk], dtype=np.float64)
+    valid = previous > 0
+    change = np.zeros(len(chunk), dtype=np.float64)
+    np.divide(current - previous, previous, out=change, where=valid)
+    return change, valid
+
+def _days_until(chunk: List[Dict[str, Any]], now: datetime) -> Tuple[np.ndarray, np.ndarray]:
+    dates = [record.get("next_maintenance_date") for record in chunk]
+    has_date = np.array([bool(date) for date in dates])
+    stamps = np.array([date if date else now for date in dates], dtype="datetime64[us]")
+    delta = (stamps - np.datetime64(now, "us")).astype(np.int64)
+    # Floor division matches timedelta.days for negative deltas too
+    return delta // _MICROSECONDS_PER_DAY, has_date
+
+def evaluate_alert_stream(
+    property_records: Iterable[Dict[str, Any]],
+    market_records: Iterable[Dict[str, Any]],
+    thresholds: Optional[Dict[str, float]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    now: Optional[datetime] = None
+) -> Iterator[Alert]:
+    """
+    Lazily evaluates alerts for a stream of properties joined to markets by suburb
+    Thresholds are applied per chunk with numpy; market alerts are raised once per suburb
+    """
+    thresholds = thresholds or AlertChecker().alert_thresholds
+    now = now or datetime.now()
+    markets = index_markets(market_records)
+    alerted_suburbs = set()
+    
+    for chunk in _chunks(property_records, chunk_size):
+        change, has_previous = _price_changes(chunk)
+        price_drop = has_previous & (change < -thresholds["price_drop"])
+        
+        days, has_date = _days_until(chunk, now)
+        maintenance_due = has_date & (days <= thresholds["maintenance_due"])
+        
+        suburbs = [_suburb_key(record) for record in chunk]
+        volatility = np.array([markets.get(suburb, (0.0, None))[0] for suburb in suburbs])
+        volatile = volatility > thresholds["market_volatility"]
+        
+        for i in np.nonzero(price_drop | volatile | maintenance_due)[0].tolist():
+            record = chunk[i]
+            
+            if price_drop[i]:
+                yield Alert(
+                    type="price_drop",
+                    severity="high",
+                    message=f"Price drop of {abs(float(change[i]))*100:.1f}% detected",
+                    timestamp=now,
+                    property_id=_record_id(record.get("id"))
+                )
+            
+            if volatile[i] and suburbs[i] not in alerted_suburbs:
+                alerted_suburbs.add(suburbs[i])
+                yield Alert(
+                    type="market_volatility",
+                    severity="medium",
+                    message=f"High market volatility: {float(volatility[i])*100:.1f}%",
+                    timestamp=now,
+                    market_id=markets[suburbs[i]][1]
+                )
+            
+            if maintenance_due[i]:
+                yield Alert(
+                    type="maintenance_due",
+                    severity="medium",
+                    message=f"Maintenance due in {int(days[i])} days",
+                    timestamp=now,
+                    property_id=_record_id(record.get("id"))
+                )
@@ -0,0 +1,184 @@
+"""
+Response cache for upstream data sources
+Response cache for upstream data sources
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+import logging
+
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+class CacheBackend:
+    """
+    Interface for cache storage backends
+    Values are JSON-compatible dicts and must be treated as read-only
+    """
+    
+    async def get(self, key: str) -> Optional[Any]:
+        raise NotImplementedError
+    
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        raise NotImplementedError
+    
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    In-process backend with TTL expiry and size-bounded LRU eviction
+    In-process backend with TTL expiry and LRU eviction
+    """
+    
+    def __init__(self, max_entries: int = 10000, clock: Callable[[], float] = time.monotonic):
+        if max_entries <= 0:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.clock = clock
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (self.clock() + ttl, value)
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    async def clear(self) -> None:
+        self._entries.clear()
+
+class SharedCacheBackend(CacheBackend):
+    """
+    Backend for a shared key-value store such as Redis
+    Expects an asyncio client with get(key) and set(key, value, ex=seconds)
+    """
+    
+    def __init__(self, client: Any, prefix: str = "grow:cache:"):
+        self.client = client
+        self.prefix = prefix
+    
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+    
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        # Shared stores expire at whole-second granularity
+        await self.client.set(self.prefix + key, json.dumps(value), ex=max(1, int(ttl)))
+    
+    async def clear(self) -> None:
+        # Entries expire on their own; prefix scans are left to the store operator
+        logger.warning("SharedCacheBackend.clear() is a no-op")
+
+class ResponseCache:
+    """
+    Caches upstream responses keyed on (source, suburb, postcode)
+    Concurrent misses for the same key share a single upstream call
+    """
+    
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttl: Optional[float] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.backend = backend or InMemoryCacheBackend(Settings.CACHE_MAX_ENTRIES)
+        self.ttl = Settings.CACHE_TTL if ttl is None else ttl
+        self.enabled = Settings.CACHE_ENABLED if enabled is None else enabled
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+    
+    @staticmethod
+    def make_key(source: str, suburb: str, postcode: str) -> str:
+        """
+        Builds a normalized cache key
+        Builds a normalized cache key
+        """
+        return f"{source}:{suburb.strip().lower()}:{postcode.strip()}"
+    
+    async def get_or_fetch(
+        self,
+        source: str,
+        suburb: str,
+        postcode: str,
+        fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Returns a cached response or fetches, stores and returns a fresh one
+        Returns a cached response or fetches a fresh one
+        """
+        if not self.enabled:
+            return await fetch()
+        
+        key = self.make_key(source, suburb, postcode)
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(inflight)
+        
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetch()
+            await self.backend.set(key, value, self.ttl)
+        except (Exception, asyncio.CancelledError) as e:
+            # Waiters must not inherit the owner's cancellation (e.g. its timeout)
+            if isinstance(e, asyncio.CancelledError):
+                future.set_exception(RuntimeError(f"Upstream fetch for {key} was cancelled"))
+            else:
+                future.set_exception(e)
+            # Mark as retrieved so an exception without waiters is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss counters
+        Returns hit/miss counters
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+            "evictions": getattr(self.backend, "evictions", None)
+        }
@@ -3,25 +3,104 @@ Data fetching for property and market data
 Data fetching for property and market data
 """
 
-import requests
+import asyncio
+import httpx
 from typing import Dict, List, Any, Optional
 import logging
 
+from .cache import ResponseCache
+from ..shared.metrics import get_metrics, timed
+from ..shared.settings import Settings
+
 logger = logging.getLogger(__name__)
 
+# Request paths per source, relative to the source base URL
+SOURCE_PATHS = {
+    "property_data": "/properties",
+    "market_data": "/markets",
+    "census_data": "/census",
+    "infrastructure_data": "/infrastructure"
+}
+
 class DataFetcher:
     """
     Central class for fetching property data
     Central class for fetching property data
     """
     
-    def __init__(self, api_keys: Dict[str, str]):
+    def __init__(
+        self,
+        api_keys: Dict[str, str],
+        base_urls: Optional[Dict[str, str]] = None,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_connections: Optional[int] = None,
+        cache: Optional[ResponseCache] = None
+    ):
         self.api_keys = api_keys
         self.base_urls = {
             "property_data": "https://api.propertydata.com",
             "market_data": "https://api.marketdata.com",
-            "census_data": "https://api.census.gov"
+            "census_data": "https://api.census.gov",
+            "infrastructure_data": "https://api.infrastructure.gov.au"
         }
+        self.base_urls.update(base_urls or {})
+        self.timeouts = dict(Settings.FETCH_TIMEOUTS)
+        self.timeouts.update(timeouts or {})
+        self.max_connections = max_connections or Settings.FETCH_MAX_CONNECTIONS
+        self.cache = cache or ResponseCache()
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self) -> "DataFetcher":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Shared pooled HTTP client, created on first use
+        All sources share one connection pool
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=max(self.timeouts.values())
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """
+        Closes the shared HTTP client
+        Closes the shared HTTP client
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    def has_source(self, source: str) -> bool:
+        """
+        Checks whether a source is configured with an API key
+        Unconfigured sources fall back to placeholder data
+        """
+        return bool(self.api_keys.get(source))
+    
+    async def _get_json(self, source: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Performs a GET request against a source and returns the JSON body
+        Performs a GET request against a source
+        """
+        response = await self.client.get(
+            self.base_urls[source] + SOURCE_PATHS[source],
+            params=params,
+            headers={"X-API-Key": self.api_keys[source]},
+            timeout=self.timeouts[source]
+        )
+        response.raise_for_status()
+        return response.json()
     
     async def fetch_property_data(self, address: str, suburb: str, postcode: str) -> Dict[str, Any]:
         """
@@ -29,9 +108,11 @@ class DataFetcher:
         Fetches property data for a specific address
         """
         try:
-            # TODO: Implement real API request
             logger.info(f"Fetching property data for: {address}, {suburb}")
             
+            if self.has_source("property_data"):
+                return await self._get_json("property_data", {"address": address, "suburb": suburb, "postcode": postcode})
+            
             # Placeholder data
             return {
                 "address": address,
@@ -57,9 +138,14 @@ class DataFetcher:
         Fetches market data for a suburb
         """
         try:
-            # TODO: Implement real API request
             logger.info(f"Fetching market data for: {suburb}")
             
+            if self.has_source("market_data"):
+                return await self.cache.get_or_fetch(
+                    "market_data", suburb, postcode,
+                    lambda: self._get_json("market_data", {"suburb": suburb, "postcode": postcode})
+                )
+            
             # Placeholder data
             return {
                 "suburb": suburb,
@@ -84,9 +170,14 @@ class DataFetcher:
         Fetches census data
         """
         try:
-            # TODO: Implement real API request
             logger.info(f"Fetching census data for: {suburb}")
             
+            if self.has_source("census_data"):
+                return await self.cache.get_or_fetch(
+                    "census_data", suburb, postcode,
+                    lambda: self._get_json("census_data", {"suburb": suburb, "postcode": postcode})
+                )
+            
             # Placeholder data
             return {
                 "suburb": suburb,
@@ -109,9 +200,14 @@ class DataFetcher:
         Fetches infrastructure data
         """
         try:
-            # TODO: Implement real API request
             logger.info(f"Fetching infrastructure data for: {suburb}")
             
+            if self.has_source("infrastructure_data"):
+                return await self.cache.get_or_fetch(
+                    "infrastructure_data", suburb, postcode,
+                    lambda: self._get_json("infrastructure_data", {"suburb": suburb, "postcode": postcode})
+                )
+            
             # Placeholder data
             return {
                 "suburb": suburb,
@@ -126,4 +222,49 @@ class DataFetcher:
             
         except Exception as e:
             logger.error(f"Error fetching infrastructure data: {str(e)}")
-            raise 
\ No newline at end of file
+            raise 
+    
+    async def _fetch_with_timeout(self, source: str, coroutine) -> Dict[str, Any]:
+        """
+        Runs a single source fetch bounded by its timeout
+        Runs a single source fetch bounded by its timeout
+        """
+        with get_metrics().time(f"fetch.{source}"):
+            return await asyncio.wait_for(coroutine, timeout=self.timeouts[source])
+    
+    @timed("fetch")
+    async def fetch_all(self, suburb: str, postcode: str, address: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Fetches property, market, census and infrastructure data concurrently
+        Failed or timed-out sources are returned as None and listed under "errors"
+        """
+        fetches = {
+            "market_data": self.fetch_market_data(suburb, postcode),
+            "census_data": self.fetch_census_data(suburb, postcode),
+            "infrastructure_data": self.fetch_infrastructure_data(suburb, postcode)
+        }
+        if address is not None:
+            fetches["property_data"] = self.fetch_property_data(address, suburb, postcode)
+        
+        sources = list(fetches)
+        outcomes = await asyncio.gather(
+            *(self._fetch_with_timeout(source, fetches[source]) for source in sources),
+            return_exceptions=True
+        )
+        
+        results: Dict[str, Any] = {"property_data": None, "errors": {}}
+        for source, outcome in zip(sources, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, BaseException):
+                if isinstance(outcome, asyncio.TimeoutError):
+                    message = f"timed out after {self.timeouts[source]}s"
+                else:
+                    message = str(outcome) or type(outcome).__name__
+                logger.warning(f"Source {source} failed for {suburb}: {message}")
+                results[source] = None
+                results["errors"][source] = message
+            else:
+                results[source] = outcome
+        
+        return results
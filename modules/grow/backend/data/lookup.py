@@ -0,0 +1,231 @@
+"""
+Postcode and suburb lookup index
+In-memory exact, prefix and trigram search over postcodes and SA2 names
+"""
+
+import bisect
+import json
+import os
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from ..shared.settings import Settings
+from ..spatial.sa2_index import get_sa2_index
+
+logger = logging.getLogger(__name__)
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+def normalize_name(text: Optional[str]) -> str:
+    """
+    Case- and diacritic-insensitive form of a place name
+    "München-Schwabing" and "munchen  schwabing" both become "munchen schwabing"
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _NON_ALNUM.sub(" ", stripped).strip()
+
+def normalize_postcode(postcode: Optional[str]) -> str:
+    """
+    Strips whitespace from a postcode
+    Strips whitespace from a postcode
+    """
+    return "".join(str(postcode or "").split())
+
+def trigrams(normalized: str) -> List[str]:
+    """
+    Distinct trigrams of a normalized name, padded so short names and word starts count
+    Distinct trigrams of a normalized name
+    """
+    padded = f"  {normalized} "
+    return sorted({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+class LookupIndex:
+    """
+    Lookup over place entries (suburbs from the postcode file and SA2 regions)
+    Built once; queries only touch dicts, sorted keys and trigram posting arrays
+    """
+    
+    def __init__(self, entries: Iterable[Dict[str, Any]]):
+        self.entries: List[Dict[str, Any]] = []
+        self._by_postcode: Dict[str, List[int]] = {}
+        self._by_name: Dict[str, List[int]] = {}
+        prefix_keys: List[Tuple[str, int]] = []
+        postings: Dict[str, List[int]] = {}
+        
+        for entry in entries:
+            entry_id = len(self.entries)
+            normalized = normalize_name(entry.get("name"))
+            self.entries.append(dict(entry))
+            
+            postcode = normalize_postcode(entry.get("postcode"))
+            if postcode:
+                self._by_postcode.setdefault(postcode, []).append(entry_id)
+            if not normalized:
+                continue
+            self._by_name.setdefault(normalized, []).append(entry_id)
+            
+            # Every word start is a prefix entry point ("schwab" finds "munchen schwabing")
+            prefix_keys.append((normalized, entry_id))
+            for match in re.finditer(r" ", normalized):
+                prefix_keys.append((normalized[match.end():], entry_id))
+            
+            for gram in trigrams(normalized):
+                postings.setdefault(gram, []).append(entry_id)
+        
+        prefix_keys.sort()
+        self._prefix_keys = [key for key, _ in prefix_keys]
+        self._prefix_ids = [entry_id for _, entry_id in prefix_keys]
+        self._postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+        self._trigram_counts = np.zeros(len(self.entries), dtype=np.int32)
+        for ids in self._postings.values():
+            self._trigram_counts[ids] += 1
+    
+    @classmethod
+    def from_sources(cls, postcode_path: Optional[str] = None, sa2_index: Any = None) -> "LookupIndex":
+        """
+        Builds the index from the postcode file and, if given, the SA2 index
+        A missing postcode file is logged and skipped
+        """
+        postcode_path = postcode_path or Settings.POSTCODE_SUBURB_PATH
+        entries: List[Dict[str, Any]] = []
+        
+        if os.path.exists(postcode_path):
+            with open(postcode_path, "r", encoding="utf-8") as f:
+                postcodes = json.load(f)
+            for postcode, info in postcodes.items():
+                entries.append({
+                    "kind": "suburb",
+                    "name": info.get("suburb", ""),
+                    "postcode": postcode,
+                    "state": info.get("state", ""),
+                    "sa2_code": None
+                })
+        else:
+            logger.warning(f"Postcode file not found: {postcode_path}")
+        
+        if sa2_index is not None:
+            for code, name, state in zip(sa2_index.codes.tolist(), sa2_index.names.tolist(), sa2_index.states.tolist()):
+                entries.append({"kind": "sa2", "name": name, "postcode": None, "state": state, "sa2_code": code})
+        
+        index = cls(entries)
+        logger.info(f"Built lookup index with {len(index)} entries")
+        return index
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def _results(self, ids: Iterable[int], match: str, scores: Optional[Sequence[float]] = None) -> List[Dict[str, Any]]:
+        results = []
+        for n, entry_id in enumerate(ids):
+            result = dict(self.entries[entry_id])
+            result["match"] = match
+            result["score"] = 1.0 if scores is None else scores[n]
+            results.append(result)
+        return results
+    
+    def by_postcode(self, postcode: str) -> List[Dict[str, Any]]:
+        """
+        Returns all entries with exactly this postcode
+        Returns all entries with this postcode
+        """
+        return self._results(self._by_postcode.get(normalize_postcode(postcode), []), "postcode")
+    
+    def by_name(self, name: str) -> List[Dict[str, Any]]:
+        """
+        Returns all entries whose name matches ignoring case, diacritics and punctuation
+        Returns all entries with this name
+        """
+        return self._results(self._by_name.get(normalize_name(name), []), "exact")
+    
+    def prefix_ids(self, query: str, limit: int) -> List[int]:
+        """
+        Entry ids whose name or any word of it starts with the query, in key order
+        Stops after limit distinct entries, so cost does not grow with the number of matches
+        """
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+        start = bisect.bisect_left(self._prefix_keys, normalized)
+        end = bisect.bisect_left(self._prefix_keys, normalized + "\uffff", lo=start)
+        
+        ids = []
+        seen = set()
+        for position in range(start, end):
+            entry_id = self._prefix_ids[position]
+            if entry_id not in seen:
+                seen.add(entry_id)
+                ids.append(entry_id)
+                if len(ids) == limit:
+                    break
+        return ids
+    
+    def fuzzy_ids(self, query: str, limit: int, min_similarity: float = 0.3) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Entry ids ranked by trigram Dice similarity, with their similarities
+        Only entries that share a trigram with the query are considered
+        """
+        grams = trigrams(normalize_name(query))
+        lists = [self._postings[gram] for gram in grams if gram in self._postings]
+        if not lists:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.entries))
+        candidates = np.flatnonzero(shared)
+        similarity = 2.0 * shared[candidates] / (len(grams) + self._trigram_counts[candidates])
+        keep = similarity >= min_similarity
+        candidates, similarity = candidates[keep], similarity[keep]
+        
+        if len(candidates) > limit:
+            top = np.argpartition(-similarity, limit - 1)[:limit]
+            candidates, similarity = candidates[top], similarity[top]
+        order = np.lexsort((candidates, -similarity))
+        return candidates[order], similarity[order]
+    
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Autocomplete search: postcode, exact name, prefix, then fuzzy matches
+        Each entry appears once, under its best match type
+        """
+        results = []
+        seen = set()
+        
+        def add(items: List[Dict[str, Any]], ids: Iterable[int]) -> None:
+            for item, entry_id in zip(items, ids):
+                if entry_id not in seen and len(results) < limit:
+                    seen.add(entry_id)
+                    results.append(item)
+        
+        postcode = normalize_postcode(query)
+        if postcode.isdigit():
+            ids = self._by_postcode.get(postcode, [])
+            add(self._results(ids, "postcode"), ids)
+        
+        ids = self._by_name.get(normalize_name(query), [])
+        add(self._results(ids, "exact"), ids)
+        
+        if len(results) < limit:
+            ids = self.prefix_ids(query, limit)
+            add(self._results(ids, "prefix"), ids)
+        
+        if len(results) < limit:
+            ids, similarity = self.fuzzy_ids(query, limit + len(results))
+            ids = ids.tolist()
+            add(self._results(ids, "fuzzy", [round(value, 3) for value in similarity.tolist()]), ids)
+        
+        return results
+
+@lru_cache(maxsize=1)
+def get_lookup_index() -> LookupIndex:
+    """
+    Returns the process-wide lookup index, building it on first use
+    Returns the shared lookup index
+    """
+    return LookupIndex.from_sources(sa2_index=get_sa2_index())
@@ -0,0 +1,302 @@
+"""
+Time-series market store
+Append-only monthly median prices per suburb with rolling growth, volatility and momentum
+"""
+
+import argparse
+import csv
+import json
+import os
+from datetime import date
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import logging
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .lookup import normalize_name
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# Window lengths in months
+GROWTH_1Y_MONTHS = 12
+GROWTH_5Y_MONTHS = 60
+MOMENTUM_MONTHS = 3
+VOLATILITY_MONTHS = 12
+
+# Rows of history needed to compute every metric for the latest month
+HISTORY_MONTHS = GROWTH_5Y_MONTHS + 1
+
+METRIC_FIELDS = ("median_price", "price_growth_1y", "price_growth_5y", "volatility", "momentum_3m")
+
+def month_number(month: Union[str, int, date]) -> int:
+    """
+    Converts "YYYY-MM", a date or a month number into months since year 0
+    Converts a month into a month number
+    """
+    if isinstance(month, int):
+        return month
+    if isinstance(month, date):
+        return month.year * 12 + month.month - 1
+    year, month_of_year = str(month).strip()[:7].split("-")
+    return int(year) * 12 + int(month_of_year) - 1
+
+def month_label(number: int) -> str:
+    return f"{number // 12:04d}-{number % 12 + 1:02d}"
+
+def _lagged_growth(prices: np.ndarray, lag: int) -> np.ndarray:
+    growth = np.full(prices.shape, np.nan)
+    if len(prices) > lag:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growth[lag:] = prices[lag:] / prices[:-lag] - 1.0
+    return growth
+
+def rolling_metrics(prices: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Computes rolling metrics for every month and suburb of a (months x suburbs) price matrix
+    A metric is NaN wherever its window has a missing or non-positive price
+    """
+    prices = np.where(prices > 0, prices, np.nan)
+    metrics = {
+        "median_price": prices,
+        "price_growth_1y": _lagged_growth(prices, GROWTH_1Y_MONTHS),
+        "price_growth_5y": _lagged_growth(prices, GROWTH_5Y_MONTHS),
+        "momentum_3m": _lagged_growth(prices, MOMENTUM_MONTHS)
+    }
+    
+    # Annualized standard deviation of monthly log returns
+    volatility = np.full(prices.shape, np.nan)
+    if len(prices) > VOLATILITY_MONTHS:
+        returns = np.diff(np.log(prices), axis=0)
+        windows = sliding_window_view(returns, VOLATILITY_MONTHS, axis=0)
+        volatility[VOLATILITY_MONTHS:] = windows.std(axis=-1, ddof=1) * np.sqrt(12.0)
+    metrics["volatility"] = volatility
+    
+    return metrics
+
+class MarketSeriesStore:
+    """
+    Columnar store of monthly median prices: one row per month, one column per suburb
+    Months can only be appended; metrics for the latest month are cached until the next append
+    """
+    
+    def __init__(self, start_month: Optional[int] = None, suburbs: Sequence[str] = (), prices: Optional[np.ndarray] = None):
+        self.start_month = start_month
+        self.suburbs: List[str] = [normalize_name(suburb) for suburb in suburbs]
+        self._columns = {suburb: i for i, suburb in enumerate(self.suburbs)}
+        # Raw names seen so far, so repeated appends skip unicode normalization
+        self._aliases: Dict[str, int] = {}
+        initial = np.asarray(prices, dtype=np.float64) if prices is not None else np.empty((0, len(self.suburbs)))
+        self._rows = len(initial)
+        self._buffer = np.full((max(self._rows, 16), max(len(self.suburbs), 16)), np.nan)
+        self._buffer[:self._rows, :len(self.suburbs)] = initial
+        self._latest: Optional[Dict[str, np.ndarray]] = None
+    
+    @property
+    def prices(self) -> np.ndarray:
+        """
+        The (months x suburbs) price matrix as a view without spare capacity
+        The price matrix
+        """
+        return self._buffer[:self._rows, :len(self.suburbs)]
+    
+    @property
+    def months(self) -> np.ndarray:
+        if self.start_month is None:
+            return np.empty(0, dtype=np.int64)
+        return np.arange(self.start_month, self.start_month + self._rows)
+    
+    @property
+    def latest_month(self) -> Optional[int]:
+        return None if self.start_month is None or not self._rows else self.start_month + self._rows - 1
+    
+    def _ensure_capacity(self, rows: int, columns: int) -> None:
+        if rows <= self._buffer.shape[0] and columns <= self._buffer.shape[1]:
+            return
+        # Grow by doubling so appends stay amortized O(1) per cell
+        row_capacity, column_capacity = self._buffer.shape
+        while row_capacity < rows:
+            row_capacity *= 2
+        while column_capacity < columns:
+            column_capacity *= 2
+        buffer = np.full((row_capacity, column_capacity), np.nan)
+        buffer[:self._rows, :len(self.suburbs)] = self.prices
+        self._buffer = buffer
+    
+    def _column(self, suburb: str) -> int:
+        column = self._aliases.get(suburb)
+        if column is not None:
+            return column
+        key = normalize_name(suburb)
+        column = self._columns.get(key)
+        if column is None:
+            column = len(self.suburbs)
+            self._ensure_capacity(self._rows, column + 1)
+            self.suburbs.append(key)
+            self._columns[key] = column
+        self._aliases[suburb] = column
+        return column
+    
+    def append(self, month: Union[str, int, date], prices: Mapping[str, float]) -> None:
+        """
+        Appends median prices for one month; new suburbs get an empty history
+        Earlier months are immutable; the latest month only accepts suburbs it has no price for yet
+        """
+        number = month_number(month)
+        if self.start_month is None:
+            self.start_month = number
+        latest = self.latest_month
+        if latest is not None and number < latest:
+            raise ValueError(f"Cannot append {month_label(number)}: store already has data up to {month_label(latest)}")
+        
+        row = number - self.start_month
+        columns = [(self._column(suburb), float(price)) for suburb, price in prices.items()]
+        self._ensure_capacity(row + 1, len(self.suburbs))
+        
+        if latest is not None and row == self._rows - 1:
+            for column, _ in columns:
+                if not np.isnan(self._buffer[row, column]):
+                    raise ValueError(f"{self.suburbs[column]} already has a price for {month_label(number)}")
+        
+        positions, values = zip(*columns) if columns else ((), ())
+        self._buffer[row, list(positions)] = values
+        # Skipped months stay NaN
+        self._rows = max(self._rows, row + 1)
+        self._latest = None
+    
+    def extend(self, records: Iterable[Tuple[Union[str, int, date], str, float]]) -> int:
+        """
+        Appends (month, suburb, price) records, grouped by month in ascending order
+        Returns the number of records appended
+        """
+        by_month: Dict[int, Dict[str, float]] = {}
+        for month, suburb, price in records:
+            by_month.setdefault(month_number(month), {})[suburb] = price
+        for number in sorted(by_month):
+            self.append(number, by_month[number])
+        return sum(len(prices) for prices in by_month.values())
+    
+    def rolling_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Rolling metrics over the full history of all suburbs
+        Rolling metrics over the full history
+        """
+        return rolling_metrics(self.prices)
+    
+    def latest_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Metrics for the latest month, one value per suburb
+        Computed from the last HISTORY_MONTHS rows only and cached until the next append
+        """
+        if self._latest is None:
+            tail = self.prices[-HISTORY_MONTHS:]
+            if len(tail):
+                self._latest = {field: values[-1].copy() for field, values in rolling_metrics(tail).items()}
+            else:
+                self._latest = {field: np.empty(0) for field in METRIC_FIELDS}
+        return self._latest
+    
+    def latest_columns(self, suburbs: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Latest metrics as scoring columns aligned with the given suburbs
+        Unknown suburbs get NaN
+        """
+        latest = self.latest_metrics()
+        positions = np.array([self._columns.get(normalize_name(suburb), -1) for suburb in suburbs], dtype=np.int64)
+        known = positions >= 0
+        columns = {}
+        for field in METRIC_FIELDS:
+            column = np.full(len(suburbs), np.nan)
+            column[known] = latest[field][positions[known]]
+            columns[field] = column
+        return columns
+    
+    def latest(self, suburb: str) -> Optional[Dict[str, Any]]:
+        """
+        Latest metrics for one suburb as a dict, or None if the suburb is unknown
+        Latest metrics for one suburb
+        """
+        column = self._columns.get(normalize_name(suburb))
+        if column is None:
+            return None
+        latest = self.latest_metrics()
+        metrics = {field: float(latest[field][column]) for field in METRIC_FIELDS}
+        return {field: (None if value != value else value) for field, value in metrics.items()}
+    
+    def save(self, path: str) -> None:
+        """
+        Writes the store to a directory (prices.npy plus index.json)
+        The index is written last, so readers never see suburbs without a price column
+        """
+        os.makedirs(path, exist_ok=True)
+        prices_path = os.path.join(path, "prices.npy")
+        index_path = os.path.join(path, "index.json")
+        np.save(f"{prices_path}.tmp.npy", self.prices, allow_pickle=False)
+        os.replace(f"{prices_path}.tmp.npy", prices_path)
+        with open(f"{index_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"start_month": self.start_month, "suburbs": self.suburbs}, f)
+        os.replace(f"{index_path}.tmp", index_path)
+    
+    @classmethod
+    def load(cls, path: str) -> "MarketSeriesStore":
+        with open(os.path.join(path, "index.json"), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        prices = np.load(os.path.join(path, "prices.npy"), allow_pickle=False)
+        return cls(index["start_month"], index["suburbs"], prices[:, :len(index["suburbs"])])
+
+_market_store: Optional[MarketSeriesStore] = None
+_market_store_source: Optional[Tuple[str, tuple]] = None
+
+def _file_identity(path: str) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def get_market_store() -> Optional[MarketSeriesStore]:
+    """
+    Returns the process-wide market store, or None if none has been ingested
+    Picks up a created or replaced file automatically; a missing file is not cached
+    """
+    global _market_store, _market_store_source
+    
+    # index.json is written last on save, so its identity changes whenever the store is replaced
+    path = Settings.MARKET_STORE_PATH
+    index_path = os.path.join(path, "index.json")
+    if not os.path.exists(index_path):
+        _market_store = _market_store_source = None
+        return None
+    
+    source = (path, _file_identity(index_path))
+    if _market_store is None or _market_store_source != source:
+        _market_store = MarketSeriesStore.load(path)
+        _market_store_source = source
+    return _market_store
+
+def read_csv(path: str) -> List[Tuple[str, str, float]]:
+    """
+    Reads (month, suburb, median_price) rows from a CSV with those column names
+    Rows without a price are skipped
+    """
+    records = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            if row.get("median_price"):
+                records.append((row["month"], row["suburb"], float(row["median_price"])))
+    return records
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Append monthly median prices to the market store")
+    parser.add_argument("csv", help="CSV with month (YYYY-MM), suburb and median_price columns")
+    parser.add_argument("--store", default=Settings.MARKET_STORE_PATH, help="Store directory")
+    return parser.parse_args()
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    store = MarketSeriesStore.load(args.store) if os.path.exists(os.path.join(args.store, "index.json")) else MarketSeriesStore()
+    count = store.extend(read_csv(args.csv))
+    store.save(args.store)
+    logger.info(f"Appended {count} prices; {len(store.suburbs)} suburbs up to {month_label(store.latest_month)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Portfolio aggregates
+Running score distributions, exposure and value-weighted growth and yield, updated per holding
+"""
+
+import heapq
+import math
+from typing import Any, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Same labels as the scoring grades (scoring_algorithms.GROWTH_POTENTIAL_GRADES / RISK_LEVELS)
+GROWTH_POTENTIAL_LABELS = ("A+", "A", "B+", "B", "C")
+RISK_LEVEL_LABELS = ("Low", "Medium", "High")
+
+# Overall scores are counted in 10-point buckets; 100 falls into the last one
+SCORE_BUCKET_WIDTH = 10
+SCORE_BUCKETS = 100 // SCORE_BUCKET_WIDTH
+
+EXPOSURE_LEVELS = ("suburb", "sa4")
+
+HOLDING_FIELDS = (
+    "property_id", "suburb", "sa2_code", "sa4_code", "value",
+    "overall_score", "growth_potential", "risk_level", "growth", "rental_yield"
+)
+
+def _known(value: Optional[float]) -> bool:
+    return value is not None and not math.isnan(value)
+
+def _score_bucket(score: float) -> int:
+    return min(max(int(score // SCORE_BUCKET_WIDTH), 0), SCORE_BUCKETS - 1)
+
+class Portfolio:
+    """
+    One portfolio's holdings plus running aggregates over them
+    Adding, removing or rescoring a holding applies only that holding's delta, so summary() does not scan holdings
+    """
+    
+    def __init__(self, portfolio_id: str):
+        self.portfolio_id = portfolio_id
+        # The contribution applied per holding, so removal subtracts exactly what was added
+        self.holdings: Dict[str, Dict[str, Any]] = {}
+        self.version = 0
+        self._reset()
+    
+    def _reset(self) -> None:
+        self.total_value = 0.0
+        self.valued = 0
+        self.score_sum = 0.0
+        self.score_sq_sum = 0.0
+        self.score_histogram = [0] * SCORE_BUCKETS
+        self.growth_potentials = dict.fromkeys(GROWTH_POTENTIAL_LABELS, 0)
+        self.risk_levels = dict.fromkeys(RISK_LEVEL_LABELS, 0)
+        # [holdings, value, holdings with a value] per key
+        self.exposure: Dict[str, Dict[str, List[float]]] = {level: {} for level in EXPOSURE_LEVELS}
+        # Value-weighted sums over the holdings with a known value and metric, with their holding counts
+        self.growth_sum = 0.0
+        self.growth_weight = 0.0
+        self.growth_count = 0
+        self.yield_sum = 0.0
+        self.yield_weight = 0.0
+        self.yield_count = 0
+    
+    def __len__(self) -> int:
+        return len(self.holdings)
+    
+    def _apply(self, holding: Dict[str, Any], sign: int) -> None:
+        value = holding["value"] if _known(holding["value"]) else 0.0
+        score = holding["overall_score"]
+        
+        if value:
+            self.valued += sign
+            # Float sums do not cancel exactly; once nothing contributes they are zeroed
+            self.total_value = self.total_value + sign * value if self.valued else 0.0
+        self.score_sum += sign * score
+        self.score_sq_sum += sign * score * score
+        self.score_histogram[_score_bucket(score)] += sign
+        if holding["growth_potential"] in self.growth_potentials:
+            self.growth_potentials[holding["growth_potential"]] += sign
+        if holding["risk_level"] in self.risk_levels:
+            self.risk_levels[holding["risk_level"]] += sign
+        
+        for level in EXPOSURE_LEVELS:
+            key = holding["sa4_code" if level == "sa4" else level] or "unknown"
+            entry = self.exposure[level].setdefault(key, [0, 0.0, 0])
+            entry[0] += sign
+            if value:
+                entry[2] += sign
+                entry[1] = entry[1] + sign * value if entry[2] else 0.0
+            # Dropping emptied keys keeps the maps bounded and clears float residue
+            if entry[0] == 0:
+                del self.exposure[level][key]
+        
+        if value and _known(holding["growth"]):
+            self.growth_count += sign
+            if self.growth_count:
+                self.growth_sum += sign * value * holding["growth"]
+                self.growth_weight += sign * value
+            else:
+                self.growth_sum = self.growth_weight = 0.0
+        if value and _known(holding["rental_yield"]):
+            self.yield_count += sign
+            if self.yield_count:
+                self.yield_sum += sign * value * holding["rental_yield"]
+                self.yield_weight += sign * value
+            else:
+                self.yield_sum = self.yield_weight = 0.0
+    
+    def upsert(self, holding: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Adds a holding or replaces (rescoring) the one with the same property_id
+        Returns the replaced holding, or None if it was new
+        """
+        holding = {field: holding.get(field) for field in HOLDING_FIELDS}
+        if holding["property_id"] is None or not _known(holding["overall_score"]):
+            raise ValueError("A holding needs a property_id and an overall_score")
+        
+        previous = self.holdings.pop(holding["property_id"], None)
+        if previous is not None:
+            self._apply(previous, -1)
+        self._apply(holding, 1)
+        self.holdings[holding["property_id"]] = holding
+        self.version += 1
+        return previous
+    
+    def remove(self, property_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Removes a holding and its contribution to the aggregates
+        Returns the removed holding, or None if it was not held
+        """
+        holding = self.holdings.pop(property_id, None)
+        if holding is None:
+            return None
+        self._apply(holding, -1)
+        if not self.holdings:
+            self._reset()
+        self.version += 1
+        return holding
+    
+    def rebuild(self) -> None:
+        """
+        Recomputes all aggregates from the holdings
+        Only needed to discard floating point drift after very many updates
+        """
+        self._reset()
+        for holding in self.holdings.values():
+            self._apply(holding, 1)
+        self.version += 1
+    
+    def _exposure(self, level: str, top: int) -> List[Dict[str, Any]]:
+        entries = heapq.nlargest(top, self.exposure[level].items(), key=lambda item: (item[1][1], item[1][0]))
+        return [
+            {
+                "key": key,
+                "holdings": count,
+                "value": value,
+                "share": value / self.total_value if self.valued else None
+            }
+            for key, (count, value, _) in entries
+        ]
+    
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Dashboard view of the portfolio
+        Independent of the number of holdings; exposure is the top entries per level by value
+        """
+        count = len(self.holdings)
+        mean = self.score_sum / count if count else None
+        std = math.sqrt(max(self.score_sq_sum / count - mean * mean, 0.0)) if count else None
+        return {
+            "portfolio_id": self.portfolio_id,
+            "version": self.version,
+            "holdings": count,
+            "total_value": self.total_value,
+            "scores": {
+                "mean": mean,
+                "std": std,
+                "histogram": [
+                    {"from": i * SCORE_BUCKET_WIDTH, "to": (i + 1) * SCORE_BUCKET_WIDTH, "count": bucket}
+                    for i, bucket in enumerate(self.score_histogram)
+                ],
+                "growth_potential": dict(self.growth_potentials),
+                "risk_level": dict(self.risk_levels)
+            },
+            "weighted_growth": self.growth_sum / self.growth_weight if self.growth_count else None,
+            "weighted_yield": self.yield_sum / self.yield_weight if self.yield_count else None,
+            "exposure": {level: self._exposure(level, top) for level in EXPOSURE_LEVELS}
+        }
+
+class PortfolioStore:
+    """
+    In-process portfolios by id
+    Mutated only from the event loop thread, so no locking is needed
+    """
+    
+    def __init__(self):
+        self.portfolios: Dict[str, Portfolio] = {}
+    
+    def get(self, portfolio_id: str) -> Optional[Portfolio]:
+        return self.portfolios.get(portfolio_id)
+    
+    def get_or_create(self, portfolio_id: str) -> Portfolio:
+        portfolio = self.portfolios.get(portfolio_id)
+        if portfolio is None:
+            portfolio = self.portfolios[portfolio_id] = Portfolio(portfolio_id)
+            logger.info(f"Created portfolio {portfolio_id}")
+        return portfolio
+    
+    def delete(self, portfolio_id: str) -> bool:
+        return self.portfolios.pop(portfolio_id, None) is not None
+
+portfolio_store = PortfolioStore()
+
+def get_portfolio_store() -> PortfolioStore:
+    """
+    Returns the process-wide portfolio store
+    Returns the shared portfolio store
+    """
+    return portfolio_store
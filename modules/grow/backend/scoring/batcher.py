@@ -0,0 +1,86 @@
+"""
+Micro-batching for scoring requests
+Coalesces concurrent requests for a short window and scores each distinct property once per window
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+def coalesce_key(request: Any) -> Tuple[str, str, str]:
+    """
+    Requests with the same key get the same score
+    Requests with the same key get the same score
+    """
+    return (request.suburb, request.postcode, request.property_type)
+
+class MicroBatcher:
+    """
+    Collects requests arriving within `window` seconds and scores them with one vectorized call
+    Duplicates (same key) wait on a shared future; a batch is dispatched early once max_batch keys are pending
+    """
+    
+    def __init__(
+        self,
+        score: Callable[[Sequence[Any]], List[Any]],
+        window: float = 0.002,
+        max_batch: int = 500,
+        key: Callable[[Any], Hashable] = coalesce_key
+    ):
+        self.score = score
+        self.window = window
+        self.max_batch = max_batch
+        self.key = key
+        self._pending: Dict[Hashable, Tuple[Any, asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.stats = {"requests": 0, "scored": 0, "batches": 0}
+    
+    async def submit(self, request: Any) -> Any:
+        """
+        Scores one request as part of the current window
+        Cancelling the caller does not cancel the shared result for other waiters
+        """
+        self.stats["requests"] += 1
+        key = self.key(request)
+        entry = self._pending.get(key)
+        if entry is None:
+            loop = asyncio.get_running_loop()
+            entry = (request, loop.create_future())
+            self._pending[key] = entry
+            if len(self._pending) >= self.max_batch:
+                self.flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self.flush)
+        return await asyncio.shield(entry[1])
+    
+    def flush(self) -> None:
+        """
+        Scores all pending requests now and resolves their futures
+        A scoring error, or a result count that does not match the batch, is raised in every waiting request
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        
+        entries = list(pending.values())
+        try:
+            results = list(self.score([request for request, _ in entries]))
+            if len(results) != len(entries):
+                raise RuntimeError(f"Batch scoring returned {len(results)} results for {len(entries)} requests")
+        except Exception as e:
+            logger.error(f"Error scoring batch of {len(entries)} requests: {str(e)}")
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        self.stats["scored"] += len(entries)
+        self.stats["batches"] += 1
+        for (_, future), result in zip(entries, results):
+            if not future.done():
+                future.set_result(result)
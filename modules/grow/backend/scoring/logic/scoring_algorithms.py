@@ -3,9 +3,22 @@ Scoring algorithms for property evaluation
 Scoring algorithms for property evaluation
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional, Sequence
 import numpy as np
 
+from .weights import get_weight_profile
+
+# Fixed component order used by the scalar and the batch scoring paths
+COMPONENTS = ("location", "infrastructure", "market_trends", "rental_yield")
+
+# Scores used when no precomputed infrastructure score or growth/volatility inputs are available
+INFRASTRUCTURE_FALLBACK = 85.0
+MARKET_TRENDS_FALLBACK = 80.0
+
+# Lower score bounds for growth potential grades and risk levels (best first)
+GROWTH_POTENTIAL_GRADES = (("A+", 85.0), ("A", 75.0), ("B+", 65.0), ("B", 55.0), ("C", 0.0))
+RISK_LEVELS = (("Low", 75.0), ("Medium", 55.0), ("High", 0.0))
+
 def calculate_location_score(property_data: Dict[str, Any]) -> float:
     """
     Calculates the location score based on various factors
@@ -27,18 +40,27 @@ def calculate_location_score(property_data: Dict[str, Any]) -> float:
 def calculate_infrastructure_score(property_data: Dict[str, Any]) -> float:
     """
     Evaluates infrastructure quality
-    Evaluates infrastructure quality
+    Uses the precomputed POI accessibility score of the property's SA2 (see backend/spatial/poi_grid.py)
     """
-    # TODO: Implement infrastructure evaluation
-    return 85.0
+    score = property_data.get("infrastructure_score")
+    if score is None or score != score:
+        # Properties outside the POI table get a constant score
+        return INFRASTRUCTURE_FALLBACK
+    
+    return float(score)
 
 def calculate_market_trends_score(property_data: Dict[str, Any]) -> float:
     """
     Analyzes market trends for the region
-    Analyzes market trends for the region
+    Rewards 1-year price growth and penalizes annualized volatility (see backend/data/market_store.py)
     """
-    # TODO: Implement market trend analysis
-    return 80.0
+    growth = property_data.get("price_growth_1y")
+    volatility = property_data.get("volatility")
+    if growth is None or volatility is None or growth != growth or volatility != volatility:
+        # Suburbs without a price series get a constant score
+        return MARKET_TRENDS_FALLBACK
+    
+    return min(100.0, max(0.0, 60.0 + 200.0 * growth - 100.0 * volatility))
 
 def calculate_rental_yield_score(property_data: Dict[str, Any]) -> float:
     """
@@ -61,16 +83,149 @@ def calculate_overall_score(property_data: Dict[str, Any]) -> Dict[str, Any]:
     }
     
     # Weighted average calculation
-    weights = {
-        "location": 0.3,
-        "infrastructure": 0.25,
-        "market_trends": 0.25,
-        "rental_yield": 0.2
-    }
+    weights = get_weight_profile("overall")
     
-    overall_score = sum(scores[key] * weights[key] for key in scores)
+    overall_score = weights.dot([scores[key] for key in weights.factors])
     
     return {
         "overall_score": round(overall_score, 1),
         "component_scores": scores
-    } 
\ No newline at end of file
+    } 
+
+def properties_to_columns(properties: Sequence[Dict[str, Any]], fields: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Converts a list of property dicts into columnar arrays
+    Missing values become None (object columns) so no information is lost
+    """
+    if fields is None:
+        fields = sorted({key for prop in properties for key in prop})
+    
+    columns = {}
+    for field in fields:
+        column = np.empty(len(properties), dtype=object)
+        column[:] = [prop.get(field) for prop in properties]
+        columns[field] = column
+    
+    return columns
+
+def _batch_size(property_columns: Mapping[str, Any], n: Optional[int]) -> int:
+    """
+    Determines the number of properties in a columnar batch
+    Determines the number of properties in a batch
+    """
+    if n is not None:
+        return n
+    
+    lengths = {len(column) for column in property_columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+    if not lengths:
+        raise ValueError("Batch size cannot be inferred from an empty column mapping")
+    
+    return lengths.pop()
+
+def calculate_location_score_batch(property_columns: Mapping[str, Any], n: Optional[int] = None) -> np.ndarray:
+    """
+    Vectorized counterpart of calculate_location_score
+    Calculates location scores for a whole batch
+    """
+    size = _batch_size(property_columns, n)
+    
+    # Same constant location score as calculate_location_score; keep the two in sync
+    base_score = 70.0
+    factors = np.array([0.1, 0.1, 0.1, 0.1])
+    
+    score = min(100.0, base_score + factors.sum() * 100)
+    return np.full(size, score, dtype=np.float64)
+
+def _float_column(property_columns: Mapping[str, Any], field: str, size: int) -> np.ndarray:
+    """
+    Returns a column as float64 with NaN for missing values
+    Accepts object columns with None as well as numeric arrays
+    """
+    column = property_columns.get(field)
+    if column is None:
+        return np.full(size, np.nan)
+    column = np.asarray(column)
+    if column.dtype == object:
+        return np.array([np.nan if value is None else value for value in column.tolist()], dtype=np.float64)
+    return column.astype(np.float64, copy=False)
+
+def calculate_infrastructure_score_batch(property_columns: Mapping[str, Any], n: Optional[int] = None) -> np.ndarray:
+    """
+    Vectorized counterpart of calculate_infrastructure_score
+    Evaluates infrastructure quality for a whole batch
+    """
+    size = _batch_size(property_columns, n)
+    scores = _float_column(property_columns, "infrastructure_score", size)
+    return np.where(np.isnan(scores), INFRASTRUCTURE_FALLBACK, scores)
+
+def calculate_market_trends_score_batch(property_columns: Mapping[str, Any], n: Optional[int] = None) -> np.ndarray:
+    """
+    Vectorized counterpart of calculate_market_trends_score
+    Analyzes market trends for a whole batch
+    """
+    size = _batch_size(property_columns, n)
+    growth = _float_column(property_columns, "price_growth_1y", size)
+    volatility = _float_column(property_columns, "volatility", size)
+    
+    scores = np.full(size, MARKET_TRENDS_FALLBACK, dtype=np.float64)
+    known = ~(np.isnan(growth) | np.isnan(volatility))
+    scores[known] = np.clip(60.0 + 200.0 * growth[known] - 100.0 * volatility[known], 0.0, 100.0)
+    return scores
+
+def calculate_rental_yield_score_batch(property_columns: Mapping[str, Any], n: Optional[int] = None) -> np.ndarray:
+    """
+    Vectorized counterpart of calculate_rental_yield_score
+    Calculates rental yield scores for a whole batch
+    """
+    # Same constant rental yield score as calculate_rental_yield_score
+    return np.full(_batch_size(property_columns, n), 75.0, dtype=np.float64)
+
+def calculate_overall_score_batch(property_columns: Mapping[str, Any], n: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Calculates overall scores for N properties given as columns
+    Returns the same numbers as calculate_overall_score, one array entry per property
+    """
+    size = _batch_size(property_columns, n)
+    
+    scores = {
+        "location": calculate_location_score_batch(property_columns, size),
+        "infrastructure": calculate_infrastructure_score_batch(property_columns, size),
+        "market_trends": calculate_market_trends_score_batch(property_columns, size),
+        "rental_yield": calculate_rental_yield_score_batch(property_columns, size)
+    }
+    
+    # Same accumulation order as the scalar path so results are bit-identical
+    weights = get_weight_profile("overall")
+    overall_score = weights.dot_columns([scores[key] for key in weights.factors])
+    
+    return {
+        "overall_score": np.round(overall_score, 1),
+        "component_scores": scores
+    }
+
+def _classify_batch(overall_scores: np.ndarray, grades: Sequence[tuple]) -> np.ndarray:
+    """
+    Maps overall scores onto labels using descending lower bounds
+    Maps scores onto labels
+    """
+    labels = np.array([label for label, _ in grades], dtype=object)
+    # Bounds ascending for searchsorted; index 0 is the worst label
+    bounds = np.array([bound for _, bound in grades][::-1])
+    index = np.searchsorted(bounds, np.asarray(overall_scores, dtype=np.float64), side="right") - 1
+    return labels[::-1][np.clip(index, 0, len(labels) - 1)]
+
+def classify_growth_potential_batch(overall_scores: np.ndarray) -> np.ndarray:
+    """
+    Derives growth potential grades (A+ .. C) from overall scores
+    Derives growth potential grades from overall scores
+    """
+    return _classify_batch(overall_scores, GROWTH_POTENTIAL_GRADES)
+
+def classify_risk_level_batch(overall_scores: np.ndarray) -> np.ndarray:
+    """
+    Derives risk levels (Low, Medium, High) from overall scores
+    Derives risk levels from overall scores
+    """
+    return _classify_batch(overall_scores, RISK_LEVELS)
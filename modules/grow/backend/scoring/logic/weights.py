@@ -1,60 +1,273 @@
 """
 Weighting logic for the scoring system
-Weighting logic for the scoring system
+Named weight profiles compiled once into normalized, fixed-order vectors
 """
 
-from typing import Dict, Any
+import hashlib
+import json
+import os
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+import logging
 
-def get_scoring_weights(property_type: str = "residential") -> Dict[str, float]:
-    """
-    Returns weights for different scoring criteria
-    Returns weights for different scoring criteria
-    """
-    base_weights = {
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Allowed deviation from 1.0 before a profile is rejected; accepted profiles are renormalized
+WEIGHT_SUM_TOLERANCE = 1e-6
+
+# Built-in profiles; a profile file may override them (same factors) or add new keys
+DEFAULT_WEIGHT_PROFILES: Dict[str, Dict[str, float]] = {
+    "overall": {
         "location": 0.3,
         "infrastructure": 0.25,
         "market_trends": 0.25,
         "rental_yield": 0.2
+    },
+    "scoring.residential": {
+        "location": 0.3,
+        "infrastructure": 0.25,
+        "market_trends": 0.25,
+        "rental_yield": 0.2
+    },
+    "scoring.commercial": {
+        "location": 0.35,
+        "infrastructure": 0.3,
+        "market_trends": 0.25,
+        "rental_yield": 0.1
+    },
+    "scoring.industrial": {
+        "location": 0.4,
+        "infrastructure": 0.35,
+        "market_trends": 0.2,
+        "rental_yield": 0.05
+    },
+    "infrastructure": {
+        "schools": 0.3,
+        "transport": 0.3,
+        "hospitals": 0.2,
+        "shops": 0.2
+    },
+    "risk": {
+        "market_volatility": 0.3,
+        "location_risk": 0.25,
+        "property_condition": 0.2,
+        "economic_factors": 0.25
+    },
+    "growth": {
+        "population_growth": 0.25,
+        "infrastructure_development": 0.3,
+        "economic_growth": 0.25,
+        "market_demand": 0.2
     }
+}
+
+class WeightProfile:
+    """
+    A validated weight profile with a fixed factor order
+    The vector is read-only and sums to 1; mapping is a read-only view for dict-style callers
+    """
+    
+    __slots__ = ("key", "factors", "vector", "weights", "mapping")
+    
+    def __init__(self, key: str, weights: Mapping[str, float], factors: Optional[Sequence[str]] = None):
+        factors = tuple(factors or weights)
+        if set(factors) != set(weights):
+            raise ValueError(f"Weight profile {key!r} must define exactly {sorted(factors)}")
+        
+        vector = np.array([float(weights[factor]) for factor in factors], dtype=np.float64)
+        if not np.all(np.isfinite(vector)) or np.any(vector < 0):
+            raise ValueError(f"Weights of profile {key!r} must be finite and non-negative")
+        total = float(vector.sum())
+        if abs(total - 1.0) > WEIGHT_SUM_TOLERANCE:
+            raise ValueError(f"Weights of profile {key!r} sum to {total}, expected 1")
+        if total != 1.0:
+            vector = vector / total
+        vector.flags.writeable = False
+        
+        self.key = key
+        self.factors = factors
+        self.vector = vector
+        self.weights = tuple(vector.tolist())
+        self.mapping = MappingProxyType(dict(zip(factors, self.weights)))
+    
+    def dot(self, values: Sequence[float]) -> float:
+        """
+        Weighted sum of values given in factor order
+        Accumulates left to right so the result matches dot_columns bit for bit
+        """
+        total = 0.0
+        for value, weight in zip(values, self.weights):
+            total += value * weight
+        return total
     
-    # Adjustment based on property type
-    if property_type == "commercial":
-        base_weights.update({
-            "location": 0.35,
-            "infrastructure": 0.3,
-            "market_trends": 0.25,
-            "rental_yield": 0.1
-        })
-    elif property_type == "industrial":
-        base_weights.update({
-            "location": 0.4,
-            "infrastructure": 0.35,
-            "market_trends": 0.2,
-            "rental_yield": 0.05
-        })
-    
-    return base_weights
+    def dot_columns(self, columns: Sequence[np.ndarray]) -> np.ndarray:
+        """
+        Weighted sum of equally long columns given in factor order
+        Weighted sum of columns
+        """
+        total = np.zeros(len(columns[0]), dtype=np.float64)
+        for column, weight in zip(columns, self.weights):
+            total += column * weight
+        return total
 
-def get_risk_weights() -> Dict[str, float]:
+def compile_profiles(
+    profiles: Mapping[str, Mapping[str, float]],
+    defaults: Optional[Mapping[str, Mapping[str, float]]] = None
+) -> Dict[str, WeightProfile]:
     """
-    Weights for risk assessment
-    Weights for risk assessment
+    Compiles raw profiles, keeping the factor order of matching default profiles
+    Raises ValueError if any profile is invalid
     """
+    defaults = defaults or {}
     return {
-        "market_volatility": 0.3,
-        "location_risk": 0.25,
-        "property_condition": 0.2,
-        "economic_factors": 0.25
+        key: WeightProfile(key, weights, factors=defaults.get(key))
+        for key, weights in profiles.items()
     }
 
+def profiles_version(profiles: Mapping[str, WeightProfile]) -> str:
+    """
+    Stable digest of compiled profiles: keys, factor order and weights
+    Equal across processes for equal profiles, so it can be stored next to precomputed scores
+    """
+    payload = json.dumps(
+        {key: [profile.factors, profile.weights] for key, profile in profiles.items()}, sort_keys=True
+    ).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+class WeightRegistry:
+    """
+    Registry of compiled weight profiles, optionally hot-reloaded from a JSON file
+    The file maps profile keys to {factor: weight}; it is checked at most once per check_interval
+    """
+    
+    def __init__(
+        self,
+        defaults: Optional[Mapping[str, Mapping[str, float]]] = None,
+        path: Optional[str] = None,
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.defaults = dict(defaults or DEFAULT_WEIGHT_PROFILES)
+        self.check_interval = check_interval
+        self.clock = clock
+        self.path: Optional[str] = None
+        self._profiles = compile_profiles(self.defaults, self.defaults)
+        self._version = profiles_version(self._profiles)
+        self._identity: Optional[Tuple[int, int, int]] = None
+        self._next_check = 0.0
+        if path:
+            self.load(path)
+    
+    def load(self, path: Optional[str]) -> None:
+        """
+        Watches a profile file; a missing file means the built-in profiles apply
+        Watches a profile file
+        """
+        self.path = path
+        self._identity = None
+        self._next_check = 0.0
+        self.reload_if_changed()
+    
+    def _file_identity(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            stat = os.stat(self.path)
+        except (OSError, TypeError):
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Recompiles all profiles if the file was created, replaced or removed
+        An invalid file is logged and the previous profiles stay active
+        """
+        self._next_check = self.clock() + self.check_interval
+        identity = self._file_identity()
+        if identity == self._identity:
+            return False
+        
+        raw: Dict[str, Any] = dict(self.defaults)
+        if identity is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    raw.update(json.load(f))
+                profiles = compile_profiles(raw, self.defaults)
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                logger.error(f"Ignoring invalid weight profiles in {self.path}: {str(e)}")
+                self._identity = identity
+                return False
+        else:
+            profiles = compile_profiles(raw, self.defaults)
+        
+        self._profiles = profiles
+        self._version = profiles_version(profiles)
+        self._identity = identity
+        logger.info(f"Loaded {len(profiles)} weight profiles" + (f" from {self.path}" if identity else ""))
+        return True
+    
+    def _check(self) -> None:
+        if self.path is not None and self.clock() >= self._next_check:
+            self.reload_if_changed()
+    
+    def get(self, key: str) -> WeightProfile:
+        """
+        Returns the compiled profile for a key
+        Raises KeyError for unknown keys
+        """
+        self._check()
+        return self._profiles[key]
+    
+    @property
+    def version(self) -> str:
+        """
+        Digest of the active profiles (see profiles_version)
+        Changes whenever a reload changes any weight, factor or profile key
+        """
+        self._check()
+        return self._version
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._profiles
+    
+    def keys(self):
+        return self._profiles.keys()
+
+_registry = WeightRegistry()
+
+def get_weight_registry() -> WeightRegistry:
+    """
+    Returns the process-wide weight registry
+    Returns the shared weight registry
+    """
+    return _registry
+
+def get_weight_profile(key: str) -> WeightProfile:
+    """
+    Returns a compiled weight profile from the process-wide registry
+    Returns a compiled weight profile
+    """
+    return _registry.get(key)
+
+def get_scoring_weights(property_type: str = "residential") -> Dict[str, float]:
+    """
+    Returns weights for different scoring criteria
+    Unknown property types use the residential weights; the dict is a fresh copy callers may modify
+    """
+    key = f"scoring.{property_type}"
+    return dict(get_weight_profile(key if key in _registry else "scoring.residential").mapping)
+
+def get_risk_weights() -> Dict[str, float]:
+    """
+    Weights for risk assessment
+    Returns a fresh copy of the "risk" profile's weights
+    """
+    return dict(get_weight_profile("risk").mapping)
+
 def get_growth_weights() -> Dict[str, float]:
     """
     Weights for growth assessment
-    Weights for growth assessment
+    Returns a fresh copy of the "growth" profile's weights
     """
-    return {
-        "population_growth": 0.25,
-        "infrastructure_development": 0.3,
-        "economic_growth": 0.25,
-        "market_demand": 0.2
-    } 
\ No newline at end of file
+    return dict(get_weight_profile("growth").mapping)
@@ -3,29 +3,208 @@ Main module for the scoring system
 Main module for the scoring system
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Dict, Any
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field, field_validator
+from typing import AsyncIterator, List, Dict, Any, Optional, Sequence
+import asyncio
 import logging
+import os
 
 # Import scoring modules
-from .logic.scoring_algorithms import calculate_overall_score
-from .logic.weights import get_scoring_weights
-from ..shared.models import PropertyData, ScoringResult
+from .logic.scoring_algorithms import (
+    calculate_overall_score_batch,
+    classify_growth_potential_batch,
+    classify_risk_level_batch,
+    properties_to_columns,
+    COMPONENTS
+)
+from .batcher import MicroBatcher
+from .logic.weights import get_scoring_weights, get_weight_registry
+from .ranking import get_sa2_ranker
+from .responses import ScoringResultResponse
+from .score_table import ScoreTable
+from ..data.lookup import get_lookup_index, normalize_postcode
+from ..data.market_store import get_market_store
+from ..portfolio.aggregates import get_portfolio_store
+from ..spatial.catchments import get_catchment_index
+from ..spatial.poi_grid import get_infrastructure_table
+from ..spatial.sa2_index import get_sa2_index
+from ..shared.metrics import MetricsMiddleware, get_metrics, timed
+from ..shared.models import PropertyData, ScoringMetrics, ScoringResult
+from ..shared.profiler import SamplingProfiler
+from ..shared.rate_limit import InMemoryRateLimitBackend, RateLimitMiddleware
+from ..shared.settings import Settings
+from ..strategy.suggest import RULES, generate_short_term_strategy
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="PropBase Scoring API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the lookup index once at startup instead of on the first search
+    get_lookup_index()
+    yield
+
+app = FastAPI(title="PropBase Scoring API", version="1.0.0", lifespan=lifespan)
+
+# Request latency per route; added first so rate-limited requests are not timed
+app.add_middleware(MetricsMiddleware)
+
+# Per-client token buckets; use SharedRateLimitBackend when running several workers.
+# Every HTTP request takes a token, including each request of a coalesced map burst to /api/scoring
+rate_limiter = InMemoryRateLimitBackend()
+if Settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware, backend=rate_limiter, exempt_paths=("/health", "/metrics"))
+
+profiler = SamplingProfiler()
+
+# Weight profiles are picked up from the file without a restart
+get_weight_registry().load(Settings.WEIGHT_PROFILES_PATH)
 
 class ScoringRequest(BaseModel):
     address: str
     suburb: str
     postcode: str
     property_type: str
+    
+    @field_validator("suburb")
+    @classmethod
+    def clean_suburb(cls, value: str) -> str:
+        return " ".join(value.split())
+    
+    @field_validator("postcode")
+    @classmethod
+    def clean_postcode(cls, value: str) -> str:
+        return normalize_postcode(value)
+
+class RankingRequest(BaseModel):
+    weights: Dict[str, float]
+    k: int = 50
+    state: Optional[str] = None
+
+class CatchmentPoint(BaseModel):
+    lon: float
+    lat: float
+
+class CatchmentLookupRequest(BaseModel):
+    points: List[CatchmentPoint]
+
+class HoldingRequest(ScoringRequest):
+    property_id: str
+    current_price: Optional[float] = Field(None, ge=0)
+    previous_price: Optional[float] = Field(None, gt=0)
+    price_growth_1y: Optional[float] = None
+    rental_yield: Optional[float] = None
+    # Scored on upsert when not given
+    overall_score: Optional[float] = Field(None, ge=0, le=100)
+
+def resolve_sa2_codes(suburbs: List[str]) -> List[Optional[str]]:
+    """
+    Resolves suburb names to SA2 codes by exact name match
+    Unmatched suburbs map to None
+    """
+    lookup = get_lookup_index()
+    return [
+        next((entry["sa2_code"] for entry in lookup.by_name(suburb) if entry["kind"] == "sa2"), None)
+        for suburb in suburbs
+    ]
+
+@timed("compute")
+def score_requests(requests: List[ScoringRequest]) -> List[ScoringResult]:
+    """
+    Scores a list of requests in one vectorized pass
+    Scores a list of requests in one vectorized pass
+    """
+    columns = properties_to_columns(
+        [request.model_dump() for request in requests],
+        fields=list(ScoringRequest.model_fields)
+    )
+    
+    # Latest growth and volatility per suburb; history is not recomputed per request
+    market_store = get_market_store()
+    if market_store is not None:
+        columns.update(market_store.latest_columns([request.suburb for request in requests]))
+    
+    # Precomputed POI accessibility of the suburb's SA2, so scoring is a table lookup
+    infrastructure_table = get_infrastructure_table()
+    if infrastructure_table is not None:
+        codes = resolve_sa2_codes([request.suburb for request in requests])
+        columns["infrastructure_score"] = infrastructure_table.scores(codes)
+    
+    batch = calculate_overall_score_batch(columns, n=len(requests))
+    
+    overall_scores = batch["overall_score"].tolist()
+    growth_potentials = classify_growth_potential_batch(batch["overall_score"])
+    risk_levels = classify_risk_level_batch(batch["overall_score"])
+    components = {key: batch["component_scores"][key].tolist() for key in COMPONENTS}
+    recommendations = RULES["short_term"].recommend_batch(batch["overall_score"])
+    
+    results = []
+    for i, overall_score in enumerate(overall_scores):
+        results.append(make_scoring_result(
+            overall_score,
+            growth_potentials[i],
+            risk_levels[i],
+            {key: components[key][i] for key in COMPONENTS},
+            recommendations[i]
+        ))
+    
+    return results
 
-@app.post("/api/scoring", response_model=ScoringResult)
+def make_scoring_result(
+    overall_score: float,
+    growth_potential: str,
+    risk_level: str,
+    component_scores: Dict[str, float],
+    recommendations: Optional[Sequence[str]] = None
+) -> ScoringResult:
+    """
+    Builds a ScoringResult from computed or stored scores
+    Short-term recommendations are derived from the overall score unless precomputed for a batch
+    """
+    if recommendations is None:
+        recommendations = generate_short_term_strategy({"overall_score": overall_score})
+    return ScoringResult(
+        overall_score=overall_score,
+        growth_potential=growth_potential,
+        risk_level=risk_level,
+        metrics=ScoringMetrics(**component_scores),
+        recommendations=list(recommendations)
+    )
+
+_score_table: Optional[ScoreTable] = None
+
+def get_score_table() -> Optional[ScoreTable]:
+    """
+    Returns the memory-mapped score table, or None if it has not been built
+    Picks up a rebuilt or refreshed table file automatically
+    """
+    global _score_table
+    
+    if _score_table is not None and _score_table.path == Settings.SCORE_TABLE_PATH:
+        if os.path.exists(_score_table.path):
+            _score_table.reload_if_changed()
+            return _score_table
+    
+    if not os.path.exists(Settings.SCORE_TABLE_PATH):
+        _score_table = None
+        return None
+    
+    _score_table = ScoreTable(Settings.SCORE_TABLE_PATH)
+    return _score_table
+
+# Concurrent single-property requests are scored together, once per distinct property.
+# Coalescing happens after rate limiting, so a burst still counts per request against the client's bucket
+scoring_batcher = MicroBatcher(
+    score_requests,
+    window=Settings.SCORING_COALESCE_WINDOW_MS / 1000.0,
+    max_batch=Settings.SCORING_BATCH_CHUNK_SIZE
+)
+
+@app.post("/api/scoring", response_model=ScoringResult, response_class=ScoringResultResponse)
 async def score_property(request: ScoringRequest):
     """
     Evaluates a property based on various criteria
@@ -33,33 +212,255 @@ async def score_property(request: ScoringRequest):
     """
     try:
         # TODO: Implement complete scoring logic
-        logger.info(f"Scoring request for: {request.address}")
+        logger.debug("Scoring request for: %s", request.address)
         
-        # Placeholder scoring result
-        result = ScoringResult(
-            overall_score=85,
-            growth_potential="A+",
-            risk_level="Low",
-            metrics={
-                "location": 90,
-                "infrastructure": 85,
-                "market_trends": 80,
-                "rental_yield": 75
-            },
-            recommendations=[
-                "Good location with growth potential",
-                "Stable infrastructure",
-                "Positive market trends"
-            ]
-        )
+        # Returning the response directly skips re-validating the result
+        return ScoringResultResponse(await scoring_batcher.submit(request))
+    
+    except Exception as e:
+        logger.error(f"Error in scoring: {str(e)}")
+        raise HTTPException(status_code=500, detail="Scoring failed")
+
+async def stream_scoring_results(requests: List[ScoringRequest], chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Scores requests chunk by chunk and yields NDJSON lines
+    Yields one encoded chunk of newline-delimited results per scored chunk
+    """
+    for start in range(0, len(requests), chunk_size):
+        chunk = requests[start:start + chunk_size]
+        try:
+            results = score_requests(chunk)
+        except Exception as e:
+            # Headers are already sent, so report the failure in-band and stop
+            logger.error(f"Error in batch scoring at offset {start}: {str(e)}")
+            yield b'{"error": "Scoring failed", "offset": %d}\n' % start
+            return
         
-        return result
+        yield "".join(result.model_dump_json() + "\n" for result in results).encode("utf-8")
         
+        # Give other requests a chance to run between chunks
+        await asyncio.sleep(0)
+
+@app.post("/api/scoring/batch")
+async def score_properties_batch(requests: List[ScoringRequest]):
+    """
+    Streams ScoringResult rows for many properties as newline-delimited JSON, in request order
+    The body is parsed and validated in full first, so input memory grows up to SCORING_BATCH_MAX_SIZE; only scoring and output are chunked
+    """
+    if len(requests) > Settings.SCORING_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(requests)} > {Settings.SCORING_BATCH_MAX_SIZE}"
+        )
+    
+    logger.info("Batch scoring request for %d properties", len(requests))
+    
+    return StreamingResponse(
+        stream_scoring_results(requests, Settings.SCORING_BATCH_CHUNK_SIZE),
+        media_type="application/x-ndjson"
+    )
+
+@app.get("/api/scoring/suburbs/{key}", response_model=ScoringResult, response_class=ScoringResultResponse)
+async def get_suburb_score(key: str):
+    """
+    Returns the precomputed score for a suburb (SA2 code or postcode)
+    Looks the suburb up in the materialized score table
+    """
+    table = get_score_table()
+    if table is None:
+        raise HTTPException(status_code=503, detail="Score table not available")
+    
+    row = table.get(key)
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"No precomputed score for {key}")
+    
+    return ScoringResultResponse(
+        make_scoring_result(row["overall_score"], row["growth_potential"], row["risk_level"], row["component_scores"])
+    )
+
+@app.post("/api/scoring/rank")
+async def rank_suburbs(request: RankingRequest):
+    """
+    Ranks all SA2 regions for user-defined strategy weights
+    Returns only the top k regions, best first
+    """
+    if not 1 <= request.k <= Settings.RANKING_MAX_K:
+        raise HTTPException(status_code=400, detail=f"k must be between 1 and {Settings.RANKING_MAX_K}")
+    
+    ranker = get_sa2_ranker()
+    if ranker is None:
+        raise HTTPException(status_code=503, detail="SA2 factor data not available")
+    
+    try:
+        return ranker.rank(request.weights, request.k, request.state)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/locations/search")
+async def search_locations(q: str = Query(min_length=1), limit: int = Query(10, ge=1, le=50)):
+    """
+    Autocomplete search over postcodes, suburbs and SA2 names
+    Matches are case- and diacritic-insensitive, by prefix or trigram similarity
+    """
+    return get_lookup_index().search(q, limit)
+
+@app.get("/api/locations/postcodes/{postcode}")
+async def get_postcode(postcode: str):
+    """
+    Returns the suburbs for an exact postcode
+    Returns the suburbs for a postcode
+    """
+    results = get_lookup_index().by_postcode(postcode)
+    if not results:
+        raise HTTPException(status_code=404, detail=f"Unknown postcode {postcode}")
+    return results
+
+@app.get("/api/catchments")
+async def get_catchments(lon: float = Query(ge=-180, le=180), lat: float = Query(ge=-90, le=90)):
+    """
+    Returns the school catchments containing a point
+    Returns the school catchments containing a point
+    """
+    index = get_catchment_index()
+    if index is None:
+        raise HTTPException(status_code=503, detail="School catchments not available")
+    return index.containing([lon], [lat])[0]
+
+@app.post("/api/catchments/lookup")
+async def lookup_catchments(request: CatchmentLookupRequest):
+    """
+    Returns the school catchments containing each point, in request order
+    All points are resolved in one batch query
+    """
+    index = get_catchment_index()
+    if index is None:
+        raise HTTPException(status_code=503, detail="School catchments not available")
+    if len(request.points) > Settings.SCORING_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(request.points)} > {Settings.SCORING_BATCH_MAX_SIZE}"
+        )
+    
+    return index.containing([point.lon for point in request.points], [point.lat for point in request.points])
+
+async def make_holdings(requests: List[HoldingRequest], chunk_size: int) -> List[Dict[str, Any]]:
+    """
+    Builds portfolio holdings from requests, scoring those without an overall score chunk by chunk
+    SA2 and SA4 codes come from the suburb name
+    """
+    overall_scores = [request.overall_score for request in requests]
+    unscored = [i for i, score in enumerate(overall_scores) if score is None]
+    for start in range(0, len(unscored), chunk_size):
+        chunk = unscored[start:start + chunk_size]
+        for i, result in zip(chunk, score_requests([requests[i] for i in chunk])):
+            overall_scores[i] = result.overall_score
+        
+        # Give other requests a chance to run between chunks
+        await asyncio.sleep(0)
+    growth_potentials = classify_growth_potential_batch(overall_scores)
+    risk_levels = classify_risk_level_batch(overall_scores)
+    
+    sa2_codes = resolve_sa2_codes([request.suburb for request in requests])
+    sa2_index = get_sa2_index() if any(sa2_codes) else None
+    
+    holdings = []
+    for i, (request, sa2_code) in enumerate(zip(requests, sa2_codes)):
+        position = sa2_index.position(sa2_code) if sa2_code else None
+        growth = request.price_growth_1y
+        if growth is None and request.current_price is not None and request.previous_price:
+            growth = request.current_price / request.previous_price - 1.0
+        holdings.append({
+            "property_id": request.property_id,
+            "suburb": request.suburb,
+            "sa2_code": sa2_code,
+            "sa4_code": str(sa2_index.sa4_codes[position]) if position is not None else None,
+            "value": request.current_price,
+            "overall_score": overall_scores[i],
+            "growth_potential": growth_potentials[i],
+            "risk_level": risk_levels[i],
+            "growth": growth,
+            "rental_yield": request.rental_yield
+        })
+    return holdings
+
+@app.put("/api/portfolios/{portfolio_id}/holdings")
+async def upsert_holdings(portfolio_id: str, requests: List[HoldingRequest], top: int = Query(10, ge=1, le=100)):
+    """
+    Adds holdings to a portfolio or rescores existing ones, creating the portfolio if needed
+    Only the changed holdings are applied to the running aggregates
+    """
+    if len(requests) > Settings.SCORING_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(requests)} > {Settings.SCORING_BATCH_MAX_SIZE}"
+        )
+    
+    try:
+        holdings = await make_holdings(requests, Settings.SCORING_BATCH_CHUNK_SIZE)
     except Exception as e:
-        logger.error(f"Error in scoring: {str(e)}")
+        logger.error(f"Error in portfolio scoring: {str(e)}")
         raise HTTPException(status_code=500, detail="Scoring failed")
+    
+    portfolio = get_portfolio_store().get_or_create(portfolio_id)
+    for holding in holdings:
+        portfolio.upsert(holding)
+    return portfolio.summary(top)
+
+@app.delete("/api/portfolios/{portfolio_id}/holdings/{property_id}")
+async def remove_holding(portfolio_id: str, property_id: str, top: int = Query(10, ge=1, le=100)):
+    """
+    Removes a holding from a portfolio
+    Returns the updated portfolio summary
+    """
+    portfolio = get_portfolio_store().get(portfolio_id)
+    if portfolio is None or portfolio.remove(property_id) is None:
+        raise HTTPException(status_code=404, detail=f"No holding {property_id} in portfolio {portfolio_id}")
+    return portfolio.summary(top)
+
+@app.get("/api/portfolios/{portfolio_id}")
+async def get_portfolio(portfolio_id: str, top: int = Query(10, ge=1, le=100)):
+    """
+    Returns the portfolio dashboard: score distribution, exposure per suburb and SA4, weighted growth and yield
+    Read from running aggregates, so the cost does not grow with the number of holdings
+    """
+    portfolio = get_portfolio_store().get(portfolio_id)
+    if portfolio is None:
+        raise HTTPException(status_code=404, detail=f"Portfolio {portfolio_id} not found")
+    return portfolio.summary(top)
+
+@app.get("/metrics")
+async def read_metrics(format: str = Query("prometheus", pattern="^(prometheus|json)$")):
+    """
+    Per-stage latency histograms and counters
+    Prometheus text format by default, or JSON with p50/p99 per stage
+    """
+    registry = get_metrics()
+    # The batcher keeps its own counters; copy them in at read time
+    for name, value in scoring_batcher.stats.items():
+        registry.counters[f"scoring_batch_{name}"] = value
+    
+    if format == "json":
+        return registry.snapshot()
+    return PlainTextResponse(registry.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.post("/debug/profile")
+async def run_profiler(seconds: float = Query(10.0, gt=0), interval_ms: float = Query(5.0, ge=1, le=1000)):
+    """
+    Samples all thread stacks for a time window and returns them folded for flame graphs
+    Only available with PROFILER_ENABLED; sampling runs in a worker thread while requests keep being served
+    """
+    if not Settings.PROFILER_ENABLED:
+        raise HTTPException(status_code=404, detail="Profiler is disabled")
+    if seconds > Settings.PROFILER_MAX_SECONDS:
+        raise HTTPException(status_code=400, detail=f"seconds must be at most {Settings.PROFILER_MAX_SECONDS}")
+    
+    try:
+        stacks = await asyncio.to_thread(profiler.run, seconds, interval_ms / 1000.0)
+    except RuntimeError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    return PlainTextResponse(stacks)
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "scoring"} 
\ No newline at end of file
+    return {"status": "healthy", "service": "scoring"}
@@ -0,0 +1,146 @@
+"""
+Strategy-weighted ranking of SA2 regions
+Scores every SA2 region for user-defined strategy weights and selects the top k
+"""
+
+import os
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import logging
+
+import numpy as np
+
+from ..shared.settings import Settings
+from ..spatial.sa2_index import SA2Index, get_sa2_index
+
+logger = logging.getLogger(__name__)
+
+# Same factor names as the strategy preset weights in the frontend (types/index.ts)
+STRATEGY_FACTORS = ("yield", "vacancy", "growth5y", "seifa", "stock", "infra")
+
+class SA2Ranker:
+    """
+    Factor matrix of all SA2 regions aligned with the SA2 index
+    Each factor is a 0-100 score where higher is better (e.g. low vacancy scores high)
+    """
+    
+    def __init__(self, index: SA2Index, factors: np.ndarray):
+        factors = np.ascontiguousarray(factors, dtype=np.float64)
+        if factors.shape != (len(STRATEGY_FACTORS), len(index)):
+            raise ValueError(f"Expected factor matrix of shape {(len(STRATEGY_FACTORS), len(index))}, got {factors.shape}")
+        self.index = index
+        self.factors = factors
+    
+    @classmethod
+    def from_npz(cls, index: SA2Index, path: str) -> "SA2Ranker":
+        """
+        Loads factors from an .npz file with a "codes" array and one array per factor
+        SA2 regions missing from the file, and non-finite values, get the factor's mean over the known values
+        """
+        with np.load(path, allow_pickle=False) as data:
+            codes = data["codes"].astype(str)
+            columns = {factor: data[factor].astype(np.float64) for factor in STRATEGY_FACTORS}
+        
+        rows = np.full(len(codes), -1, dtype=np.int64)
+        for i, code in enumerate(codes.tolist()):
+            position = index.position(code)
+            if position is not None:
+                rows[i] = position
+        known = rows >= 0
+        
+        factors = np.full((len(STRATEGY_FACTORS), len(index)), np.nan)
+        for f, factor in enumerate(STRATEGY_FACTORS):
+            factors[f, rows[known]] = columns[factor][known]
+        
+        # Gaps are counted per factor: a region can be in the file with some factors missing
+        gaps = ~np.isfinite(factors)
+        for f, factor in enumerate(STRATEGY_FACTORS):
+            missing = int(gaps[f].sum())
+            if not missing:
+                continue
+            if missing == len(index):
+                raise ValueError(f"Factor {factor!r} has no finite values in {path}")
+            logger.warning(f"{missing} SA2 regions have no {factor} data in {path}")
+            factors[f, gaps[f]] = factors[f, ~gaps[f]].mean()
+        
+        return cls(index, factors)
+    
+    def weight_vector(self, weights: Mapping[str, float]) -> np.ndarray:
+        """
+        Converts strategy weights into a normalized vector in STRATEGY_FACTORS order
+        Unknown factors or negative weights raise ValueError; missing factors count as 0
+        """
+        unknown = set(weights) - set(STRATEGY_FACTORS)
+        if unknown:
+            raise ValueError(f"Unknown strategy factors: {sorted(unknown)}")
+        
+        vector = np.array([float(weights.get(factor, 0.0)) for factor in STRATEGY_FACTORS])
+        if not np.all(np.isfinite(vector)) or np.any(vector < 0):
+            raise ValueError("Strategy weights must be finite and non-negative")
+        total = vector.sum()
+        if total <= 0:
+            raise ValueError("At least one strategy weight must be positive")
+        return vector / total
+    
+    def score(self, weights: Mapping[str, float]) -> np.ndarray:
+        """
+        Scores every SA2 region in one matrix-vector product
+        Returns 0-100 scores aligned with the SA2 index
+        """
+        return self.weight_vector(weights) @ self.factors
+    
+    def top_k(self, weights: Mapping[str, float], k: int, state: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (index positions, scores) of the k best regions, best first
+        Uses argpartition so only the selected k are sorted
+        """
+        scores = self.score(weights)
+        candidates = None
+        if state:
+            candidates = np.flatnonzero(self.index.states == state)
+            scores = scores[candidates]
+        
+        k = min(k, len(scores))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        
+        selected = np.argpartition(-scores, k - 1)[:k] if k < len(scores) else np.arange(len(scores))
+        # Ties are broken by index position so repeated requests return the same order
+        selected = selected[np.lexsort((selected, -scores[selected]))]
+        
+        positions = candidates[selected] if candidates is not None else selected
+        return positions, scores[selected]
+    
+    def rank(self, weights: Mapping[str, float], k: int, state: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Returns the k best SA2 regions as dicts with score and rank
+        Returns the k best SA2 regions
+        """
+        positions, scores = self.top_k(weights, k, state)
+        results = self.index.records(positions)
+        for rank, (record, score) in enumerate(zip(results, scores.tolist()), start=1):
+            record["score"] = round(score, 1)
+            record["rank"] = rank
+        return results
+
+_ranker: Optional[SA2Ranker] = None
+_ranker_source: Optional[Tuple[str, float]] = None
+
+def get_sa2_ranker() -> Optional[SA2Ranker]:
+    """
+    Returns the process-wide ranker, or None if no SA2 factor file exists
+    Picks up a created or replaced factor file automatically
+    """
+    global _ranker, _ranker_source
+    
+    path = Settings.SA2_FACTORS_PATH
+    if not os.path.exists(path):
+        if _ranker is not None:
+            logger.warning(f"SA2 factor data at {path} was removed")
+        _ranker = _ranker_source = None
+        return None
+    
+    source = (path, os.path.getmtime(path))
+    if _ranker is None or _ranker_source != source:
+        _ranker = SA2Ranker.from_npz(get_sa2_index(), path)
+        _ranker_source = source
+    return _ranker
@@ -0,0 +1,221 @@
+"""
+Nationwide SA2 rescoring job
+Scores all SA2 regions partitioned by SA4 or state across a process pool
+"""
+
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import logging
+
+import numpy as np
+
+from .logic.weights import get_weight_registry
+from .score_table import SCORE_TABLE_DTYPE, encode_key, hash_inputs, score_rows, write_rows
+from ..shared.settings import Settings
+from ..spatial.sa2_index import SA2Index
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COLUMNS = {"sa4": "sa4_codes", "state": "states"}
+
+# (shared memory name, shape, dtype) of an array shared with the workers
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+def _share(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, ArraySpec]:
+    """
+    Copies an array into a new shared memory block
+    The caller owns the block and must unlink it
+    """
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+def _attach(spec: ArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+def numeric_fields(inputs: Mapping[str, Mapping[str, Any]]) -> List[str]:
+    """
+    Returns the input fields that hold numbers in at least one record
+    Only these are placed in shared memory; all fields still count towards the input hash
+    """
+    fields = set()
+    for record in inputs.values():
+        for field, value in record.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                fields.add(field)
+    return sorted(fields)
+
+class PartitionPlan:
+    """
+    SA2 regions ordered so that every partition is a contiguous row range
+    Holds the shared input arrays: encoded keys, input hashes and a float64 field matrix
+    """
+    
+    def __init__(
+        self,
+        index: SA2Index,
+        inputs: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        partition_by: str = "sa4"
+    ):
+        if partition_by not in PARTITION_COLUMNS:
+            raise ValueError(f"partition_by must be one of {sorted(PARTITION_COLUMNS)}")
+        inputs = inputs or {}
+        
+        groups = getattr(index, PARTITION_COLUMNS[partition_by])
+        order = np.lexsort((index.codes, groups))
+        groups = groups[order]
+        codes = index.codes[order].tolist()
+        
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        ends = np.r_[starts[1:], len(codes)]
+        self.partitions = [
+            (str(groups[start]) or "unknown", int(start), int(end)) for start, end in zip(starts, ends)
+        ]
+        
+        self.fields = numeric_fields(inputs)
+        self.keys = np.array([encode_key(code) for code in codes], dtype=SCORE_TABLE_DTYPE["key"])
+        weights_version = get_weight_registry().version
+        self.input_hashes = np.array(
+            [hash_inputs(dict(inputs.get(code, {})), weights_version) for code in codes], dtype=np.uint64
+        )
+        self.values = np.full((len(self.fields), len(codes)), np.nan)
+        for j, code in enumerate(codes):
+            record = inputs.get(code)
+            if not record:
+                continue
+            for i, field in enumerate(self.fields):
+                value = record.get(field)
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    self.values[i, j] = value
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+
+# Per-worker attachments, set by _init_worker
+_worker_blocks: List[shared_memory.SharedMemory] = []
+_worker_arrays: Dict[str, np.ndarray] = {}
+
+def _init_worker(specs: Dict[str, ArraySpec], weights_path: Optional[str]) -> None:
+    # Score with the parent's weight profiles, whose version is already in the input hashes
+    get_weight_registry().load(weights_path)
+    for name, spec in specs.items():
+        block, array = _attach(spec)
+        _worker_blocks.append(block)
+        _worker_arrays[name] = array
+
+def _score_partition(partition: str, start: int, end: int, fields: List[str], parts_dir: str) -> Tuple[str, int, float, str]:
+    """
+    Scores one partition from the shared arrays and writes its rows to a part file
+    Returns (partition, rows, seconds, part path)
+    """
+    started = time.perf_counter()
+    values = _worker_arrays["values"]
+    columns = {field: values[i, start:end] for i, field in enumerate(fields)}
+    rows = score_rows(_worker_arrays["keys"][start:end], columns, _worker_arrays["input_hashes"][start:end])
+    
+    part_path = os.path.join(parts_dir, f"part-{start:08d}.npy")
+    np.save(part_path, rows, allow_pickle=False)
+    return partition, len(rows), time.perf_counter() - started, part_path
+
+def rescore_national(
+    table_path: str,
+    inputs: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    partition_by: str = "sa4",
+    workers: Optional[int] = None,
+    index: Optional[SA2Index] = None
+) -> Dict[str, Any]:
+    """
+    Rescores every SA2 region and replaces the score table
+    Partitions run in a process pool that reads the inputs from shared memory
+    """
+    started = time.perf_counter()
+    index = index or SA2Index.from_geojson()
+    plan = PartitionPlan(index, inputs, partition_by)
+    workers = workers or os.cpu_count() or 1
+    
+    # Part files live next to the table so the final merge stays on one filesystem
+    table_dir = os.path.dirname(os.path.abspath(table_path))
+    os.makedirs(table_dir, exist_ok=True)
+    parts_dir = tempfile.mkdtemp(prefix="rescore-", dir=table_dir)
+    blocks = []
+    timings: Dict[str, Dict[str, float]] = {}
+    try:
+        specs = {}
+        for name in ("keys", "input_hashes", "values"):
+            block, specs[name] = _share(getattr(plan, name))
+            blocks.append(block)
+        
+        part_paths = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(specs, get_weight_registry().path)) as pool:
+            futures = [
+                pool.submit(_score_partition, partition, start, end, plan.fields, parts_dir)
+                for partition, start, end in plan.partitions
+            ]
+            for future in as_completed(futures):
+                partition, count, seconds, part_path = future.result()
+                timings[partition] = {"rows": count, "seconds": seconds}
+                part_paths.append(part_path)
+        
+        rows = np.concatenate([np.load(path, allow_pickle=False) for path in sorted(part_paths)])
+        write_rows(table_path, rows)
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+        shutil.rmtree(parts_dir, ignore_errors=True)
+    
+    elapsed = time.perf_counter() - started
+    logger.info(
+        f"Rescored {len(plan)} SA2 regions in {len(plan.partitions)} partitions "
+        f"with {workers} workers in {elapsed:.2f}s"
+    )
+    return {"rows": len(plan), "workers": workers, "seconds": elapsed, "partitions": timings}
+
+def format_timings(report: Dict[str, Any]) -> str:
+    """
+    Formats per-partition timings, slowest first
+    Formats per-partition timings
+    """
+    lines = [f"{'partition':<32}{'rows':>8}{'ms':>10}"]
+    partitions = sorted(report["partitions"].items(), key=lambda item: item[1]["seconds"], reverse=True)
+    for partition, timing in partitions:
+        lines.append(f"{partition:<32}{timing['rows']:>8}{timing['seconds'] * 1000:>10.1f}")
+    busy = sum(timing["seconds"] for timing in report["partitions"].values())
+    lines.append(
+        f"{report['rows']} rows, {len(partitions)} partitions, {report['workers']} workers: "
+        f"{report['seconds']:.2f}s wall, {busy:.2f}s in partitions"
+    )
+    return "\n".join(lines)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Rescore all SA2 regions in parallel and rebuild the score table")
+    parser.add_argument("--table", default=Settings.SCORE_TABLE_PATH, help="Path of the score table (.npy)")
+    parser.add_argument("--inputs", help="JSON object mapping SA2 code -> scoring inputs")
+    parser.add_argument("--partition-by", choices=sorted(PARTITION_COLUMNS), default="sa4")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    return parser.parse_args()
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    get_weight_registry().load(Settings.WEIGHT_PROFILES_PATH)
+    inputs = None
+    if args.inputs:
+        with open(args.inputs, "r", encoding="utf-8") as f:
+            inputs = json.load(f)
+    
+    report = rescore_national(args.table, inputs, args.partition_by, args.workers)
+    print(format_timings(report))
+
+if __name__ == "__main__":
+    main()
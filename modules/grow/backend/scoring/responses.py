@@ -0,0 +1,88 @@
+"""
+Fast-path JSON responses for scoring results
+Serializes ScoringResult directly instead of going through validation and the generic encoder
+"""
+
+import json
+import math
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from fastapi.responses import JSONResponse
+
+from ..shared.metrics import timed
+from ..shared.models import GrowthPotential, RiskLevel, ScoringMetrics, ScoringResult
+
+# Enum values are encoded once at import time
+_ENUM_JSON: Dict[Any, str] = {
+    member: json.dumps(member.value, ensure_ascii=False)
+    for enum in (GrowthPotential, RiskLevel)
+    for member in enum
+}
+
+_encode_string: Callable[[str], str] = json.JSONEncoder(ensure_ascii=False).encode
+
+class _Unsupported(Exception):
+    """Raised for values the fast path does not encode exactly like the default path"""
+
+def _float(value: Any) -> str:
+    # json.dumps writes finite floats with float.__repr__
+    if value.__class__ is not float or not math.isfinite(value):
+        raise _Unsupported
+    return repr(value)
+
+def _datetime(value: Any) -> str:
+    # pydantic writes UTC as "Z", so only naive timestamps take the fast path
+    if value.__class__ is not datetime or value.tzinfo is not None:
+        raise _Unsupported
+    return f'"{value.isoformat()}"'
+
+def _enum(value: Any) -> str:
+    encoded = _ENUM_JSON.get(value)
+    if encoded is None:
+        raise _Unsupported
+    return encoded
+
+def _render_default(result: ScoringResult) -> str:
+    # Same steps as FastAPI's response_model path followed by JSONResponse.render
+    return json.dumps(
+        result.model_dump(mode="json"), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    )
+
+def encode_scoring_result(result: ScoringResult) -> str:
+    """
+    Encodes a ScoringResult to the same JSON text FastAPI's default response would contain
+    Falls back to the default encoding for values the fast path cannot reproduce exactly
+    """
+    try:
+        metrics = result.metrics
+        if metrics.__class__ is not ScoringMetrics:
+            raise _Unsupported
+        recommendations = ",".join(_encode_string(text) for text in result.recommendations)
+        return (
+            f'{{"overall_score":{_float(result.overall_score)},'
+            f'"growth_potential":{_enum(result.growth_potential)},'
+            f'"risk_level":{_enum(result.risk_level)},'
+            f'"metrics":{{"location":{_float(metrics.location)},'
+            f'"infrastructure":{_float(metrics.infrastructure)},'
+            f'"market_trends":{_float(metrics.market_trends)},'
+            f'"rental_yield":{_float(metrics.rental_yield)}}},'
+            f'"recommendations":[{recommendations}],'
+            f'"created_at":{_datetime(result.created_at)}}}'
+        )
+    except (_Unsupported, TypeError):
+        return _render_default(result)
+
+class ScoringResultResponse(JSONResponse):
+    """
+    JSON response that encodes ScoringResult objects (or lists of them) directly
+    Any other content is rendered like a regular JSONResponse
+    """
+    
+    @timed("serialize")
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, ScoringResult):
+            return encode_scoring_result(content).encode("utf-8")
+        if isinstance(content, list) and all(isinstance(item, ScoringResult) for item in content):
+            return ("[" + ",".join(encode_scoring_result(item) for item in content) + "]").encode("utf-8")
+        return super().render(content)
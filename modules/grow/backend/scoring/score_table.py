@@ -0,0 +1,228 @@
+"""
+Materialized per-suburb score table
+Precomputed suburb scores stored as a memory-mapped binary table
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+import logging
+
+import numpy as np
+
+from .logic.scoring_algorithms import (
+    calculate_overall_score_batch,
+    classify_growth_potential_batch,
+    classify_risk_level_batch,
+    properties_to_columns,
+    COMPONENTS,
+    GROWTH_POTENTIAL_GRADES,
+    RISK_LEVELS
+)
+from .logic.weights import get_weight_registry
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+KEY_SIZE = 16
+
+# One fixed-size record per suburb key (SA2 code or postcode)
+SCORE_TABLE_DTYPE = np.dtype(
+    [("key", f"S{KEY_SIZE}"), ("input_hash", "<u8"), ("updated_at", "<f8"), ("overall_score", "<f8")]
+    + [(component, "<f8") for component in COMPONENTS]
+    + [("growth_potential", "u1"), ("risk_level", "u1")]
+)
+
+GROWTH_POTENTIAL_LABELS = [label for label, _ in GROWTH_POTENTIAL_GRADES]
+RISK_LEVEL_LABELS = [label for label, _ in RISK_LEVELS]
+
+def hash_inputs(inputs: Mapping[str, Any], weights_version: Optional[str] = None) -> int:
+    """
+    Stable 64-bit hash of a suburb's scoring inputs and the active weight profiles
+    Used to skip rescoring suburbs whose inputs and weights did not change; the version defaults to the registry's
+    """
+    if weights_version is None:
+        weights_version = get_weight_registry().version
+    payload = json.dumps([weights_version, inputs], sort_keys=True, default=str).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(payload, digest_size=8).digest(), "little")
+
+def encode_key(key: str) -> bytes:
+    encoded = key.strip().encode("utf-8")
+    if len(encoded) > KEY_SIZE:
+        raise ValueError(f"Key too long for score table: {key!r}")
+    return encoded
+
+def score_suburbs(inputs: Mapping[str, Mapping[str, Any]]) -> np.ndarray:
+    """
+    Scores suburbs in one vectorized pass and returns table rows
+    Scores suburbs and returns table rows
+    """
+    keys = list(inputs)
+    records = [dict(inputs[key]) for key in keys]
+    weights_version = get_weight_registry().version
+    return score_rows(
+        [encode_key(key) for key in keys],
+        properties_to_columns(records),
+        [hash_inputs(record, weights_version) for record in records]
+    )
+
+def score_rows(keys: Sequence[bytes], columns: Mapping[str, Any], input_hashes: Sequence[int]) -> np.ndarray:
+    """
+    Scores already-encoded keys from columnar inputs and returns table rows
+    Used by score_suburbs and by the parallel rescoring job
+    """
+    rows = np.zeros(len(keys), dtype=SCORE_TABLE_DTYPE)
+    if not len(keys):
+        return rows
+    
+    batch = calculate_overall_score_batch(columns, n=len(keys))
+    
+    rows["key"] = keys
+    rows["input_hash"] = input_hashes
+    rows["updated_at"] = time.time()
+    rows["overall_score"] = batch["overall_score"]
+    for component in COMPONENTS:
+        rows[component] = batch["component_scores"][component]
+    
+    growth = classify_growth_potential_batch(batch["overall_score"])
+    risk = classify_risk_level_batch(batch["overall_score"])
+    rows["growth_potential"] = [GROWTH_POTENTIAL_LABELS.index(label) for label in growth]
+    rows["risk_level"] = [RISK_LEVEL_LABELS.index(label) for label in risk]
+    
+    return rows
+
+def write_rows(path: str, rows: np.ndarray) -> None:
+    """
+    Writes rows sorted by key and atomically replaces the table file
+    Writes rows and replaces the table file
+    """
+    rows = rows[np.argsort(rows["key"], kind="stable")]
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, rows, allow_pickle=False)
+    os.replace(tmp_path, path)
+
+def build_score_table(path: str, inputs: Mapping[str, Mapping[str, Any]]) -> int:
+    """
+    Builds the score table from scratch
+    Returns the number of rows written
+    """
+    rows = score_suburbs(inputs)
+    write_rows(path, rows)
+    logger.info(f"Built score table with {len(rows)} suburbs: {path}")
+    return len(rows)
+
+class ScoreTable:
+    """
+    Read-only memory-mapped view of a score table
+    Lookups by key are O(1) through an in-memory key -> row mapping
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._open()
+    
+    def _open(self) -> None:
+        self.rows = np.load(self.path, mmap_mode="r", allow_pickle=False)
+        if self.rows.dtype != SCORE_TABLE_DTYPE:
+            raise ValueError(f"Unexpected score table layout in {self.path}: {self.rows.dtype}")
+        self._stat = self._file_identity()
+        self._positions = {key.decode("utf-8"): i for i, key in enumerate(self.rows["key"].tolist())}
+    
+    def _file_identity(self) -> tuple:
+        stat = os.stat(self.path)
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def __contains__(self, key: str) -> bool:
+        return key.strip() in self._positions
+    
+    def reload_if_changed(self) -> bool:
+        """
+        Re-opens the table if the file was replaced since it was opened
+        Returns True if the table was reloaded
+        """
+        if self._file_identity() != self._stat:
+            self._open()
+            return True
+        return False
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the stored scores for a suburb key, or None
+        Returns the stored scores for a suburb key
+        """
+        position = self._positions.get(key.strip())
+        if position is None:
+            return None
+        
+        row = self.rows[position]
+        return {
+            "key": key.strip(),
+            "overall_score": float(row["overall_score"]),
+            "component_scores": {component: float(row[component]) for component in COMPONENTS},
+            "growth_potential": GROWTH_POTENTIAL_LABELS[int(row["growth_potential"])],
+            "risk_level": RISK_LEVEL_LABELS[int(row["risk_level"])],
+            "updated_at": float(row["updated_at"])
+        }
+    
+    def refresh(self, inputs: Mapping[str, Mapping[str, Any]]) -> List[str]:
+        """
+        Rescores only suburbs whose inputs changed or that are new; a weight profile change rescores all of them
+        Returns the keys that were rescored
+        """
+        weights_version = get_weight_registry().version
+        changed = {}
+        for key, record in inputs.items():
+            position = self._positions.get(key.strip())
+            if position is None or int(self.rows["input_hash"][position]) != hash_inputs(dict(record), weights_version):
+                changed[key.strip()] = record
+        
+        if not changed:
+            return []
+        
+        fresh = score_suburbs(changed)
+        rows = np.array(self.rows)
+        new_rows = []
+        for row in fresh:
+            position = self._positions.get(row["key"].decode("utf-8"))
+            if position is None:
+                new_rows.append(row)
+            else:
+                rows[position] = row
+        if new_rows:
+            rows = np.concatenate([rows, np.array(new_rows, dtype=SCORE_TABLE_DTYPE)])
+        
+        write_rows(self.path, rows)
+        self._open()
+        logger.info(f"Refreshed {len(changed)} of {len(self)} suburbs in {self.path}")
+        return list(changed)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build or refresh the per-suburb score table")
+    parser.add_argument("command", choices=["build", "refresh"])
+    parser.add_argument("--inputs", required=True, help="JSON object mapping suburb key -> scoring inputs")
+    parser.add_argument("--table", required=True, help="Path of the score table (.npy)")
+    return parser.parse_args()
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    get_weight_registry().load(Settings.WEIGHT_PROFILES_PATH)
+    with open(args.inputs, "r", encoding="utf-8") as f:
+        inputs = json.load(f)
+    
+    if args.command == "build" or not os.path.exists(args.table):
+        build_score_table(args.table, inputs)
+    else:
+        ScoreTable(args.table).refresh(inputs)
+
+if __name__ == "__main__":
+    main()
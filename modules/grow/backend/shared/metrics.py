@@ -0,0 +1,201 @@
+"""
+In-process latency metrics
+Monotonic stage timers, counters and fixed-bucket histograms, rendered for /metrics
+"""
+
+import asyncio
+import functools
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Histogram upper bounds in seconds; the last bucket is +Inf
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+class Histogram:
+    """
+    Fixed-bucket histogram of observed durations
+    observe() is a bisect plus three integer/float updates, cheap enough for every request
+    """
+    
+    __slots__ = ("bounds", "counts", "count", "sum")
+    
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Upper bound of the bucket holding the q-quantile, None without observations
+        Values beyond the last bound report the last bound
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.bounds[-1]
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.quantile(0.5),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(bound) for bound in self.bounds] + ["+Inf"], self.counts))
+        }
+
+class StageTimer:
+    """
+    Context manager that records its elapsed perf_counter time into a histogram
+    A slotted class rather than @contextmanager, to keep per-use overhead to two clock reads
+    """
+    
+    __slots__ = ("histogram", "started")
+    
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+        self.started = 0.0
+    
+    def __enter__(self) -> "StageTimer":
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started)
+
+class MetricsRegistry:
+    """
+    Named counters and latency histograms for one process
+    Updated only from the event loop thread, so no locking is needed
+    """
+    
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.started_at = time.time()
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+    
+    def histogram(self, name: str) -> Histogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram(self.bounds)
+        return histogram
+    
+    def time(self, stage: str) -> StageTimer:
+        """
+        Times a block: `with metrics.time("compute"): ...`
+        Times a block
+        """
+        return StageTimer(self.histogram(stage))
+    
+    def observe(self, stage: str, seconds: float) -> None:
+        self.histogram(stage).observe(seconds)
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def reset(self) -> None:
+        self.counters.clear()
+        self.histograms.clear()
+        self.started_at = time.time()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        All counters and histograms as JSON-compatible data
+        All metrics as a dict
+        """
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "counters": dict(self.counters),
+            "stages": {name: histogram.snapshot() for name, histogram in sorted(self.histograms.items())}
+        }
+    
+    def render_prometheus(self, prefix: str = "grow") -> str:
+        """
+        Renders the metrics in the Prometheus text exposition format
+        Stages become labels of one <prefix>_stage_seconds histogram
+        """
+        lines: List[str] = []
+        for name, value in sorted(self.counters.items()):
+            metric = f"{prefix}_{name}_total".replace(".", "_").replace("-", "_")
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+        
+        metric = f"{prefix}_stage_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for name, histogram in sorted(self.histograms.items()):
+            cumulative = 0
+            for bound, count in zip(list(self.bounds) + ["+Inf"], histogram.counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_sum{{stage="{name}"}} {histogram.sum!r}')
+            lines.append(f'{metric}_count{{stage="{name}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+def get_metrics() -> MetricsRegistry:
+    """
+    Returns the process-wide metrics registry
+    Returns the shared metrics registry
+    """
+    return metrics
+
+def timed(stage: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator recording each call of a sync or async function as a stage
+    Failed calls are timed too
+    """
+    def decorate(function: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(function):
+            @functools.wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                with metrics.time(stage):
+                    return await function(*args, **kwargs)
+            return async_wrapper
+        
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with metrics.time(stage):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware timing whole requests per route template
+    Unmatched paths share one label so arbitrary URLs cannot grow the registry
+    """
+    
+    def __init__(self, app: Any, registry: Optional[MetricsRegistry] = None):
+        self.app = app
+        self.registry = registry or metrics
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None) or "unmatched"
+            self.registry.observe(f"request {scope['method']} {path}", time.perf_counter() - started)
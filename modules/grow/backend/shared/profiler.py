@@ -0,0 +1,76 @@
+"""
+Sampling profiler
+Periodically samples the stacks of all threads and folds them into flame-graph input
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+class SamplingProfiler:
+    """
+    Samples sys._current_frames() every `interval` seconds from the thread calling run()
+    Output is the folded "frame;frame;frame count" format read by flamegraph.pl and speedscope
+    """
+    
+    def __init__(self, interval: float = 0.005, max_depth: int = 128):
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def running(self) -> bool:
+        return self._lock.locked()
+    
+    def sample(self, skip_thread: Optional[int] = None) -> None:
+        """
+        Records the current stack of every thread except skip_thread
+        Records one sample per thread
+        """
+        names: Dict[int, str] = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == skip_thread:
+                continue
+            labels = []
+            while frame is not None and len(labels) < self.max_depth:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            labels.append(names.get(thread_id, str(thread_id)))
+            self.stacks[";".join(reversed(labels))] += 1
+        self.samples += 1
+    
+    def run(self, duration: float, interval: Optional[float] = None) -> str:
+        """
+        Samples for duration seconds in the calling thread and returns folded stacks
+        Raises RuntimeError if a profile is already running
+        """
+        if not self._lock.acquire(blocking=False):
+            raise RuntimeError("A profile is already running")
+        try:
+            self.stacks.clear()
+            self.samples = 0
+            interval = interval or self.interval
+            me = threading.get_ident()
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                self.sample(skip_thread=me)
+                time.sleep(interval)
+            logger.info(f"Profiled {self.samples} samples over {duration}s")
+            return self.folded()
+        finally:
+            self._lock.release()
+    
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
@@ -0,0 +1,172 @@
+"""
+Request rate limiting
+Per-client token buckets and an ASGI middleware enforcing Settings.RATE_LIMIT_*
+"""
+
+import json
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import logging
+
+from .metrics import get_metrics
+from .settings import Settings
+
+logger = logging.getLogger(__name__)
+
+class RateLimitBackend:
+    """
+    Interface for rate limit storage backends
+    acquire() takes one request from a client's allowance and returns (allowed, retry_after_seconds)
+    """
+    
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        raise NotImplementedError
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    In-process token buckets: `requests` tokens per client, refilled continuously over `window` seconds
+    Each bucket is updated without awaiting, so it is atomic on the event loop and needs no lock
+    """
+    
+    def __init__(
+        self,
+        requests: Optional[int] = None,
+        window: Optional[float] = None,
+        max_keys: int = 100000,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.capacity = float(Settings.RATE_LIMIT_REQUESTS if requests is None else requests)
+        self.window = float(Settings.RATE_LIMIT_WINDOW if window is None else window)
+        if self.capacity <= 0 or self.window <= 0:
+            raise ValueError("requests and window must be positive")
+        self.rate = self.capacity / self.window
+        self.max_keys = max_keys
+        self.clock = clock
+        # key -> [tokens, last refill time]
+        self._buckets: Dict[str, List[float]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+    
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        return self.take(key)
+    
+    def take(self, key: str) -> Tuple[bool, float]:
+        """
+        Takes one token for key without awaiting
+        Returns (allowed, seconds until the next token)
+        """
+        now = self.clock()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_keys:
+                self._evict_idle(now)
+            bucket = self._buckets[key] = [self.capacity, now]
+        else:
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        
+        if bucket[0] >= 1.0:
+            bucket[0] -= 1.0
+            return True, 0.0
+        return False, (1.0 - bucket[0]) / self.rate
+    
+    def reset(self) -> None:
+        """
+        Drops all buckets, so every client starts again at full capacity
+        Used by tests that share one client address across many requests
+        """
+        self._buckets.clear()
+    
+    def _evict_idle(self, now: float) -> None:
+        # A bucket idle for a full window is back at capacity, same as a new one
+        idle = [key for key, (_, last) in self._buckets.items() if now - last >= self.window]
+        for key in idle:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_keys:
+            # Still full: drop the oldest half rather than grow without bound
+            for key in list(self._buckets)[:len(self._buckets) // 2]:
+                del self._buckets[key]
+        logger.info(f"Evicted rate limit buckets; {len(self._buckets)} remain")
+
+class SharedRateLimitBackend(RateLimitBackend):
+    """
+    Backend for a shared key-value store such as Redis, so all workers share one allowance per client
+    Expects an asyncio client with incr(key) and expire(key, seconds); counts requests per fixed window
+    """
+    
+    def __init__(
+        self,
+        client: Any,
+        requests: Optional[int] = None,
+        window: Optional[float] = None,
+        prefix: str = "grow:ratelimit:",
+        clock: Callable[[], float] = time.time
+    ):
+        self.client = client
+        self.requests = Settings.RATE_LIMIT_REQUESTS if requests is None else requests
+        # Shared stores expire at whole-second granularity
+        self.window = max(1, int(Settings.RATE_LIMIT_WINDOW if window is None else window))
+        self.prefix = prefix
+        self.clock = clock
+    
+    async def acquire(self, key: str) -> Tuple[bool, float]:
+        now = self.clock()
+        slot = int(now // self.window)
+        store_key = f"{self.prefix}{key}:{slot}"
+        count = await self.client.incr(store_key)
+        if count == 1:
+            await self.client.expire(store_key, self.window)
+        if count <= self.requests:
+            return True, 0.0
+        return False, (slot + 1) * self.window - now
+
+def client_key(scope: Dict[str, Any]) -> str:
+    """
+    Rate limit key of a request: the client address
+    Proxies must pass the original address to the ASGI server (e.g. uvicorn --proxy-headers)
+    """
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware that answers 429 once a client's allowance is used up
+    Avoids BaseHTTPMiddleware so an allowed request costs one dict update
+    """
+    
+    def __init__(
+        self,
+        app: Any,
+        backend: RateLimitBackend,
+        key: Callable[[Dict[str, Any]], str] = client_key,
+        exempt_paths: Sequence[str] = ("/health",)
+    ):
+        self.app = app
+        self.backend = backend
+        self.key = key
+        self.exempt_paths = frozenset(exempt_paths)
+    
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+        
+        allowed, retry_after = await self.backend.acquire(self.key(scope))
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+        
+        get_metrics().increment("rate_limited")
+        body = json.dumps({"detail": "Rate limit exceeded"}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("ascii"))
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,273 @@
+"""
+Lightweight record types for internal batch processing
+Slotted rows and struct-of-arrays batches mirroring the pydantic models
+"""
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from .models import (
+    GrowthPotential,
+    MarketData,
+    PropertyData,
+    PropertyType,
+    RiskLevel,
+    ScoringMetrics,
+    ScoringResult
+)
+
+PROPERTY_STRING_FIELDS = ("id", "address", "suburb", "postcode", "property_type")
+PROPERTY_NUMERIC_FIELDS = (
+    "current_price", "previous_price", "bedrooms", "bathrooms", "land_size", "build_year", "last_renovation"
+)
+PROPERTY_INT_FIELDS = ("bedrooms", "bathrooms", "build_year", "last_renovation")
+
+MARKET_STRING_FIELDS = ("suburb", "postcode")
+MARKET_NUMERIC_FIELDS = (
+    "median_price", "price_growth_1y", "price_growth_5y", "days_on_market",
+    "auction_clearance_rate", "rental_yield", "vacancy_rate", "volatility"
+)
+MARKET_INT_FIELDS = ("days_on_market",)
+
+METRIC_FIELDS = ("location", "infrastructure", "market_trends", "rental_yield")
+
+class SlottedRecord:
+    """
+    Base class for slotted records
+    Subclasses list their fields in __slots__; timestamps are only set when known
+    """
+    
+    __slots__ = ()
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__}
+    
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, field) == getattr(other, field) for field in self.__slots__
+        )
+    
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+class PropertyRecord(SlottedRecord):
+    """Slotted counterpart of PropertyData"""
+    
+    __slots__ = PROPERTY_STRING_FIELDS + PROPERTY_NUMERIC_FIELDS + ("created_at", "updated_at")
+    
+    def __init__(
+        self, address: str, suburb: str, postcode: str, property_type: str, id: Optional[str] = None,
+        current_price: Optional[float] = None, previous_price: Optional[float] = None,
+        bedrooms: Optional[int] = None, bathrooms: Optional[int] = None, land_size: Optional[float] = None,
+        build_year: Optional[int] = None, last_renovation: Optional[int] = None,
+        created_at: Optional[datetime] = None, updated_at: Optional[datetime] = None
+    ):
+        self.id = id
+        self.address = address
+        self.suburb = suburb
+        self.postcode = postcode
+        self.property_type = property_type
+        self.current_price = current_price
+        self.previous_price = previous_price
+        self.bedrooms = bedrooms
+        self.bathrooms = bathrooms
+        self.land_size = land_size
+        self.build_year = build_year
+        self.last_renovation = last_renovation
+        self.created_at = created_at
+        self.updated_at = updated_at
+    
+    @classmethod
+    def from_model(cls, model: PropertyData) -> "PropertyRecord":
+        data = {field: getattr(model, field) for field in cls.__slots__}
+        data["property_type"] = model.property_type.value
+        return cls(**data)
+    
+    def to_model(self) -> PropertyData:
+        """
+        Builds the pydantic model without re-validating
+        Missing timestamps fall back to the model's default factory
+        """
+        data = {field: getattr(self, field) for field in self.__slots__ if getattr(self, field) is not None}
+        data["property_type"] = PropertyType(self.property_type)
+        return PropertyData.model_construct(**data)
+
+class MarketRecord(SlottedRecord):
+    """Slotted counterpart of MarketData"""
+    
+    __slots__ = MARKET_STRING_FIELDS + MARKET_NUMERIC_FIELDS
+    
+    def __init__(
+        self, suburb: str, postcode: str, median_price: Optional[float] = None,
+        price_growth_1y: Optional[float] = None, price_growth_5y: Optional[float] = None,
+        days_on_market: Optional[int] = None, auction_clearance_rate: Optional[float] = None,
+        rental_yield: Optional[float] = None, vacancy_rate: Optional[float] = None,
+        volatility: Optional[float] = None
+    ):
+        self.suburb = suburb
+        self.postcode = postcode
+        self.median_price = median_price
+        self.price_growth_1y = price_growth_1y
+        self.price_growth_5y = price_growth_5y
+        self.days_on_market = days_on_market
+        self.auction_clearance_rate = auction_clearance_rate
+        self.rental_yield = rental_yield
+        self.vacancy_rate = vacancy_rate
+        self.volatility = volatility
+    
+    @classmethod
+    def from_model(cls, model: MarketData) -> "MarketRecord":
+        return cls(**{field: getattr(model, field) for field in cls.__slots__})
+    
+    def to_model(self) -> MarketData:
+        return MarketData.model_construct(**self.to_dict())
+
+class ScoringRecord(SlottedRecord):
+    """Slotted counterpart of ScoringResult with the metrics flattened"""
+    
+    __slots__ = ("overall_score", "growth_potential", "risk_level") + METRIC_FIELDS + ("recommendations", "created_at")
+    
+    def __init__(
+        self, overall_score: float, growth_potential: str, risk_level: str,
+        location: float, infrastructure: float, market_trends: float, rental_yield: float,
+        recommendations: Tuple[str, ...] = (), created_at: Optional[datetime] = None
+    ):
+        self.overall_score = overall_score
+        self.growth_potential = growth_potential
+        self.risk_level = risk_level
+        self.location = location
+        self.infrastructure = infrastructure
+        self.market_trends = market_trends
+        self.rental_yield = rental_yield
+        self.recommendations = recommendations
+        self.created_at = created_at
+    
+    @classmethod
+    def from_model(cls, model: ScoringResult) -> "ScoringRecord":
+        return cls(
+            model.overall_score, model.growth_potential.value, model.risk_level.value,
+            *(getattr(model.metrics, field) for field in METRIC_FIELDS),
+            recommendations=tuple(model.recommendations), created_at=model.created_at
+        )
+    
+    def to_model(self) -> ScoringResult:
+        data = {
+            "overall_score": self.overall_score,
+            "growth_potential": GrowthPotential(self.growth_potential),
+            "risk_level": RiskLevel(self.risk_level),
+            "metrics": ScoringMetrics.model_construct(**{field: getattr(self, field) for field in METRIC_FIELDS}),
+            "recommendations": list(self.recommendations)
+        }
+        if self.created_at is not None:
+            data["created_at"] = self.created_at
+        return ScoringResult.model_construct(**data)
+
+class RecordBatch:
+    """
+    Struct-of-arrays batch: one numpy column per field
+    Numeric columns are float64 with NaN for missing values; strings are object columns
+    """
+    
+    record_type: Type[SlottedRecord] = SlottedRecord
+    string_fields: Tuple[str, ...] = ()
+    numeric_fields: Tuple[str, ...] = ()
+    int_fields: Tuple[str, ...] = ()
+    
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All columns must have the same length, got {sorted(lengths)}")
+        self.columns = columns
+        self.size = lengths.pop() if lengths else 0
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.columns[field]
+    
+    @classmethod
+    def from_rows(cls, rows: Sequence[Any]) -> "RecordBatch":
+        """
+        Builds a batch from dicts, slotted records or pydantic models
+        Builds a batch from row objects
+        """
+        # Field values per row; a pydantic model's fields are its instance __dict__, and a
+        # missing attribute lookup on a model is slow, so models are not read with getattr
+        values = [
+            row if isinstance(row, dict) else row.to_dict() if isinstance(row, SlottedRecord) else vars(row)
+            for row in rows
+        ]
+        
+        columns: Dict[str, np.ndarray] = {}
+        for field in cls.string_fields:
+            column = np.empty(len(rows), dtype=object)
+            column[:] = [v.value if isinstance(v, Enum) else v for v in (data.get(field) for data in values)]
+            columns[field] = column
+        for field in cls.numeric_fields:
+            # None converts to NaN
+            columns[field] = np.array([data.get(field) for data in values], dtype=np.float64)
+        return cls(columns)
+    
+    def _row_values(self, i: int) -> Dict[str, Any]:
+        data: Dict[str, Any] = {field: self.columns[field][i] for field in self.string_fields}
+        for field in self.numeric_fields:
+            number = float(self.columns[field][i])
+            if number != number:
+                data[field] = None
+            elif field in self.int_fields:
+                data[field] = int(number)
+            else:
+                data[field] = number
+        return data
+    
+    def record(self, i: int) -> SlottedRecord:
+        return self.record_type(**self._row_values(i))
+    
+    def records(self) -> Iterable[SlottedRecord]:
+        for i in range(self.size):
+            yield self.record(i)
+    
+    def to_models(self) -> List[Any]:
+        return [record.to_model() for record in self.records()]
+
+class PropertyBatch(RecordBatch):
+    """Struct-of-arrays batch of properties"""
+    
+    record_type = PropertyRecord
+    string_fields = PROPERTY_STRING_FIELDS
+    numeric_fields = PROPERTY_NUMERIC_FIELDS
+    int_fields = PROPERTY_INT_FIELDS
+
+class MarketBatch(RecordBatch):
+    """Struct-of-arrays batch of market data"""
+    
+    record_type = MarketRecord
+    string_fields = MARKET_STRING_FIELDS
+    numeric_fields = MARKET_NUMERIC_FIELDS
+    int_fields = MARKET_INT_FIELDS
+
+class ScoringBatch(RecordBatch):
+    """Struct-of-arrays batch of scoring results"""
+    
+    record_type = ScoringRecord
+    string_fields = ("growth_potential", "risk_level")
+    numeric_fields = ("overall_score",) + METRIC_FIELDS
+    
+    @classmethod
+    def from_scores(cls, batch: Dict[str, Any], growth_potential: np.ndarray, risk_level: np.ndarray) -> "ScoringBatch":
+        """
+        Wraps calculate_overall_score_batch output without copying the score arrays
+        Wraps batch scoring output
+        """
+        columns = {
+            "overall_score": batch["overall_score"],
+            "growth_potential": np.asarray(growth_potential, dtype=object),
+            "risk_level": np.asarray(risk_level, dtype=object)
+        }
+        columns.update({field: batch["component_scores"][field] for field in METRIC_FIELDS})
+        return cls(columns)
@@ -21,30 +21,64 @@ class Settings:
     API_KEYS = {
         "property_data": os.getenv("PROPERTY_DATA_API_KEY", ""),
         "market_data": os.getenv("MARKET_DATA_API_KEY", ""),
-        "census_data": os.getenv("CENSUS_API_KEY", "")
+        "census_data": os.getenv("CENSUS_API_KEY", ""),
+        "infrastructure_data": os.getenv("INFRASTRUCTURE_API_KEY", "")
     }
     
-    # Scoring Configuration
-    SCORING_WEIGHTS = {
-        "residential": {
-            "location": 0.3,
-            "infrastructure": 0.25,
-            "market_trends": 0.25,
-            "rental_yield": 0.2
-        },
-        "commercial": {
-            "location": 0.35,
-            "infrastructure": 0.3,
-            "market_trends": 0.25,
-            "rental_yield": 0.1
-        },
-        "industrial": {
-            "location": 0.4,
-            "infrastructure": 0.35,
-            "market_trends": 0.2,
-            "rental_yield": 0.05
-        }
+    # Upstream Fetching
+    FETCH_TIMEOUTS = {
+        "property_data": 5.0,
+        "market_data": 5.0,
+        "census_data": 10.0,
+        "infrastructure_data": 10.0
     }
+    FETCH_MAX_CONNECTIONS = int(os.getenv("FETCH_MAX_CONNECTIONS", "20"))
+    
+    # Scoring Configuration (optional JSON overrides for the built-in weight profiles)
+    WEIGHT_PROFILES_PATH = os.getenv(
+        "WEIGHT_PROFILES_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "config", "weight_profiles.json")
+    )
+    
+    # Batch Scoring (the request body is held in full, up to SCORING_BATCH_MAX_SIZE; results stream per chunk)
+    SCORING_BATCH_MAX_SIZE = int(os.getenv("SCORING_BATCH_MAX_SIZE", "10000"))
+    SCORING_BATCH_CHUNK_SIZE = int(os.getenv("SCORING_BATCH_CHUNK_SIZE", "500"))
+    # How long concurrent POST /api/scoring requests are collected before one scoring call
+    SCORING_COALESCE_WINDOW_MS = float(os.getenv("SCORING_COALESCE_WINDOW_MS", "2"))
+    
+    # Precomputed Scores
+    SCORE_TABLE_PATH = os.getenv("SCORE_TABLE_PATH", "data/score_table.npy")
+    
+    # Suburb Ranking
+    SA2_FACTORS_PATH = os.getenv("SA2_FACTORS_PATH", "data/sa2_factors.npz")
+    RANKING_MAX_K = int(os.getenv("RANKING_MAX_K", "1000"))
+    
+    # Spatial Data
+    SA2_CENTROIDS_PATH = os.getenv(
+        "SA2_CENTROIDS_PATH",
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..", "..", "..", "..", "platform", "public", "geojson", "australia_sa2_centroids.geojson"
+        )
+    )
+    
+    # Per-SA2 infrastructure scores built from POI files
+    INFRASTRUCTURE_TABLE_PATH = os.getenv("INFRASTRUCTURE_TABLE_PATH", "data/infrastructure_scores.npy")
+    
+    # School catchment polygons (primary.geojson, secondary.geojson, future.geojson)
+    SCHOOL_CATCHMENTS_DIR = os.getenv("SCHOOL_CATCHMENTS_DIR", "data/school_catchments")
+    
+    # Monthly median price series per suburb
+    MARKET_STORE_PATH = os.getenv("MARKET_STORE_PATH", "data/market_store")
+    
+    # Postcode to suburb reference data for the lookup index
+    POSTCODE_SUBURB_PATH = os.getenv(
+        "POSTCODE_SUBURB_PATH",
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..", "..", "..", "..", "data", "postcode_to_suburb.json"
+        )
+    )
     
     # Alert Thresholds
     ALERT_THRESHOLDS = {
@@ -54,6 +88,13 @@ class Settings:
         "maintenance_due": 30  # 30 days until maintenance
     }
     
+    # Alert state for change detection between runs
+    ALERT_STATE_PATH = os.getenv("ALERT_STATE_PATH", "data/alert_state.sqlite3")
+    
+    # Sampling profiler (POST /debug/profile); off unless explicitly enabled
+    PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+    PROFILER_MAX_SECONDS = float(os.getenv("PROFILER_MAX_SECONDS", "60"))
+    
     # Logging Configuration
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -61,10 +102,12 @@ class Settings:
     # Caching Configuration
     CACHE_TTL = 3600  # 1 hour in seconds
     CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "10000"))
     
     # Rate Limiting
-    RATE_LIMIT_REQUESTS = 100  # Requests per minute
-    RATE_LIMIT_WINDOW = 60  # Time window in seconds
+    RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_REQUESTS = int(os.getenv("RATE_LIMIT_REQUESTS", "100"))  # Requests per minute
+    RATE_LIMIT_WINDOW = int(os.getenv("RATE_LIMIT_WINDOW", "60"))  # Time window in seconds
     
     @classmethod
     def get_database_config(cls) -> Dict[str, Any]:
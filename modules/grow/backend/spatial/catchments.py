@@ -0,0 +1,293 @@
+"""
+School catchment point-in-polygon engine
+Catchment polygons behind a packed bounding-box R-tree, with prepared (band-indexed) edges for batch queries
+"""
+
+import math
+import os
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+# File name (without .geojson) in the catchments directory -> catchment type used by the frontend
+CATCHMENT_TYPES = {"primary": "Primary", "secondary": "Secondary", "future": "Future"}
+
+# Children per R-tree node
+NODE_SIZE = 16
+
+def polygon_rings(geometry: Optional[Dict[str, Any]]) -> List[np.ndarray]:
+    """
+    Exterior and interior rings of a Polygon or MultiPolygon as (n, 2) lon/lat arrays
+    Other geometry types have no rings
+    """
+    if not geometry:
+        return []
+    if geometry.get("type") == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry.get("type") == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return []
+    return [np.asarray(ring, dtype=np.float64)[:, :2] for polygon in polygons for ring in polygon if len(ring) >= 3]
+
+class PreparedPolygon:
+    """
+    Polygon edges bucketed into horizontal bands
+    A point is ray-cast only against the edges of its band; the even-odd rule covers holes and multipolygons
+    """
+    
+    __slots__ = ("bbox", "x0", "y0", "x1", "y1", "band_height", "band_offsets", "band_edges")
+    
+    def __init__(self, rings: Sequence[np.ndarray], bands: Optional[int] = None):
+        if not rings:
+            raise ValueError("A polygon needs at least one ring")
+        start = np.concatenate(rings)
+        end = np.concatenate([np.roll(ring, -1, axis=0) for ring in rings])
+        self.bbox = (float(start[:, 0].min()), float(start[:, 1].min()), float(start[:, 0].max()), float(start[:, 1].max()))
+        
+        # Horizontal edges never cross a horizontal ray
+        keep = start[:, 1] != end[:, 1]
+        self.x0, self.y0 = np.ascontiguousarray(start[keep, 0]), np.ascontiguousarray(start[keep, 1])
+        self.x1, self.y1 = np.ascontiguousarray(end[keep, 0]), np.ascontiguousarray(end[keep, 1])
+        
+        bands = bands or max(1, int(math.sqrt(len(self.x0))))
+        self.band_height = (self.bbox[3] - self.bbox[1]) / bands or 1.0
+        low = self._band(np.minimum(self.y0, self.y1), bands)
+        high = self._band(np.maximum(self.y0, self.y1), bands)
+        
+        # CSR layout: edges of band b are band_edges[band_offsets[b]:band_offsets[b + 1]]
+        counts = high - low + 1
+        edges = np.repeat(np.arange(len(self.x0)), counts)
+        band_ids = np.repeat(low, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        order = np.argsort(band_ids, kind="stable")
+        self.band_edges = edges[order]
+        self.band_offsets = np.r_[0, np.cumsum(np.bincount(band_ids, minlength=bands))]
+    
+    def _band(self, y: np.ndarray, bands: int) -> np.ndarray:
+        return np.clip(np.floor((y - self.bbox[1]) / self.band_height).astype(np.int64), 0, bands - 1)
+    
+    def contains(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Boolean mask of the points strictly inside the polygon
+        Points are grouped by band so each group is tested against its edges in one array operation
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        inside = np.zeros(len(x), dtype=bool)
+        min_x, min_y, max_x, max_y = self.bbox
+        candidates = np.flatnonzero((x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y))
+        if not len(candidates):
+            return inside
+        
+        bands = self._band(y[candidates], len(self.band_offsets) - 1)
+        order = np.argsort(bands, kind="stable")
+        candidates, bands = candidates[order], bands[order]
+        splits = np.flatnonzero(np.diff(bands)) + 1
+        for start, points in zip(np.r_[0, splits].tolist(), np.split(candidates, splits)):
+            band = bands[start]
+            edges = self.band_edges[self.band_offsets[band]:self.band_offsets[band + 1]]
+            if not len(edges):
+                continue
+            px, py = x[points, None], y[points, None]
+            x0, y0, x1, y1 = self.x0[edges], self.y0[edges], self.x1[edges], self.y1[edges]
+            straddles = (y0 > py) != (y1 > py)
+            crossing_x = x0 + (py - y0) * (x1 - x0) / (y1 - y0)
+            crossings = np.count_nonzero(straddles & (px < crossing_x), axis=1)
+            inside[points] = crossings % 2 == 1
+        return inside
+
+class BoxTree:
+    """
+    Static R-tree over bounding boxes, packed with Sort-Tile-Recursive
+    Node i of a level covers children [i * node_size, (i + 1) * node_size) of the level below
+    """
+    
+    def __init__(self, boxes: np.ndarray, node_size: int = NODE_SIZE):
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        self.node_size = node_size
+        
+        # Vertical slices by x center, each sorted by y center, so leaves are spatially compact
+        count = len(boxes)
+        slices = max(1, math.ceil(math.sqrt(math.ceil(count / node_size))))
+        slice_size = slices * node_size
+        order = np.argsort(boxes[:, 0] + boxes[:, 2], kind="stable")
+        for start in range(0, count, slice_size):
+            chunk = order[start:start + slice_size]
+            order[start:start + slice_size] = chunk[np.argsort(boxes[chunk, 1] + boxes[chunk, 3], kind="stable")]
+        self.order = order
+        
+        levels = [boxes[order]]
+        while len(levels[-1]) > node_size:
+            level = levels[-1]
+            starts = np.arange(0, len(level), node_size)
+            levels.append(np.column_stack([
+                np.minimum.reduceat(level[:, 0], starts),
+                np.minimum.reduceat(level[:, 1], starts),
+                np.maximum.reduceat(level[:, 2], starts),
+                np.maximum.reduceat(level[:, 3], starts)
+            ]))
+        # Root level first
+        self.levels = levels[::-1]
+    
+    def __len__(self) -> int:
+        return len(self.order)
+    
+    def query_points(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        All (point, item) pairs whose item box contains the point
+        The whole batch descends the tree together, one level per step
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if not len(self.order) or not len(x):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        
+        top = len(self.levels[0])
+        points = np.repeat(np.arange(len(x)), top)
+        nodes = np.tile(np.arange(top), len(x))
+        for depth, boxes in enumerate(self.levels):
+            box = boxes[nodes]
+            px, py = x[points], y[points]
+            hit = (box[:, 0] <= px) & (px <= box[:, 2]) & (box[:, 1] <= py) & (py <= box[:, 3])
+            points, nodes = points[hit], nodes[hit]
+            if depth == len(self.levels) - 1:
+                break
+            
+            first = nodes * self.node_size
+            counts = np.minimum(self.node_size, len(self.levels[depth + 1]) - first)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            points = np.repeat(points, counts)
+            nodes = np.repeat(first, counts) + offsets
+        return points, self.order[nodes]
+
+class CatchmentIndex:
+    """
+    School catchments with a bounding-box R-tree and prepared geometries
+    Built once; queries filter by bounding box first and ray-cast only the remaining candidates
+    """
+    
+    def __init__(self, catchments: Sequence[Dict[str, Any]], geometries: Sequence[PreparedPolygon], node_size: int = NODE_SIZE):
+        if len(catchments) != len(geometries):
+            raise ValueError("Every catchment needs exactly one geometry")
+        self.catchments = list(catchments)
+        self.geometries = list(geometries)
+        self.types = np.array([catchment.get("type") or "" for catchment in self.catchments], dtype=object)
+        self.tree = BoxTree(np.array([geometry.bbox for geometry in self.geometries]), node_size)
+    
+    @classmethod
+    def from_geojson(cls, paths: Dict[str, str]) -> "CatchmentIndex":
+        """
+        Loads catchment FeatureCollections keyed by catchment type
+        Features without polygon geometry are skipped
+        """
+        catchments, geometries = [], []
+        for catchment_type, path in paths.items():
+            with open(path, "r", encoding="utf-8") as f:
+                collection = json.load(f)
+            for feature in collection.get("features", []):
+                rings = polygon_rings(feature.get("geometry"))
+                if not rings:
+                    continue
+                properties = dict(feature.get("properties") or {})
+                properties["catchment_id"] = str(properties.get("catchment_id", properties.get("id", len(catchments))))
+                properties["type"] = catchment_type
+                catchments.append(properties)
+                geometries.append(PreparedPolygon(rings))
+        
+        index = cls(catchments, geometries)
+        logger.info(f"Loaded {len(index)} school catchments from {len(paths)} files")
+        return index
+    
+    @classmethod
+    def from_directory(cls, path: str) -> "CatchmentIndex":
+        """
+        Loads primary.geojson, secondary.geojson and future.geojson from a directory, where present
+        Loads the catchment files in a directory
+        """
+        paths = {}
+        for name, catchment_type in CATCHMENT_TYPES.items():
+            file_path = os.path.join(path, f"{name}.geojson")
+            if os.path.exists(file_path):
+                paths[catchment_type] = file_path
+        return cls.from_geojson(paths)
+    
+    def __len__(self) -> int:
+        return len(self.catchments)
+    
+    def query(self, lon: Sequence[float], lat: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (point, catchment) index pairs for every catchment containing a point, ordered by point
+        Each catchment tests all of its bounding-box candidates at once
+        """
+        x = np.asarray(lon, dtype=np.float64)
+        y = np.asarray(lat, dtype=np.float64)
+        points, items = self.tree.query_points(x, y)
+        if not len(points):
+            return points, items
+        
+        order = np.argsort(items, kind="stable")
+        points, items = points[order], items[order]
+        bounds = np.r_[0, np.flatnonzero(np.diff(items)) + 1, len(items)].tolist()
+        keep = np.concatenate([
+            self.geometries[items[start]].contains(x[points[start:end]], y[points[start:end]])
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ])
+        points, items = points[keep], items[keep]
+        order = np.lexsort((items, points))
+        return points[order], items[order]
+    
+    def containing(self, lon: Sequence[float], lat: Sequence[float]) -> List[List[Dict[str, Any]]]:
+        """
+        Catchments containing each point, one list per point
+        Catchments containing each point
+        """
+        points, items = self.query(lon, lat)
+        results: List[List[Dict[str, Any]]] = [[] for _ in range(len(lon))]
+        for point, item in zip(points.tolist(), items.tolist()):
+            results[point].append(self.catchments[item])
+        return results
+    
+    def counts(self, lon: Sequence[float], lat: Sequence[float], catchment_type: Optional[str] = None) -> np.ndarray:
+        """
+        Number of catchments (optionally of one type) containing each point
+        Used as a school-access column for batch scoring
+        """
+        points, items = self.query(lon, lat)
+        if catchment_type is not None:
+            points = points[self.types[items] == catchment_type]
+        return np.bincount(points, minlength=len(lon))
+
+_catchment_index: Optional[CatchmentIndex] = None
+_catchment_index_source: Optional[Tuple[str, tuple]] = None
+
+def _file_identity(path: str) -> Optional[tuple]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def get_catchment_index() -> Optional[CatchmentIndex]:
+    """
+    Returns the process-wide catchment index, or None if no catchment files exist
+    Picks up added, replaced or removed catchment files automatically; a missing index is not cached
+    """
+    global _catchment_index, _catchment_index_source
+    
+    path = Settings.SCHOOL_CATCHMENTS_DIR
+    identities = tuple(_file_identity(os.path.join(path, f"{name}.geojson")) for name in CATCHMENT_TYPES)
+    if not any(identities):
+        _catchment_index = _catchment_index_source = None
+        return None
+    
+    source = (path, identities)
+    if _catchment_index is None or _catchment_index_source != source:
+        _catchment_index = CatchmentIndex.from_directory(path)
+        _catchment_index_source = source
+    return _catchment_index
@@ -0,0 +1,236 @@
+"""
+Infrastructure accessibility from points of interest
+POIs are binned into a spatial grid and scored per SA2 centroid with distance decay
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from .sa2_index import EARTH_RADIUS_KM, SA2Index, get_sa2_index
+from ..scoring.logic.weights import get_weight_profile
+from ..scoring.score_table import KEY_SIZE, encode_key, write_rows
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+
+# Per category: exp(-d / decay_km) weighting, cut off at radius_km; the summed weight
+# maps to 0-100 as 100 * (1 - exp(-access / saturation))
+POI_CATEGORIES: Dict[str, Dict[str, float]] = {
+    "schools": {"decay_km": 1.5, "radius_km": 5.0, "saturation": 3.0},
+    "transport": {"decay_km": 0.8, "radius_km": 3.0, "saturation": 5.0},
+    "hospitals": {"decay_km": 5.0, "radius_km": 20.0, "saturation": 1.0},
+    "shops": {"decay_km": 1.0, "radius_km": 5.0, "saturation": 4.0}
+}
+
+INFRASTRUCTURE_DTYPE = np.dtype(
+    [("key", f"S{KEY_SIZE}")]
+    + [(category, "<f8") for category in POI_CATEGORIES]
+    + [("infrastructure_score", "<f8")]
+)
+
+def load_points(path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Loads POI coordinates from GeoJSON (Point features) or CSV (lon/lat or longitude/latitude columns)
+    Returns (lon, lat) arrays; rows without coordinates are skipped
+    """
+    lon, lat = [], []
+    if path.lower().endswith(".csv"):
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                x = row.get("lon") or row.get("longitude")
+                y = row.get("lat") or row.get("latitude")
+                if x and y:
+                    lon.append(float(x))
+                    lat.append(float(y))
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            collection = json.load(f)
+        for feature in collection.get("features", []):
+            geometry = feature.get("geometry")
+            if geometry and geometry.get("type") == "Point":
+                lon.append(geometry["coordinates"][0])
+                lat.append(geometry["coordinates"][1])
+    return np.asarray(lon, dtype=np.float64), np.asarray(lat, dtype=np.float64)
+
+def haversine_km(lon: float, lat: float, lons: np.ndarray, lats: np.ndarray) -> np.ndarray:
+    lon1, lat1 = math.radians(lon), math.radians(lat)
+    lon2, lat2 = np.radians(lons), np.radians(lats)
+    a = np.sin((lat2 - lat1) / 2.0) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2.0) ** 2
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+class PointGrid:
+    """
+    Points sorted by grid cell (row-major over lat/lon degrees)
+    Cells of one grid row are contiguous, so a radius query needs two searchsorted calls per row
+    """
+    
+    def __init__(self, lon: Sequence[float], lat: Sequence[float], cell_degrees: float = 0.05):
+        lon = np.asarray(lon, dtype=np.float64)
+        lat = np.asarray(lat, dtype=np.float64)
+        self.cell_degrees = cell_degrees
+        self.columns = int(math.ceil(360.0 / cell_degrees))
+        
+        keys = self._cell_keys(lon, lat)
+        order = np.argsort(keys, kind="stable")
+        self.keys = keys[order]
+        self.lon = lon[order]
+        self.lat = lat[order]
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def _cell_keys(self, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        rows = np.floor((lat + 90.0) / self.cell_degrees).astype(np.int64)
+        columns = np.floor((lon + 180.0) / self.cell_degrees).astype(np.int64)
+        return rows * self.columns + np.clip(columns, 0, self.columns - 1)
+    
+    def within_radius(self, lon: float, lat: float, radius_km: float) -> np.ndarray:
+        """
+        Distances in km to all points within radius_km of (lon, lat)
+        Distances to nearby points
+        """
+        if not len(self.keys):
+            return np.empty(0)
+        
+        dlat = radius_km / KM_PER_DEGREE
+        widest = max(math.cos(math.radians(min(abs(lat) + dlat, 89.9))), 1e-6)
+        dlon = min(radius_km / (KM_PER_DEGREE * widest), 180.0)
+        
+        row_lo = int(math.floor((lat - dlat + 90.0) / self.cell_degrees))
+        row_hi = int(math.floor((lat + dlat + 90.0) / self.cell_degrees))
+        column_lo = max(int(math.floor((lon - dlon + 180.0) / self.cell_degrees)), 0)
+        column_hi = min(int(math.floor((lon + dlon + 180.0) / self.cell_degrees)), self.columns - 1)
+        
+        rows = np.arange(row_lo, row_hi + 1, dtype=np.int64) * self.columns
+        starts = np.searchsorted(self.keys, rows + column_lo, side="left")
+        ends = np.searchsorted(self.keys, rows + column_hi, side="right")
+        spans = [(start, end) for start, end in zip(starts.tolist(), ends.tolist()) if end > start]
+        if not spans:
+            return np.empty(0)
+        candidates = np.concatenate([np.arange(start, end) for start, end in spans])
+        
+        distances = haversine_km(lon, lat, self.lon[candidates], self.lat[candidates])
+        return distances[distances <= radius_km]
+
+def accessibility(grid: PointGrid, lon: Sequence[float], lat: Sequence[float], config: Mapping[str, float]) -> np.ndarray:
+    """
+    Distance-decayed POI accessibility (0-100) for each location
+    Distance-decayed POI accessibility for each location
+    """
+    access = np.zeros(len(lon))
+    for i, (x, y) in enumerate(zip(np.asarray(lon).tolist(), np.asarray(lat).tolist())):
+        distances = grid.within_radius(x, y, config["radius_km"])
+        access[i] = np.exp(-distances / config["decay_km"]).sum()
+    return 100.0 * (1.0 - np.exp(-access / config["saturation"]))
+
+def build_infrastructure_scores(index: SA2Index, points: Mapping[str, Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    """
+    Scores every SA2 centroid per POI category and combines them with the "infrastructure" weight profile
+    Categories without POI data score 0
+    """
+    rows = np.zeros(len(index), dtype=INFRASTRUCTURE_DTYPE)
+    rows["key"] = [encode_key(code) for code in index.codes.tolist()]
+    
+    for category, config in POI_CATEGORIES.items():
+        if category in points:
+            grid = PointGrid(*points[category])
+            rows[category] = accessibility(grid, index.lon, index.lat, config)
+            logger.info(f"Scored {category}: {len(grid)} POIs")
+    
+    weights = get_weight_profile("infrastructure")
+    rows["infrastructure_score"] = np.round(weights.dot_columns([rows[category] for category in weights.factors]), 1)
+    return rows
+
+class InfrastructureTable:
+    """
+    Read-only memory-mapped per-SA2 infrastructure scores
+    Lookups by SA2 code are O(1) through an in-memory key -> row mapping
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = np.load(path, mmap_mode="r", allow_pickle=False)
+        if self.rows.dtype != INFRASTRUCTURE_DTYPE:
+            raise ValueError(f"Unexpected infrastructure table layout in {path}: {self.rows.dtype}")
+        self._positions = {key.decode("utf-8"): i for i, key in enumerate(self.rows["key"].tolist())}
+    
+    def __len__(self) -> int:
+        return len(self.rows)
+    
+    def get(self, code: str) -> Optional[Dict[str, float]]:
+        position = self._positions.get(code)
+        if position is None:
+            return None
+        row = self.rows[position]
+        return {field: float(row[field]) for field in INFRASTRUCTURE_DTYPE.names[1:]}
+    
+    def scores(self, codes: Sequence[Optional[str]]) -> np.ndarray:
+        """
+        Infrastructure scores aligned with codes, NaN where unknown
+        Infrastructure scores for SA2 codes
+        """
+        positions = np.array([self._positions.get(code, -1) if code else -1 for code in codes], dtype=np.int64)
+        scores = np.full(len(codes), np.nan)
+        known = positions >= 0
+        scores[known] = self.rows["infrastructure_score"][positions[known]]
+        return scores
+
+_infrastructure_table: Optional[InfrastructureTable] = None
+_infrastructure_table_source: Optional[Tuple[str, tuple]] = None
+
+def _file_identity(path: str) -> tuple:
+    stat = os.stat(path)
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+def get_infrastructure_table() -> Optional[InfrastructureTable]:
+    """
+    Returns the process-wide infrastructure table, or None if it has not been built
+    Picks up a created or replaced file automatically; a missing file is not cached
+    """
+    global _infrastructure_table, _infrastructure_table_source
+    
+    path = Settings.INFRASTRUCTURE_TABLE_PATH
+    if not os.path.exists(path):
+        _infrastructure_table = _infrastructure_table_source = None
+        return None
+    
+    source = (path, _file_identity(path))
+    if _infrastructure_table is None or _infrastructure_table_source != source:
+        _infrastructure_table = InfrastructureTable(path)
+        _infrastructure_table_source = source
+    return _infrastructure_table
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build per-SA2 infrastructure scores from POI files")
+    parser.add_argument(
+        "--poi", action="append", default=[], metavar="CATEGORY=PATH",
+        help=f"POI file per category ({', '.join(POI_CATEGORIES)}); GeoJSON points or CSV with lon/lat"
+    )
+    parser.add_argument("--out", default=Settings.INFRASTRUCTURE_TABLE_PATH, help="Output table (.npy)")
+    return parser.parse_args()
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args()
+    points = {}
+    for spec in args.poi:
+        category, _, path = spec.partition("=")
+        if category not in POI_CATEGORIES:
+            raise SystemExit(f"Unknown POI category {category!r}; expected one of {', '.join(POI_CATEGORIES)}")
+        points[category] = load_points(path)
+    
+    rows = build_infrastructure_scores(get_sa2_index(), points)
+    write_rows(args.out, rows)
+    logger.info(f"Wrote infrastructure scores for {len(rows)} SA2 regions to {args.out}")
+
+if __name__ == "__main__":
+    main()
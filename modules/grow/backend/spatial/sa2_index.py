@@ -0,0 +1,337 @@
+"""
+Spatial index over SA2 centroids
+Spatial index over SA2 centroids for nearest, radius and bounding-box queries
+"""
+
+import heapq
+import json
+import math
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from ..shared.settings import Settings
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+
+def lonlat_to_unit(lon: Any, lat: Any) -> np.ndarray:
+    """
+    Converts longitude/latitude in degrees to 3D unit vectors
+    Euclidean (chord) distance between unit vectors is monotonic in great-circle distance
+    """
+    lon_rad = np.radians(np.asarray(lon, dtype=np.float64))
+    lat_rad = np.radians(np.asarray(lat, dtype=np.float64))
+    cos_lat = np.cos(lat_rad)
+    return np.stack([cos_lat * np.cos(lon_rad), cos_lat * np.sin(lon_rad), np.sin(lat_rad)], axis=-1)
+
+def _unit_tuple(lon: float, lat: float) -> Tuple[float, float, float]:
+    """
+    Scalar version of lonlat_to_unit without numpy call overhead
+    Scalar version of lonlat_to_unit
+    """
+    lon_rad = math.radians(lon)
+    lat_rad = math.radians(lat)
+    cos_lat = math.cos(lat_rad)
+    return (cos_lat * math.cos(lon_rad), cos_lat * math.sin(lon_rad), math.sin(lat_rad))
+
+def chord_to_km(chord: Any) -> Any:
+    """
+    Converts unit-sphere chord lengths to great-circle distances in km
+    Converts chord lengths to kilometres
+    """
+    return 2.0 * np.arcsin(np.minimum(np.asarray(chord) / 2.0, 1.0)) * EARTH_RADIUS_KM
+
+def km_to_chord(distance_km: float) -> float:
+    """
+    Converts great-circle distances in km to unit-sphere chord lengths
+    Converts kilometres to chord lengths
+    """
+    angle = min(distance_km / EARTH_RADIUS_KM, math.pi)
+    return 2.0 * math.sin(angle / 2.0)
+
+class SA2Index:
+    """
+    Array-backed KD-tree over SA2 centroids
+    Points live in contiguous arrays ordered by tree leaf; nodes are parallel arrays
+    """
+    
+    def __init__(
+        self,
+        codes: Sequence[str],
+        names: Sequence[str],
+        sa4_codes: Sequence[str],
+        states: Sequence[str],
+        lon: Sequence[float],
+        lat: Sequence[float],
+        leaf_size: int = 32
+    ):
+        if not (len(codes) == len(names) == len(sa4_codes) == len(states) == len(lon) == len(lat)):
+            raise ValueError("All SA2 columns must have the same length")
+        if len(codes) == 0:
+            raise ValueError("SA2 index needs at least one centroid")
+        
+        self.codes = np.asarray(codes, dtype=str)
+        self.names = np.asarray(names, dtype=str)
+        self.sa4_codes = np.asarray(sa4_codes, dtype=str)
+        self.states = np.asarray(states, dtype=str)
+        self.lon = np.asarray(lon, dtype=np.float64)
+        self.lat = np.asarray(lat, dtype=np.float64)
+        self.leaf_size = leaf_size
+        self._positions = {code: i for i, code in enumerate(self.codes.tolist())}
+        
+        self._build_tree(lonlat_to_unit(self.lon, self.lat))
+        
+        # Latitude-sorted view for bounding-box queries
+        self._lat_order = np.argsort(self.lat, kind="stable")
+        self._lat_sorted = self.lat[self._lat_order]
+    
+    @classmethod
+    def from_geojson(cls, path: Optional[str] = None, leaf_size: int = 32) -> "SA2Index":
+        """
+        Builds the index from the SA2 centroid GeoJSON
+        Features without point geometry (e.g. migratory/offshore regions) are skipped
+        """
+        path = path or Settings.SA2_CENTROIDS_PATH
+        with open(path, "r", encoding="utf-8") as f:
+            collection = json.load(f)
+        
+        columns: Dict[str, List[Any]] = {"codes": [], "names": [], "sa4_codes": [], "states": [], "lon": [], "lat": []}
+        skipped = 0
+        for feature in collection.get("features", []):
+            geometry = feature.get("geometry")
+            if not geometry or geometry.get("type") != "Point":
+                skipped += 1
+                continue
+            properties = feature.get("properties", {})
+            lon, lat = geometry["coordinates"][:2]
+            columns["codes"].append(properties.get("SA2_CODE21") or properties.get("code"))
+            columns["names"].append(properties.get("SA2_NAME21") or properties.get("name") or "")
+            columns["sa4_codes"].append(properties.get("SA4_CODE21") or "")
+            columns["states"].append(properties.get("STE_NAME21") or properties.get("state") or "")
+            columns["lon"].append(lon)
+            columns["lat"].append(lat)
+        
+        logger.info(f"Loaded {len(columns['codes'])} SA2 centroids ({skipped} without geometry)")
+        return cls(leaf_size=leaf_size, **columns)
+    
+    def __len__(self) -> int:
+        return len(self.codes)
+    
+    def _build_tree(self, xyz: np.ndarray) -> None:
+        """
+        Builds the KD-tree by median splits along the widest dimension
+        Builds the KD-tree
+        """
+        order = np.arange(len(xyz))
+        node_lo: List[np.ndarray] = []
+        node_hi: List[np.ndarray] = []
+        node_children: List[Tuple[int, int]] = []
+        node_ranges: List[Tuple[int, int]] = []
+        
+        def build(start: int, end: int) -> int:
+            points = xyz[order[start:end]]
+            lo = points.min(axis=0)
+            hi = points.max(axis=0)
+            node = len(node_lo)
+            node_lo.append(lo)
+            node_hi.append(hi)
+            node_children.append((-1, -1))
+            node_ranges.append((start, end))
+            
+            if end - start > self.leaf_size:
+                dim = int(np.argmax(hi - lo))
+                order[start:end] = order[start:end][np.argsort(points[:, dim], kind="stable")]
+                mid = (start + end) // 2
+                left = build(start, mid)
+                right = build(mid, end)
+                node_children[node] = (left, right)
+            
+            return node
+        
+        build(0, len(xyz))
+        
+        self._order = order
+        self._xyz = np.ascontiguousarray(xyz[order])
+        self._node_lo = np.array(node_lo)
+        self._node_hi = np.array(node_hi)
+        self._node_children = np.array(node_children, dtype=np.int32)
+        self._node_ranges = np.array(node_ranges, dtype=np.int32)
+        
+        # Plain-Python views of the (small) node arrays keep traversal free of numpy call overhead
+        self._nodes = [
+            (tuple(lo), tuple(hi), children[0], children[1], ranges[0], ranges[1])
+            for lo, hi, children, ranges in zip(
+                self._node_lo.tolist(), self._node_hi.tolist(),
+                self._node_children.tolist(), self._node_ranges.tolist()
+            )
+        ]
+    
+    @staticmethod
+    def _box_distance_sq(q: Tuple[float, float, float], lo: Tuple[float, ...], hi: Tuple[float, ...]) -> float:
+        total = 0.0
+        for value, low, high in zip(q, lo, hi):
+            if value < low:
+                total += (low - value) ** 2
+            elif value > high:
+                total += (value - high) ** 2
+        return total
+    
+    def nearest_indices(self, lon: float, lat: float, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the k nearest SA2 centroids
+        Returns (indices, distances_km), nearest first
+        """
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        k = min(k, len(self))
+        
+        q = _unit_tuple(lon, lat)
+        q_vec = np.array(q)
+        best: List[Tuple[float, int]] = []  # max-heap of (-distance_sq, position)
+        stack = [(0.0, 0)]
+        nodes = self._nodes
+        
+        while stack:
+            box_d2, node = stack.pop()
+            if len(best) == k and box_d2 >= -best[0][0]:
+                continue
+            
+            lo, hi, left, right, start, end = nodes[node]
+            if left < 0:
+                diff = self._xyz[start:end] - q_vec
+                d2 = np.einsum("ij,ij->i", diff, diff).tolist()
+                for offset, value in enumerate(d2):
+                    if len(best) < k:
+                        heapq.heappush(best, (-value, start + offset))
+                    elif value < -best[0][0]:
+                        heapq.heapreplace(best, (-value, start + offset))
+                continue
+            
+            left_d2 = self._box_distance_sq(q, nodes[left][0], nodes[left][1])
+            right_d2 = self._box_distance_sq(q, nodes[right][0], nodes[right][1])
+            # Visit the nearer child first (pushed last)
+            if left_d2 <= right_d2:
+                stack.append((right_d2, right))
+                stack.append((left_d2, left))
+            else:
+                stack.append((left_d2, left))
+                stack.append((right_d2, right))
+        
+        best.sort(key=lambda item: (-item[0], item[1]))
+        positions = np.array([position for _, position in best], dtype=np.int64)
+        distances = chord_to_km(np.sqrt(np.array([-d2 for d2, _ in best])))
+        return self._order[positions], distances
+    
+    def within_radius_indices(self, lon: float, lat: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds all SA2 centroids within a great-circle radius
+        Returns (indices, distances_km), nearest first
+        """
+        q = _unit_tuple(lon, lat)
+        q_vec = np.array(q)
+        r2 = km_to_chord(radius_km) ** 2
+        nodes = self._nodes
+        
+        hits: List[np.ndarray] = []
+        hit_d2: List[np.ndarray] = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            lo, hi, left, right, start, end = nodes[node]
+            if self._box_distance_sq(q, lo, hi) > r2:
+                continue
+            if left >= 0:
+                stack.append(right)
+                stack.append(left)
+                continue
+            diff = self._xyz[start:end] - q_vec
+            d2 = np.einsum("ij,ij->i", diff, diff)
+            mask = d2 <= r2
+            if mask.any():
+                hits.append(np.nonzero(mask)[0] + start)
+                hit_d2.append(d2[mask])
+        
+        if not hits:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        
+        positions = np.concatenate(hits)
+        d2 = np.concatenate(hit_d2)
+        ranking = np.argsort(d2, kind="stable")
+        return self._order[positions[ranking]], chord_to_km(np.sqrt(d2[ranking]))
+    
+    def within_bbox_indices(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> np.ndarray:
+        """
+        Finds all SA2 centroids inside a lon/lat bounding box
+        A box with min_lon > max_lon wraps across the antimeridian
+        """
+        lo = np.searchsorted(self._lat_sorted, min_lat, side="left")
+        hi = np.searchsorted(self._lat_sorted, max_lat, side="right")
+        candidates = self._lat_order[lo:hi]
+        lon = self.lon[candidates]
+        
+        if min_lon <= max_lon:
+            mask = (lon >= min_lon) & (lon <= max_lon)
+        else:
+            mask = (lon >= min_lon) | (lon <= max_lon)
+        
+        return np.sort(candidates[mask])
+    
+    def records(self, indices: Sequence[int], distances_km: Optional[Sequence[float]] = None) -> List[Dict[str, Any]]:
+        """
+        Converts index positions into SA2 record dicts
+        Converts index positions into SA2 record dicts
+        """
+        results = []
+        for n, i in enumerate(indices):
+            record = {
+                "code": str(self.codes[i]),
+                "name": str(self.names[i]),
+                "sa4_code": str(self.sa4_codes[i]),
+                "state": str(self.states[i]),
+                "lon": float(self.lon[i]),
+                "lat": float(self.lat[i])
+            }
+            if distances_km is not None:
+                record["distance_km"] = float(distances_km[n])
+            results.append(record)
+        return results
+    
+    def position(self, code: str) -> Optional[int]:
+        """
+        Returns the array position of an SA2 code, or None
+        Returns the array position of an SA2 code
+        """
+        return self._positions.get(code)
+    
+    def nearest(self, lon: float, lat: float, k: int = 1) -> List[Dict[str, Any]]:
+        """
+        Returns the k nearest SA2 regions as dicts
+        Returns the k nearest SA2 regions
+        """
+        return self.records(*self.nearest_indices(lon, lat, k))
+    
+    def within_radius(self, lon: float, lat: float, radius_km: float) -> List[Dict[str, Any]]:
+        """
+        Returns all SA2 regions within a radius as dicts
+        Returns all SA2 regions within a radius
+        """
+        return self.records(*self.within_radius_indices(lon, lat, radius_km))
+    
+    def within_bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[Dict[str, Any]]:
+        """
+        Returns all SA2 regions inside a bounding box as dicts
+        Returns all SA2 regions inside a bounding box
+        """
+        return self.records(self.within_bbox_indices(min_lon, min_lat, max_lon, max_lat))
+
+@lru_cache(maxsize=1)
+def get_sa2_index() -> SA2Index:
+    """
+    Returns the process-wide SA2 index, loading it on first use
+    Returns the shared SA2 index
+    """
+    return SA2Index.from_geojson()
@@ -1,70 +1,182 @@
 """
 Strategy recommendations based on scoring results
-Strategy recommendations based on scoring results
+Recommendations come from a declarative rule table compiled once into threshold arrays
 """
 
-from typing import List, Dict, Any
+import sys
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Each timeframe reads one field of the scoring data and maps it onto tiers, worst tier first.
+# "above" rules pick the tier of the highest threshold the value strictly exceeds;
+# "grades" rules pick the tier listing the value, falling back to the first tier.
+STRATEGY_RULES: Dict[str, Dict[str, Any]] = {
+    "short_term": {
+        "field": ("overall_score",),
+        "default": 0,
+        "above": (
+            (None, ("Urgent renovation measures required", "Review investment strategy")),
+            (60, ("Basic maintenance", "Market analysis for sales options")),
+            (80, ("Focus on renovation for value appreciation", "Optimize rental income"))
+        )
+    },
+    "medium_term": {
+        "field": ("growth_potential",),
+        "default": "",
+        "grades": (
+            ((), ("Review holding strategy", "Develop exit strategy")),
+            (("B+", "B"), ("Moderate renovations for value appreciation", "Consider portfolio diversification")),
+            (("A+", "A"), ("Long-term rental for stable cash flows", "Leverage value appreciation through market growth"))
+        )
+    },
+    "long_term": {
+        "field": ("metrics", "market_trends"),
+        "default": 0,
+        "above": (
+            (None, ("Exit strategy for weak markets", "Reallocation to stronger markets")),
+            (60, ("Stable rental for consistent returns", "Selective renovations for value appreciation")),
+            (80, ("Maximize value appreciation through market growth", "Portfolio expansion in the region"))
+        )
+    }
+}
+
+class CompiledRule:
+    """
+    One STRATEGY_RULES entry compiled into sorted arrays and interned recommendation tuples
+    Scalar lookups are direct comparisons, batches use np.searchsorted on the same thresholds
+    """
+    
+    def __init__(self, spec: Mapping[str, Any]):
+        self.field: Tuple[str, ...] = tuple(spec["field"])
+        self.default = spec["default"]
+        
+        if "above" in spec:
+            tiers = spec["above"]
+            self.thresholds: Optional[Tuple[float, ...]] = tuple(bound for bound, _ in tiers[1:])
+            self.threshold_array = np.array(self.thresholds, dtype=np.float64)
+            self.grade_tiers: Dict[str, int] = {}
+            self.grade_sets: Tuple[Tuple[str, ...], ...] = ()
+        else:
+            tiers = spec["grades"]
+            self.thresholds = None
+            self.threshold_array = None
+            self.grade_tiers = {grade: tier for tier, (grades, _) in enumerate(tiers) for grade in grades}
+            self.grade_sets = tuple(tuple(grades) for grades, _ in tiers)
+        
+        self.recommendations: Tuple[Tuple[str, ...], ...] = tuple(
+            tuple(sys.intern(text) for text in texts) for _, texts in tiers
+        )
+        # Sorted grade keys and their tiers, for searchsorted over string batches
+        self.grade_keys = np.array(sorted(self.grade_tiers), dtype=str)
+        self.grade_codes = np.array([self.grade_tiers[grade] for grade in self.grade_keys.tolist()], dtype=np.intp)
+        self.recommend = self._compile_recommend()
+    
+    def _compile_recommend(self) -> Callable[[Mapping[str, Any]], List[str]]:
+        """
+        Builds the scalar lookup as one closure of direct comparisons over the compiled tiers
+        Two-threshold and three-tier grade rules one or two levels deep are unrolled; other shapes loop over the tiers
+        """
+        low, middle, high = (self.recommendations + (None, None, None))[:3]
+        field = self.field[-1]
+        parent = self.field[0] if len(self.field) == 2 else None
+        default = self.default
+        
+        if len(self.field) > 2:
+            raise ValueError(f"Strategy rule fields are at most two levels deep, got {self.field}")
+        
+        if self.thresholds is not None and len(self.thresholds) == 2:
+            # Strict ">" as in the original ladders; NaN compares False and lands in the first tier
+            lower, upper = self.thresholds
+            if parent is None:
+                def recommend(scoring_data):
+                    value = scoring_data.get(field, default)
+                    return [*(high if value > upper else middle if value > lower else low)]
+            else:
+                def recommend(scoring_data):
+                    value = scoring_data.get(parent, {}).get(field, default)
+                    return [*(high if value > upper else middle if value > lower else low)]
+            return recommend
+        
+        if self.thresholds is None and len(self.grade_sets) == 3:
+            # Tuple membership compares by equality, so unhashable values simply match no grade
+            middle_grades, high_grades = self.grade_sets[1:]
+            if parent is None:
+                def recommend(scoring_data):
+                    value = scoring_data.get(field, default)
+                    return [*(high if value in high_grades else middle if value in middle_grades else low)]
+            else:
+                def recommend(scoring_data):
+                    value = scoring_data.get(parent, {}).get(field, default)
+                    return [*(high if value in high_grades else middle if value in middle_grades else low)]
+            return recommend
+        
+        recommendations = self.recommendations
+        thresholds = self.thresholds
+        grade_sets = self.grade_sets
+        
+        def recommend(scoring_data):
+            value = scoring_data.get(parent, {}).get(field, default) if parent is not None else scoring_data.get(field, default)
+            tier = 0
+            if thresholds is not None:
+                while tier < len(thresholds) and value > thresholds[tier]:
+                    tier += 1
+            else:
+                tier = next((t for t in range(len(grade_sets) - 1, 0, -1) if value in grade_sets[t]), 0)
+            return [*recommendations[tier]]
+        return recommend
+    
+    def tiers(self, values: Any) -> np.ndarray:
+        """
+        Tier index per field value, computed with np.searchsorted
+        Missing (NaN) scores fall into the first tier, as in the scalar comparison
+        """
+        if self.thresholds is not None:
+            values = np.asarray(values, dtype=np.float64)
+            tiers = np.searchsorted(self.threshold_array, values, side="left")
+            tiers[np.isnan(values)] = 0
+            return tiers
+        
+        values = np.asarray(values).astype(str)
+        if not len(self.grade_keys):
+            return np.zeros(len(values), dtype=np.intp)
+        index = np.minimum(np.searchsorted(self.grade_keys, values), len(self.grade_keys) - 1)
+        return np.where(self.grade_keys[index] == values, self.grade_codes[index], 0)
+    
+    def recommend_batch(self, values: Any) -> List[Tuple[str, ...]]:
+        """
+        Recommendations for a batch of field values
+        Entries are the shared interned tuples, not copies
+        """
+        recommendations = self.recommendations
+        return [recommendations[tier] for tier in self.tiers(values).tolist()]
+
+RULES: Dict[str, CompiledRule] = {timeframe: CompiledRule(spec) for timeframe, spec in STRATEGY_RULES.items()}
+
+_recommend_short_term = RULES["short_term"].recommend
+_recommend_medium_term = RULES["medium_term"].recommend
+_recommend_long_term = RULES["long_term"].recommend
 
 def generate_short_term_strategy(scoring_data: Dict[str, Any]) -> List[str]:
     """
     Generates short-term strategy recommendations (1-2 years)
     Generates short-term strategy recommendations
     """
-    recommendations = []
-    
-    if scoring_data.get("overall_score", 0) > 80:
-        recommendations.append("Focus on renovation for value appreciation")
-        recommendations.append("Optimize rental income")
-    elif scoring_data.get("overall_score", 0) > 60:
-        recommendations.append("Basic maintenance")
-        recommendations.append("Market analysis for sales options")
-    else:
-        recommendations.append("Urgent renovation measures required")
-        recommendations.append("Review investment strategy")
-    
-    return recommendations
+    return _recommend_short_term(scoring_data)
 
 def generate_medium_term_strategy(scoring_data: Dict[str, Any]) -> List[str]:
     """
     Generates medium-term strategy recommendations (3-5 years)
     Generates medium-term strategy recommendations
     """
-    recommendations = []
-    
-    growth_potential = scoring_data.get("growth_potential", "")
-    
-    if growth_potential in ["A+", "A"]:
-        recommendations.append("Long-term rental for stable cash flows")
-        recommendations.append("Leverage value appreciation through market growth")
-    elif growth_potential in ["B+", "B"]:
-        recommendations.append("Moderate renovations for value appreciation")
-        recommendations.append("Consider portfolio diversification")
-    else:
-        recommendations.append("Review holding strategy")
-        recommendations.append("Develop exit strategy")
-    
-    return recommendations
+    return _recommend_medium_term(scoring_data)
 
 def generate_long_term_strategy(scoring_data: Dict[str, Any]) -> List[str]:
     """
     Generates long-term strategy recommendations (5+ years)
     Generates long-term strategy recommendations
     """
-    recommendations = []
-    
-    market_trends = scoring_data.get("metrics", {}).get("market_trends", 0)
-    
-    if market_trends > 80:
-        recommendations.append("Maximize value appreciation through market growth")
-        recommendations.append("Portfolio expansion in the region")
-    elif market_trends > 60:
-        recommendations.append("Stable rental for consistent returns")
-        recommendations.append("Selective renovations for value appreciation")
-    else:
-        recommendations.append("Exit strategy for weak markets")
-        recommendations.append("Reallocation to stronger markets")
-    
-    return recommendations
+    return _recommend_long_term(scoring_data)
 
 def get_comprehensive_strategy(scoring_data: Dict[str, Any]) -> Dict[str, List[str]]:
     """
@@ -72,7 +184,22 @@ def get_comprehensive_strategy(scoring_data: Dict[str, Any]) -> Dict[str, List[s
     Returns comprehensive strategy recommendations for all timeframes
     """
     return {
-        "short_term": generate_short_term_strategy(scoring_data),
-        "medium_term": generate_medium_term_strategy(scoring_data),
-        "long_term": generate_long_term_strategy(scoring_data)
-    } 
\ No newline at end of file
+        "short_term": _recommend_short_term(scoring_data),
+        "medium_term": _recommend_medium_term(scoring_data),
+        "long_term": _recommend_long_term(scoring_data)
+    }
+
+def get_comprehensive_strategy_batch(
+    overall_scores: Sequence[float],
+    growth_potentials: Sequence[str],
+    market_trends: Sequence[float]
+) -> Dict[str, List[Tuple[str, ...]]]:
+    """
+    Vectorized counterpart of get_comprehensive_strategy for N scoring results given as columns
+    Returns one recommendation tuple per result and timeframe; NaN marks a missing score
+    """
+    return {
+        "short_term": RULES["short_term"].recommend_batch(overall_scores),
+        "medium_term": RULES["medium_term"].recommend_batch(growth_potentials),
+        "long_term": RULES["long_term"].recommend_batch(market_trends)
+    }
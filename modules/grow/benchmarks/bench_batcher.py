@@ -0,0 +1,59 @@
+"""
+Benchmark for scoring request micro-batching
+Compares per-request scoring with the micro-batcher under a burst of concurrent requests
+
+Usage: python benchmarks/bench_batcher.py [requests] [distinct_suburbs]
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add module path to sys.path (the batcher is used by the package-relative API)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring.batcher import MicroBatcher
+from backend.scoring.main import ScoringRequest, score_requests
+
+def make_requests(count, distinct):
+    return [
+        ScoringRequest(address=f"{i} Example Street", suburb=f"Suburb {i % distinct}", postcode="3000", property_type="residential")
+        for i in range(count)
+    ]
+
+async def timed(handler, request, latencies):
+    start = time.perf_counter()
+    await handler(request)
+    latencies.append(time.perf_counter() - start)
+
+async def burst(handler, requests):
+    latencies = []
+    await asyncio.gather(*(timed(handler, request, latencies) for request in requests))
+    return np.array(latencies)
+
+async def per_request(request):
+    # What the endpoint did before: one scoring call per request
+    await asyncio.sleep(0)
+    return score_requests([request])[0]
+
+def report(label, latencies):
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(f"{label:<16}p50 {p50:>8.2f} ms    p99 {p99:>8.2f} ms")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    requests = make_requests(count, distinct)
+    score_requests(requests[:10])
+    
+    batcher = MicroBatcher(score_requests, window=0.002)
+    print(f"burst of {count:,} concurrent requests over {distinct} suburbs")
+    report("per request", asyncio.run(burst(per_request, requests)))
+    report("micro-batched", asyncio.run(burst(batcher.submit, requests)))
+    print(f"scoring calls: {count:,} -> {batcher.stats['batches']}, rows scored: {count:,} -> {batcher.stats['scored']}")
+
+if __name__ == "__main__":
+    main()
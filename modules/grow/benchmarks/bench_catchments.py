@@ -0,0 +1,74 @@
+"""
+Benchmark for school catchment lookups
+Compares the R-tree + prepared geometry batch query with a per-point scan of all catchments
+
+Usage: python benchmarks/bench_catchments.py [catchments] [points]
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add module path to sys.path (the engine uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.spatial.catchments import CatchmentIndex, PreparedPolygon
+
+def make_catchments(count, rng, vertices=200):
+    # Star-shaped polygons scattered over the Sydney basin, roughly catchment sized
+    geometries = []
+    for lon, lat in zip(rng.uniform(150.5, 151.5, count), rng.uniform(-34.3, -33.4, count)):
+        angles = np.sort(rng.uniform(0, 2 * np.pi, vertices))
+        radii = rng.uniform(0.01, 0.03) * rng.uniform(0.6, 1.0, vertices)
+        ring = np.column_stack([lon + radii * np.cos(angles), lat + radii * np.sin(angles)])
+        geometries.append([np.vstack([ring, ring[:1]])])
+    return geometries
+
+def scan(rings_list, x, y):
+    # Baseline: every point against every catchment's bounding box, then all its edges
+    counts = np.zeros(len(x), dtype=np.int64)
+    for rings in rings_list:
+        ring = rings[0]
+        inside_box = (x >= ring[:, 0].min()) & (x <= ring[:, 0].max()) & (y >= ring[:, 1].min()) & (y <= ring[:, 1].max())
+        for i in np.flatnonzero(inside_box):
+            x0, y0 = ring[:-1, 0], ring[:-1, 1]
+            x1, y1 = ring[1:, 0], ring[1:, 1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                crossing = ((y0 > y[i]) != (y1 > y[i])) & (x[i] < x0 + (y[i] - y0) * (x1 - x0) / (y1 - y0))
+            counts[i] += np.count_nonzero(crossing) % 2
+    return counts
+
+def report(label, elapsed, count):
+    print(f"{label:<28}{count / elapsed:>12,.0f} points/s{elapsed / count * 1e6:>10.1f} us/point")
+
+def main():
+    catchments = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 50000
+    rng = np.random.default_rng(42)
+    rings_list = make_catchments(catchments, rng)
+    x = rng.uniform(150.5, 151.5, count)
+    y = rng.uniform(-34.3, -33.4, count)
+    
+    start = time.perf_counter()
+    index = CatchmentIndex([{"catchment_id": str(i)} for i in range(catchments)], [PreparedPolygon(rings) for rings in rings_list])
+    print(f"built index over {catchments:,} catchments in {time.perf_counter() - start:.2f}s")
+    
+    start = time.perf_counter()
+    fast = index.counts(x, y)
+    fast_elapsed = time.perf_counter() - start
+    
+    sample = min(count, 5000)
+    start = time.perf_counter()
+    slow = scan(rings_list, x[:sample], y[:sample])
+    scan_elapsed = time.perf_counter() - start
+    
+    assert fast[:sample].tolist() == slow.tolist()
+    print(f"{count:,} points, {int((fast > 0).sum()):,} inside at least one catchment")
+    report("bbox scan + ray cast", scan_elapsed, sample)
+    report("R-tree + prepared", fast_elapsed, count)
+    print(f"speedup: {(scan_elapsed / sample) / (fast_elapsed / count):.1f}x")
+
+if __name__ == "__main__":
+    main()
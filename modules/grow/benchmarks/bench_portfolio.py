@@ -0,0 +1,64 @@
+"""
+Benchmark for portfolio rollups
+Compares the incremental update and summary cost with a full recompute as portfolios grow
+
+Usage: python benchmarks/bench_portfolio.py [max_holdings]
+"""
+
+import random
+import sys
+import os
+import time
+
+# Add module path to sys.path (the portfolio service uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.portfolio.aggregates import Portfolio
+
+def make_holding(rng, property_id):
+    score = rng.uniform(30.0, 100.0)
+    return {
+        "property_id": property_id,
+        "suburb": f"Suburb {rng.randrange(2000)}",
+        "sa2_code": None,
+        "sa4_code": str(rng.randrange(100)),
+        "value": rng.uniform(2e5, 3e6),
+        "overall_score": score,
+        "growth_potential": "A" if score >= 75 else "B",
+        "risk_level": "Low" if score >= 75 else "Medium",
+        "growth": rng.gauss(0.05, 0.08),
+        "rental_yield": rng.uniform(0.02, 0.06)
+    }
+
+def per_call(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+def main():
+    max_holdings = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    rng = random.Random(0)
+    portfolio = Portfolio("bench")
+    
+    print(f"{'holdings':>10}{'rescore+summary':>18}{'full recompute':>18}")
+    size = 1000
+    while size <= max_holdings:
+        for i in range(len(portfolio), size):
+            portfolio.upsert(make_holding(rng, str(i)))
+        
+        def rescore():
+            portfolio.upsert(make_holding(rng, str(rng.randrange(size))))
+            portfolio.summary()
+        
+        def recompute():
+            portfolio.rebuild()
+            portfolio.summary()
+        
+        incremental = per_call(rescore, 200)
+        full = per_call(recompute, 1)
+        print(f"{size:>10,}{incremental * 1e6:>15.1f} µs{full * 1e3:>15.1f} ms")
+        size *= 10
+
+if __name__ == "__main__":
+    main()
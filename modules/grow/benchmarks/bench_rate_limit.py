@@ -0,0 +1,52 @@
+"""
+Benchmark for the rate limit middleware
+Measures the per-request overhead the middleware adds in front of a no-op ASGI app
+
+Usage: python benchmarks/bench_rate_limit.py [requests] [clients]
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add module path to sys.path (the limiter uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.shared.rate_limit import InMemoryRateLimitBackend, RateLimitMiddleware
+
+async def noop_app(scope, receive, send):
+    pass
+
+async def receive():
+    return {"type": "http.request", "body": b""}
+
+async def send(message):
+    pass
+
+async def drive(app, scopes):
+    start = time.perf_counter()
+    for scope in scopes:
+        await app(scope, receive, send)
+    return time.perf_counter() - start
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    scopes = [
+        {"type": "http", "path": "/api/scoring", "client": (f"10.0.{i // 256 % 256}.{i % 256}", 50000)}
+        for i in range(clients)
+    ]
+    scopes = [scopes[i % clients] for i in range(count)]
+    # Allowance large enough that every request passes, so only the bookkeeping is measured
+    middleware = RateLimitMiddleware(noop_app, InMemoryRateLimitBackend(requests=count, window=60))
+    
+    baseline = asyncio.run(drive(noop_app, scopes))
+    limited = asyncio.run(drive(middleware, scopes))
+    print(f"{count:,} requests from {clients:,} clients")
+    print(f"{'no middleware':<20}{baseline / count * 1e9:>10.0f} ns/request")
+    print(f"{'rate limited':<20}{limited / count * 1e9:>10.0f} ns/request")
+    print(f"overhead: {(limited - baseline) / count * 1e9:.0f} ns/request")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark for record types
+Compares memory per 1M records and construction throughput of pydantic models,
+slotted records and struct-of-arrays batches
+
+Usage: python benchmarks/bench_records.py [count]
+"""
+
+import gc
+import sys
+import os
+import time
+import tracemalloc
+
+# Add module path to sys.path (the records use package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.shared.models import PropertyData
+from backend.shared.records import PropertyBatch, PropertyRecord
+
+SUBURBS = ["Parramatta", "Fitzroy", "Toowong", "Subiaco", "Glenelg", "Sandy Bay", "Braddon"]
+
+def make_rows(count):
+    return [
+        {
+            "id": f"p{i}",
+            "address": f"{i} Example Street",
+            "suburb": SUBURBS[i % len(SUBURBS)],
+            "postcode": str(2000 + i % 5000),
+            "property_type": "residential",
+            "current_price": 500000.0 + i,
+            "previous_price": 480000.0 + i,
+            "bedrooms": 1 + i % 5,
+            "bathrooms": 1 + i % 3,
+            "land_size": 300.0 + i % 700,
+            "build_year": 1950 + i % 70,
+            "last_renovation": None
+        }
+        for i in range(count)
+    ]
+
+def measure(label, build, rows):
+    # Time without tracing, then measure memory in a separate traced run
+    gc.collect()
+    start = time.perf_counter()
+    result = build(rows)
+    elapsed = time.perf_counter() - start
+    del result
+    
+    gc.collect()
+    tracemalloc.start()
+    result = build(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    per_record = current / len(rows)
+    print(
+        f"{label:<22} {per_record:8.0f} B/record  {per_record * 1e6 / 2**20:9.1f} MiB per 1M"
+        f"  {len(rows) / elapsed:12,.0f} records/s"
+    )
+    del result
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = make_rows(count)
+    print(f"{count:,} records (memory excludes the shared input dicts)")
+    
+    measure("pydantic PropertyData", lambda rows: [PropertyData(**row) for row in rows], rows)
+    measure("PropertyRecord", lambda rows: [PropertyRecord(**row) for row in rows], rows)
+    measure("PropertyBatch", PropertyBatch.from_rows, rows)
+
+if __name__ == "__main__":
+    main()
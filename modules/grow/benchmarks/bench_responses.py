@@ -0,0 +1,62 @@
+"""
+Benchmark for scoring response serialization
+Compares FastAPI's default response_model path with ScoringResultResponse
+
+Usage: python benchmarks/bench_responses.py [count]
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Add module path to sys.path (the responses use package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from backend.scoring.main import app, score_requests, ScoringRequest
+from backend.scoring.responses import ScoringResultResponse
+
+def make_results(count):
+    requests = [
+        ScoringRequest(address=f"{i} Example Street", suburb="Fitzroy", postcode="3065", property_type="residential")
+        for i in range(count)
+    ]
+    return score_requests(requests)
+
+def default_path(field, results):
+    async def render_all():
+        for result in results:
+            content = await serialize_response(field=field, response_content=result)
+            JSONResponse(content)
+    asyncio.run(render_all())
+
+def fast_path(results):
+    for result in results:
+        ScoringResultResponse(result)
+
+def report(label, elapsed, count):
+    print(f"{label:<28}{count / elapsed:>12,.0f} responses/s{elapsed / count * 1e6:>10.1f} us/response")
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    results = make_results(count)
+    field = next(route.response_field for route in app.routes if getattr(route, "path", None) == "/api/scoring")
+    
+    start = time.perf_counter()
+    default_path(field, results)
+    default_elapsed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    fast_path(results)
+    fast_elapsed = time.perf_counter() - start
+    
+    print(f"{count:,} ScoringResult responses")
+    report("default response_model", default_elapsed, count)
+    report("ScoringResultResponse", fast_elapsed, count)
+    print(f"speedup: {default_elapsed / fast_elapsed:.1f}x")
+
+if __name__ == "__main__":
+    main()
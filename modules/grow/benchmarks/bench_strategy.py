@@ -0,0 +1,47 @@
+"""
+Benchmark for the strategy rule engine
+Compares per-result get_comprehensive_strategy calls with the vectorized batch lookup
+
+Usage: python benchmarks/bench_strategy.py [results]
+"""
+
+import sys
+import os
+import time
+
+import numpy as np
+
+# Add module path to sys.path (the strategy engine is used by the package-relative API)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.strategy.suggest import get_comprehensive_strategy, get_comprehensive_strategy_batch
+
+GRADES = np.array(["A+", "A", "B+", "B", "C"])
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    rng = np.random.default_rng(0)
+    overall_scores = np.round(rng.uniform(30.0, 100.0, count), 1)
+    growth_potentials = GRADES[rng.integers(0, len(GRADES), count)]
+    market_trends = np.round(rng.uniform(30.0, 100.0, count), 1)
+    scoring_data = [
+        {"overall_score": score, "growth_potential": grade, "metrics": {"market_trends": trends}}
+        for score, grade, trends in zip(overall_scores.tolist(), growth_potentials.tolist(), market_trends.tolist())
+    ]
+    
+    start = time.perf_counter()
+    for data in scoring_data:
+        get_comprehensive_strategy(data)
+    scalar = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    get_comprehensive_strategy_batch(overall_scores, growth_potentials, market_trends)
+    batch = time.perf_counter() - start
+    
+    print(f"{count:,} scoring results")
+    print(f"{'per result':<20}{scalar:>8.3f} s{count / scalar:>14,.0f} /s")
+    print(f"{'batch':<20}{batch:>8.3f} s{count / batch:>14,.0f} /s")
+    print(f"speedup: {scalar / batch:.1f}x")
+
+if __name__ == "__main__":
+    main()
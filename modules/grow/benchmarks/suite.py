@@ -0,0 +1,355 @@
+"""
+Reproducible benchmark suite
+Times the scoring, strategy, alert and loader hot paths on synthetic properties drawn from the SA2 centroids,
+and flags throughput regressions against a JSON baseline
+
+Usage: python benchmarks/suite.py [--sizes 1k,100k,1m] [--cases NAME,...] [--baseline PATH]
+                                  [--save-baseline] [--tolerance 0.2] [--repeat 5] [--rounds 3]
+"""
+
+import argparse
+import json
+import platform
+import sys
+import os
+import timeit
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+# Add module path to sys.path (the backend uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.alerts.check import AlertChecker
+from backend.scoring.logic.scoring_algorithms import calculate_overall_score
+from backend.spatial.sa2_index import SA2Index, get_sa2_index
+from backend.strategy.suggest import get_comprehensive_strategy
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# Records are generated and timed in chunks so 1M properties fit in memory
+CHUNK_SIZE = 50_000
+
+# Only these sizes are compared against the baseline; 1k runs take milliseconds and are a smoke test
+REGRESSION_SIZES = ("100k", "1m")
+
+DEFAULT_SEED = 20240601
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "scripts")
+
+GROWTH_GRADES = ("A+", "A", "B+", "B", "C")
+
+def generate_columns(index: SA2Index, start: int, count: int, seed: int = DEFAULT_SEED) -> Dict[str, np.ndarray]:
+    """
+    Synthetic property attributes for records [start, start + count), each placed in a random SA2
+    Seeded by (seed, start), so any chunk can be regenerated on its own
+    """
+    rng = np.random.default_rng([seed, start])
+    sa2 = rng.integers(0, len(index), count)
+    price = np.round(rng.lognormal(13.4, 0.5, count), -3)
+    change = rng.normal(0.02, 0.06, count)
+    return {
+        "sa2": sa2,
+        "lon": index.lon[sa2] + rng.normal(0.0, 0.01, count),
+        "lat": index.lat[sa2] + rng.normal(0.0, 0.01, count),
+        "current_price": price,
+        "previous_price": np.round(price / (1.0 + change), -3),
+        "price_growth_1y": rng.normal(0.05, 0.08, count),
+        "volatility": rng.gamma(2.0, 0.05, count),
+        "infrastructure_score": np.where(rng.random(count) < 0.2, np.nan, rng.uniform(40.0, 100.0, count)),
+        "maintenance_days": rng.integers(-10, 365, count),
+        "overall_score": np.round(rng.uniform(30.0, 100.0, count), 1),
+        "market_trends": np.round(rng.uniform(30.0, 100.0, count), 1),
+        "growth_grade": rng.integers(0, len(GROWTH_GRADES), count),
+        "icsea": rng.integers(800, 1200, count),
+        "enrolments": rng.integers(20, 2000, count),
+        "missing": rng.random(count) < 0.1
+    }
+
+def property_records(index: SA2Index, start: int, columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    names = index.names[columns["sa2"]].tolist()
+    return [
+        {
+            "id": f"p{start + i}",
+            "address": f"{start + i} Example Street",
+            "suburb": name,
+            "property_type": "residential",
+            "current_price": current,
+            "previous_price": previous,
+            "price_growth_1y": growth,
+            "volatility": volatility,
+            "infrastructure_score": infrastructure
+        }
+        for i, (name, current, previous, growth, volatility, infrastructure) in enumerate(zip(
+            names,
+            columns["current_price"].tolist(),
+            columns["previous_price"].tolist(),
+            columns["price_growth_1y"].tolist(),
+            columns["volatility"].tolist(),
+            columns["infrastructure_score"].tolist()
+        ))
+    ]
+
+def strategy_inputs(index: SA2Index, start: int, columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    return [
+        {"overall_score": score, "growth_potential": GROWTH_GRADES[grade], "metrics": {"market_trends": trends}}
+        for score, grade, trends in zip(
+            columns["overall_score"].tolist(), columns["growth_grade"].tolist(), columns["market_trends"].tolist()
+        )
+    ]
+
+def alert_inputs(index: SA2Index, start: int, columns: Dict[str, np.ndarray]) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    now = datetime.now()
+    codes = index.codes[columns["sa2"]].tolist()
+    return [
+        (
+            {
+                "id": f"p{start + i}",
+                "current_price": current,
+                "previous_price": previous,
+                "next_maintenance_date": now + timedelta(days=days)
+            },
+            {"id": code, "volatility": volatility}
+        )
+        for i, (code, current, previous, days, volatility) in enumerate(zip(
+            codes,
+            columns["current_price"].tolist(),
+            columns["previous_price"].tolist(),
+            columns["maintenance_days"].tolist(),
+            columns["volatility"].tolist()
+        ))
+    ]
+
+def school_records(index: SA2Index, start: int, columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    # Shaped like the schools dataset loaded by scripts/load_json_to_dynamodb.py
+    sa2 = columns["sa2"]
+    return [
+        {
+            "School_code": str(40000 + start + i),
+            "School_name": f"{name} Public School",
+            "Suburb": name,
+            "State": state,
+            "ICSEA": "np" if missing else str(icsea),
+            "Total_enrolments": "" if missing else str(enrolments),
+            "Latitude": f"{lat:.6f}",
+            "Longitude": f"{lon:.6f}"
+        }
+        for i, (name, state, icsea, enrolments, missing, lat, lon) in enumerate(zip(
+            index.names[sa2].tolist(),
+            index.states[sa2].tolist(),
+            columns["icsea"].tolist(),
+            columns["enrolments"].tolist(),
+            columns["missing"].tolist(),
+            columns["lat"].tolist(),
+            columns["lon"].tolist()
+        ))
+    ]
+
+def _overall_score_case() -> Tuple[Callable, Callable]:
+    def run(records):
+        for record in records:
+            calculate_overall_score(record)
+    return property_records, run
+
+def _strategy_case() -> Tuple[Callable, Callable]:
+    def run(inputs):
+        for scoring_data in inputs:
+            get_comprehensive_strategy(scoring_data)
+    return strategy_inputs, run
+
+def _alerts_case() -> Tuple[Callable, Callable]:
+    checker = AlertChecker()
+    
+    def run(pairs):
+        for property_data, market_data in pairs:
+            checker.check_all_alerts(property_data, market_data)
+    return alert_inputs, run
+
+def _coerce_item_case() -> Tuple[Callable, Callable]:
+    sys.path.insert(0, SCRIPTS_DIR)
+    from load_json_to_dynamodb import SchemaCoercer, coerce_item
+    
+    # Same as the loader: a coercer inferred from the first records
+    coercer: Dict[str, Any] = {}
+    
+    def run(records):
+        if "value" not in coercer:
+            coercer["value"] = SchemaCoercer.infer(records[:200])
+        for raw in records:
+            coerce_item(raw, coercer["value"])
+    return school_records, run
+
+CASES: Dict[str, Callable[[], Tuple[Callable, Callable]]] = {
+    "calculate_overall_score": _overall_score_case,
+    "get_comprehensive_strategy": _strategy_case,
+    "AlertChecker.check_all_alerts": _alerts_case,
+    "coerce_item": _coerce_item_case
+}
+
+def time_case(
+    index: SA2Index,
+    build: Callable,
+    run: Callable,
+    size: int,
+    repeat: int = 5,
+    seed: int = DEFAULT_SEED
+) -> float:
+    """
+    Seconds to process `size` records, summed over chunks
+    Each chunk is built outside the timed region; timeit's autorange sizes every sample to at least 0.2 s
+    and the best of `repeat` samples is kept
+    """
+    total = 0.0
+    for start in range(0, size, CHUNK_SIZE):
+        count = min(CHUNK_SIZE, size - start)
+        items = build(index, start, generate_columns(index, start, count, seed))
+        timer = timeit.Timer(lambda: run(items))
+        loops, _ = timer.autorange()
+        total += min(timer.repeat(repeat, loops)) / loops
+    return total
+
+def _reference_workload() -> None:
+    # Dict building and lookups in a Python loop, like the timed cases
+    for i in range(20_000):
+        record = {"id": i, "price": i * 2.0, "suburb": "Example"}
+        record.get("price", 0) > 1000.0
+
+def reference_seconds(repeat: int = 3) -> float:
+    """
+    Seconds for one run of a fixed reference workload, timed like the cases
+    Timed next to each case so results can be normalized for machine-wide slowdowns
+    """
+    timer = timeit.Timer(_reference_workload)
+    loops, _ = timer.autorange()
+    return min(timer.repeat(repeat, loops)) / loops
+
+def environment(index: SA2Index, seed: int) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+        "sa2_regions": len(index)
+    }
+
+def run_suite(
+    cases: List[str],
+    sizes: List[str],
+    repeat: int = 5,
+    seed: int = DEFAULT_SEED,
+    rounds: int = 3
+) -> Dict[str, Any]:
+    """
+    Runs every case at every size, keeping the median of `rounds` independent timings
+    Returns {"meta": ..., "results": {case: {size: {"seconds", "per_second", "per_reference"}}}}, where
+    per_reference is records processed per run of the reference workload
+    """
+    index = get_sa2_index()
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for name in cases:
+        try:
+            build, run = CASES[name]()
+        except ImportError as e:
+            print(f"skipping {name}: {e}")
+            continue
+        for size_name in sizes:
+            size = SIZES[size_name]
+            timings = []
+            for _ in range(rounds):
+                reference = reference_seconds()
+                timings.append((time_case(index, build, run, size, repeat, seed), reference))
+            seconds = float(np.median([timing for timing, _ in timings]))
+            relative = float(np.median([timing / reference for timing, reference in timings]))
+            results.setdefault(name, {})[size_name] = {
+                "seconds": seconds,
+                "per_second": size / seconds,
+                "per_reference": size / relative
+            }
+            print(f"{name:<32}{size_name:>6}{seconds:>10.3f} s{size / seconds:>14,.0f} /s")
+    return {"meta": environment(index, seed), "results": results}
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """
+    Case/size pairs whose throughput fell more than `tolerance` below the baseline
+    Throughput relative to the reference workload is compared when both sides have it;
+    pairs missing from either side, and sizes outside REGRESSION_SIZES, are ignored
+    """
+    regressions = []
+    for name, sizes in report["results"].items():
+        for size_name, current in sizes.items():
+            if size_name not in REGRESSION_SIZES:
+                continue
+            reference = baseline.get("results", {}).get(name, {}).get(size_name)
+            if reference is None:
+                continue
+            metric = "per_reference" if "per_reference" in current and "per_reference" in reference else "per_second"
+            ratio = current[metric] / reference[metric]
+            if ratio < 1.0 - tolerance:
+                regressions.append({
+                    "case": name,
+                    "size": size_name,
+                    "baseline_per_second": reference["per_second"],
+                    "per_second": current["per_second"],
+                    "ratio": ratio
+                })
+    return regressions
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the grow benchmark suite")
+    parser.add_argument("--sizes", default="1k,100k", help=f"Comma-separated sizes ({', '.join(SIZES)})")
+    parser.add_argument("--cases", default=",".join(CASES), help="Comma-separated case names")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed samples per chunk; the best is kept")
+    parser.add_argument("--rounds", type=int, default=3, help="Independent timings per case and size; the median is kept")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against or write")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2,
+        help=f"Allowed throughput drop before flagging; only {', '.join(REGRESSION_SIZES)} are compared"
+    )
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    return parser.parse_args()
+
+def main() -> None:
+    args = parse_args()
+    sizes = [size.strip().lower() for size in args.sizes.split(",") if size.strip()]
+    cases = [case.strip() for case in args.cases.split(",") if case.strip()]
+    unknown = [size for size in sizes if size not in SIZES] + [case for case in cases if case not in CASES]
+    if unknown:
+        raise SystemExit(f"Unknown sizes or cases: {', '.join(unknown)}")
+    
+    report = run_suite(cases, sizes, args.repeat, args.seed, args.rounds)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return
+    
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if baseline.get("meta", {}).get("machine") != report["meta"]["machine"] or baseline["meta"].get("cpu_count") != report["meta"]["cpu_count"]:
+        print("warning: baseline was recorded on a different machine; comparisons are indicative only")
+    
+    regressions = compare(report, baseline, args.tolerance)
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression['case']} @ {regression['size']}: "
+            f"{regression['per_second']:,.0f}/s vs baseline {regression['baseline_per_second']:,.0f}/s "
+            f"({(regression['ratio'] - 1) * 100:+.1f}%)"
+        )
+    if regressions:
+        sys.exit(1)
+    print(f"no regressions beyond {args.tolerance:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -47,4 +47,45 @@ export const fetchScore = async (request: ScoringRequest): Promise<ScoringRespon
     console.error('Error fetching scoring data:', error);
     throw error;
   }
-}; 
\ No newline at end of file
+}; 
+export interface SuburbRankingRequest {
+  weights: Partial<Record<'yield' | 'vacancy' | 'growth5y' | 'seifa' | 'stock' | 'infra', number>>;
+  k?: number;
+  state?: string;
+}
+
+export interface RankedSuburb {
+  code: string;
+  name: string;
+  sa4_code: string;
+  state: string;
+  lon: number;
+  lat: number;
+  score: number;
+  rank: number;
+}
+
+/**
+ * Fetches the top-k SA2 regions for strategy weights
+ * Ranking is computed server-side across all SA2 regions
+ */
+export const fetchSuburbRanking = async (request: SuburbRankingRequest): Promise<RankedSuburb[]> => {
+  try {
+    const response = await fetch('/api/scoring/rank', {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/json',
+      },
+      body: JSON.stringify(request),
+    });
+
+    if (!response.ok) {
+      throw new Error('Suburb ranking request failed');
+    }
+
+    return await response.json();
+  } catch (error) {
+    console.error('Error fetching suburb ranking:', error);
+    throw error;
+  }
+};
@@ -0,0 +1,23 @@
+"""
+Shared test fixtures
+Fixtures applied to every test module
+"""
+
+import pytest
+import sys
+import os
+
+# Add module path to sys.path (the scoring API uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring import main
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limits():
+    """
+    Starts every test with full rate limit buckets
+    All TestClients share the "testclient" address, so the API tests would otherwise drain one bucket together
+    """
+    main.rate_limiter.reset()
+    yield
+    main.rate_limiter.reset()
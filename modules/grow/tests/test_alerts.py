@@ -0,0 +1,181 @@
+"""
+Tests for the alert system
+Tests for the alert system and the streaming alert engine
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import sys
+import os
+
+# Add module path to sys.path (the stream engine uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.alerts.check import AlertChecker
+from backend.alerts.state import AlertStateStore, IncrementalAlertChecker
+from backend.alerts.stream import evaluate_alert_stream
+
+def _property(i, now):
+    return {
+        "id": f"p{i}",
+        "suburb": ["Fitzroy", "Toowong", "Glenelg"][i % 3],
+        "current_price": 700000 - (i % 7) * 20000,
+        "previous_price": 720000 if i % 5 else 0,
+        "next_maintenance_date": now + timedelta(days=i % 60, hours=12) if i % 4 else None
+    }
+
+MARKETS = [
+    {"id": "m1", "suburb": "Fitzroy", "volatility": 0.2},
+    {"id": "m2", "suburb": "Toowong", "volatility": 0.05},
+    {"id": "m3", "suburb": "Glenelg", "volatility": 0.16}
+]
+
+class TestAlertStream:
+    """Test class for the streaming alert engine"""
+    
+    def test_property_alerts_match_checker(self):
+        """Test that price and maintenance alerts equal AlertChecker's"""
+        now = datetime.now()
+        properties = [_property(i, now) for i in range(200)]
+        checker = AlertChecker()
+        
+        expected = []
+        for record in properties:
+            expected.extend(checker.check_price_alerts(record))
+            expected.extend(checker.check_maintenance_alerts(record))
+        
+        alerts = [
+            alert for alert in evaluate_alert_stream(properties, MARKETS, chunk_size=16, now=now)
+            if alert.type != "market_volatility"
+        ]
+        
+        assert [(a.type, a.message, a.property_id) for a in alerts] == [
+            (a["type"], a["message"], a["property_id"]) for a in expected
+        ]
+    
+    def test_market_alerts_once_per_suburb(self):
+        """Test that volatile markets alert once, only for held suburbs"""
+        now = datetime.now()
+        properties = [_property(i, now) for i in range(30) if i % 3 != 2]
+        
+        alerts = [
+            alert for alert in evaluate_alert_stream(properties, MARKETS, chunk_size=4, now=now)
+            if alert.type == "market_volatility"
+        ]
+        
+        assert [alert.market_id for alert in alerts] == ["m1"]
+        assert alerts[0].message == "High market volatility: 20.0%"
+    
+    def test_stream_is_lazy(self):
+        """Test that only one chunk is consumed before the first alert"""
+        now = datetime.now()
+        consumed = []
+        
+        def feed():
+            for i in range(1000000):
+                consumed.append(i)
+                yield {"id": f"p{i}", "suburb": "Fitzroy", "current_price": 500000, "previous_price": 600000}
+        
+        first = next(evaluate_alert_stream(feed(), [], chunk_size=64, now=now))
+        
+        assert first.type == "price_drop"
+        assert len(consumed) == 64
+    
+    def test_numeric_ids(self):
+        """Test that int property and market ids are accepted like AlertChecker does"""
+        now = datetime.now()
+        records = [{"id": 123, "suburb": "Fitzroy", "current_price": 80.0, "previous_price": 100.0}]
+        markets = [{"id": 7, "suburb": "Fitzroy", "volatility": 0.2}]
+        
+        alerts = list(evaluate_alert_stream(records, markets, now=now))
+        
+        assert [(alert.type, alert.property_id, alert.market_id) for alert in alerts] == [
+            ("price_drop", "123", None), ("market_volatility", None, "7")
+        ]
+
+class TestIncrementalAlertChecker:
+    """Test class for change-detecting alert runs"""
+    
+    def _checker(self, tmp_path):
+        return IncrementalAlertChecker(AlertStateStore(str(tmp_path / "state.sqlite3")))
+    
+    def test_unchanged_records_are_skipped(self, tmp_path):
+        """Test that a second run over the same data evaluates nothing"""
+        now = datetime.now()
+        properties = [_property(i, now) for i in range(100)]
+        checker = self._checker(tmp_path)
+        
+        first = checker.run(properties, MARKETS, now=now)
+        second = checker.run(properties, MARKETS, now=now)
+        
+        assert len(first) > 0
+        assert second == []
+        assert checker.last_run_stats["dirty_properties"] == 0
+        assert checker.last_run_stats["dirty_markets"] == 0
+    
+    def test_only_changed_records_are_evaluated(self, tmp_path):
+        """Test that a price change is picked up and duplicates are suppressed"""
+        now = datetime.now()
+        properties = [_property(i, now) for i in range(50)]
+        checker = self._checker(tmp_path)
+        checker.run(properties, MARKETS, now=now)
+        
+        properties[1] = dict(properties[1], current_price=500000)
+        properties[2] = dict(properties[2], next_maintenance_date=None)
+        alerts = checker.run(properties, MARKETS, now=now)
+        
+        assert checker.last_run_stats["dirty_properties"] == 2
+        assert [(alert.type, alert.property_id) for alert in alerts] == [("price_drop", "p1")]
+    
+    def test_state_persists_across_instances(self, tmp_path):
+        """Test that state survives a restart"""
+        now = datetime.now()
+        properties = [_property(i, now) for i in range(20)]
+        self._checker(tmp_path).run(properties, MARKETS, now=now)
+        
+        checker = self._checker(tmp_path)
+        
+        assert checker.run(properties, MARKETS, now=now) == []
+    
+    def test_market_alert_after_volatility_rises_again(self, tmp_path):
+        """Test that a market re-alerts only after dropping below the threshold"""
+        checker = self._checker(tmp_path)
+        market = {"id": "m1", "suburb": "Fitzroy", "volatility": 0.2}
+        
+        assert len(checker.run([], [market])) == 1
+        assert checker.run([], [dict(market, volatility=0.25)]) == []
+        assert checker.run([], [dict(market, volatility=0.05)]) == []
+        assert len(checker.run([], [dict(market, volatility=0.3)])) == 1
+    
+    def test_numeric_ids(self, tmp_path):
+        """Test that int ids alert and are matched to their stored state on the next run"""
+        now = datetime.now()
+        record = {"id": 123, "current_price": 80.0, "previous_price": 100.0}
+        market = {"id": 7, "suburb": "Fitzroy", "volatility": 0.2}
+        checker = self._checker(tmp_path)
+        
+        alerts = checker.run([record], [market], now=now)
+        
+        assert [(alert.type, alert.property_id, alert.market_id) for alert in alerts] == [
+            ("price_drop", "123", None), ("market_volatility", None, "7")
+        ]
+        assert checker.run([record], [market], now=now) == []
+        assert checker.last_run_stats["dirty_properties"] == 0
+    
+    def test_unchanged_property_becomes_due(self, tmp_path):
+        """Test that maintenance alerts fire once time reaches the window"""
+        now = datetime.now()
+        record = {"id": "p1", "current_price": 1, "previous_price": 1, "next_maintenance_date": now + timedelta(days=40)}
+        checker = self._checker(tmp_path)
+        
+        assert checker.run([record], now=now) == []
+        
+        later = now + timedelta(days=15)
+        alerts = checker.run([record], now=later)
+        
+        assert checker.last_run_stats["dirty_properties"] == 0
+        assert [(alert.type, alert.message) for alert in alerts] == [("maintenance_due", "Maintenance due in 25 days")]
+        assert checker.run([record], now=later) == []
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,85 @@
+"""
+Tests for the scoring API
+Tests for the scoring API
+"""
+
+import pytest
+import json
+import sys
+import os
+
+# Add module path to sys.path (the API uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from backend.scoring import main
+from backend.scoring.main import app
+
+client = TestClient(app)
+
+def _scoring_request(i: int = 0):
+    return {
+        "address": f"{i} Test Street",
+        "suburb": "Test Suburb",
+        "postcode": "2000",
+        "property_type": "residential"
+    }
+
+class TestScoringAPI:
+    """Test class for the scoring endpoints"""
+    
+    def test_score_property(self):
+        """Test for the single scoring endpoint"""
+        response = client.post("/api/scoring", json=_scoring_request())
+        
+        assert response.status_code == 200
+        result = response.json()
+        assert 0 <= result["overall_score"] <= 100
+        assert set(result["metrics"]) == {"location", "infrastructure", "market_trends", "rental_yield"}
+        assert len(result["recommendations"]) > 0
+    
+    def test_score_property_body_matches_default_encoding(self):
+        """Test that the fast-path response is byte-identical to FastAPI's default encoding"""
+        response = client.post("/api/scoring", json=_scoring_request())
+        
+        result = main.ScoringResult.model_validate(response.json())
+        assert response.content == JSONResponse(result.model_dump(mode="json")).body
+        assert response.headers["content-type"] == "application/json"
+    
+    def test_score_batch_streams_ndjson(self, monkeypatch):
+        """Test that the batch endpoint streams one line per request"""
+        monkeypatch.setattr(main.Settings, "SCORING_BATCH_CHUNK_SIZE", 7)
+        requests = [_scoring_request(i) for i in range(50)]
+        
+        response = client.post("/api/scoring/batch", json=requests)
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = response.text.splitlines()
+        assert len(lines) == 50
+        
+        single = client.post("/api/scoring", json=_scoring_request()).json()
+        for line in lines:
+            row = json.loads(line)
+            assert row["overall_score"] == single["overall_score"]
+            assert row["metrics"] == single["metrics"]
+    
+    def test_score_batch_rejects_oversized_body(self, monkeypatch):
+        """Test that batches above the configured maximum are rejected"""
+        monkeypatch.setattr(main.Settings, "SCORING_BATCH_MAX_SIZE", 3)
+        
+        response = client.post("/api/scoring/batch", json=[_scoring_request(i) for i in range(4)])
+        
+        assert response.status_code == 413
+    
+    def test_health_check(self):
+        """Test for the health endpoint"""
+        response = client.get("/health")
+        
+        assert response.status_code == 200
+        assert response.json()["status"] == "healthy"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
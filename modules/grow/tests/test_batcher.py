@@ -0,0 +1,108 @@
+"""
+Tests for scoring request micro-batching
+Tests for coalescing, batch dispatch and error fan-out of the micro-batcher
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add module path to sys.path (the batcher is used by the package-relative API)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring.batcher import MicroBatcher
+from backend.scoring.main import ScoringRequest, score_requests
+
+def _request(suburb, address="1 Example Street", property_type="residential"):
+    return ScoringRequest(address=address, suburb=suburb, postcode="3065", property_type=property_type)
+
+class RecordingScorer:
+    """Scores requests with score_requests and records each call"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def __call__(self, requests):
+        self.calls.append(list(requests))
+        return score_requests(requests)
+
+class TestMicroBatcher:
+    """Test class for the micro-batcher"""
+    
+    def test_coalesces_concurrent_duplicates(self):
+        """Test that one window is scored in one call with one row per distinct property"""
+        scorer = RecordingScorer()
+        batcher = MicroBatcher(scorer, window=0.01)
+        requests = [_request("Fitzroy", address=f"{i} Example Street") for i in range(20)]
+        requests += [_request("Carlton"), _request("Fitzroy", property_type="commercial")]
+        
+        async def run():
+            return await asyncio.gather(*(batcher.submit(request) for request in requests))
+        results = asyncio.run(run())
+        
+        assert len(scorer.calls) == 1
+        assert [request.suburb for request in scorer.calls[0]] == ["Fitzroy", "Carlton", "Fitzroy"]
+        assert all(result is results[0] for result in results[:20])
+        assert batcher.stats == {"requests": 22, "scored": 3, "batches": 1}
+        
+        expected = score_requests([requests[0], requests[20], requests[21]])
+        for result, reference in zip([results[0], results[20], results[21]], expected):
+            assert result.model_dump(exclude={"created_at"}) == reference.model_dump(exclude={"created_at"})
+    
+    def test_max_batch_dispatches_early(self):
+        """Test that reaching max_batch distinct keys dispatches without waiting for the window"""
+        scorer = RecordingScorer()
+        batcher = MicroBatcher(scorer, window=60.0, max_batch=2)
+        
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(batcher.submit(_request("Fitzroy")), batcher.submit(_request("Carlton"))),
+                timeout=1.0
+            )
+        assert len(asyncio.run(run())) == 2
+        assert len(scorer.calls) == 1
+    
+    def test_separate_windows(self):
+        """Test that requests in different windows are scored separately"""
+        scorer = RecordingScorer()
+        batcher = MicroBatcher(scorer, window=0.001)
+        
+        async def run():
+            await batcher.submit(_request("Fitzroy"))
+            await batcher.submit(_request("Fitzroy"))
+        asyncio.run(run())
+        assert len(scorer.calls) == 2
+    
+    def test_errors_reach_every_waiter(self):
+        """Test that a failing batch raises in all waiting requests"""
+        def fail(requests):
+            raise RuntimeError("boom")
+        batcher = MicroBatcher(fail, window=0.001)
+        
+        async def run():
+            return await asyncio.gather(
+                batcher.submit(_request("Fitzroy")), batcher.submit(_request("Carlton")),
+                return_exceptions=True
+            )
+        results = asyncio.run(run())
+        assert all(isinstance(result, RuntimeError) for result in results)
+    
+    def test_short_result_fails_every_waiter(self):
+        """Test that a batch returning fewer results than requests leaves no future pending"""
+        batcher = MicroBatcher(lambda requests: score_requests(requests)[:-1], window=0.001)
+        
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    batcher.submit(_request("Fitzroy")), batcher.submit(_request("Carlton")),
+                    return_exceptions=True
+                ),
+                timeout=1.0
+            )
+        results = asyncio.run(run())
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert batcher.stats["batches"] == 0
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,66 @@
+"""
+Tests for the benchmark suite
+Tests for synthetic data generation and baseline regression checks
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path (the suite uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.spatial.sa2_index import get_sa2_index
+from benchmarks.suite import compare, generate_columns, property_records, run_suite
+
+class TestSyntheticData:
+    """Test class for the synthetic property generator"""
+    
+    def test_chunks_are_reproducible(self):
+        """Test that the same seed and offset regenerate identical columns"""
+        index = get_sa2_index()
+        first = generate_columns(index, 0, 100, seed=7)
+        second = generate_columns(index, 0, 100, seed=7)
+        other = generate_columns(index, 100, 100, seed=7)
+        for name in first:
+            np.testing.assert_array_equal(first[name], second[name])
+        assert not np.array_equal(first["current_price"], other["current_price"])
+        assert first["sa2"].max() < len(index)
+    
+    def test_property_records(self):
+        """Test that records carry SA2 suburbs and unique ids"""
+        index = get_sa2_index()
+        records = property_records(index, 500, generate_columns(index, 500, 10))
+        assert [record["id"] for record in records] == [f"p{i}" for i in range(500, 510)]
+        assert all(record["suburb"] in set(index.names.tolist()) for record in records)
+
+class TestBaselineComparison:
+    """Test class for regression detection"""
+    
+    def test_flags_drops_beyond_tolerance(self):
+        """Test that only throughput drops larger than the tolerance are flagged"""
+        baseline = {"results": {"a": {"100k": {"per_second": 1000.0}}, "b": {"100k": {"per_second": 1000.0}}}}
+        report = {"results": {
+            "a": {"100k": {"per_second": 850.0}},
+            "b": {"100k": {"per_second": 700.0}, "1m": {"per_second": 1.0}}
+        }}
+        regressions = compare(report, baseline, tolerance=0.2)
+        assert [(r["case"], r["size"]) for r in regressions] == [("b", "100k")]
+        assert regressions[0]["ratio"] == pytest.approx(0.7)
+    
+    def test_small_sizes_are_not_compared(self):
+        """Test that millisecond-scale 1k runs never count as regressions"""
+        baseline = {"results": {"a": {"1k": {"per_second": 1000.0}}}}
+        report = {"results": {"a": {"1k": {"per_second": 1.0}}}}
+        assert compare(report, baseline) == []
+    
+    def test_run_suite_reports_throughput(self):
+        """Test that a small run produces per-case throughput and machine metadata"""
+        report = run_suite(["get_comprehensive_strategy"], ["1k"], repeat=1, rounds=1)
+        result = report["results"]["get_comprehensive_strategy"]["1k"]
+        assert result["per_second"] > 0
+        assert report["meta"]["sa2_regions"] == len(get_sa2_index())
+
+if __name__ == "__main__":
+    pytest.main([__file__])
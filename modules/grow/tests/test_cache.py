@@ -0,0 +1,192 @@
+"""
+Tests for the response cache
+Tests for the response cache
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add module path to sys.path (the cache uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.data.cache import InMemoryCacheBackend, ResponseCache, SharedCacheBackend
+from backend.data.fetch import DataFetcher
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+class FakeAsyncStore:
+    """Minimal stand-in for an asyncio Redis client"""
+    
+    def __init__(self):
+        self.data = {}
+        self.expiry = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiry[key] = ex
+
+class TestInMemoryCacheBackend:
+    """Test class for the in-process backend"""
+    
+    def test_entries_expire_after_ttl(self):
+        """Test that entries are dropped once their TTL has passed"""
+        clock = FakeClock()
+        backend = InMemoryCacheBackend(max_entries=10, clock=clock)
+        
+        async def run():
+            await backend.set("a", {"value": 1}, ttl=10)
+            clock.now = 9.9
+            fresh = await backend.get("a")
+            clock.now = 10.0
+            expired = await backend.get("a")
+            return fresh, expired
+        
+        fresh, expired = asyncio.run(run())
+        
+        assert fresh == {"value": 1}
+        assert expired is None
+        assert len(backend) == 0
+    
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test LRU eviction once the size bound is reached"""
+        backend = InMemoryCacheBackend(max_entries=2)
+        
+        async def run():
+            await backend.set("a", 1, ttl=60)
+            await backend.set("b", 2, ttl=60)
+            await backend.get("a")
+            await backend.set("c", 3, ttl=60)
+            return [await backend.get(key) for key in ("a", "b", "c")]
+        
+        assert asyncio.run(run()) == [1, None, 3]
+        assert backend.evictions == 1
+
+class TestResponseCache:
+    """Test class for the response cache"""
+    
+    def test_hits_and_misses_are_counted(self):
+        """Test that repeated lookups are served from the cache"""
+        cache = ResponseCache(ttl=60, enabled=True)
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            return {"median_price": 750000}
+        
+        async def run():
+            for suburb in ("Test Suburb", " test suburb ", "Other"):
+                await cache.get_or_fetch("market_data", suburb, "2000", fetch)
+        
+        asyncio.run(run())
+        
+        assert len(calls) == 2
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+    
+    def test_concurrent_misses_share_one_upstream_call(self):
+        """Test single-flight deduplication of concurrent misses"""
+        cache = ResponseCache(ttl=60, enabled=True)
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"median_price": 750000}
+        
+        async def run():
+            return await asyncio.gather(*(
+                cache.get_or_fetch("market_data", "Test Suburb", "2000", fetch) for _ in range(20)
+            ))
+        
+        results = asyncio.run(run())
+        
+        assert len(calls) == 1
+        assert all(result == {"median_price": 750000} for result in results)
+        assert cache.stats()["coalesced"] == 19
+    
+    def test_failed_fetch_is_not_cached(self):
+        """Test that errors propagate to all waiters and are not stored"""
+        cache = ResponseCache(ttl=60, enabled=True)
+        
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream down")
+        
+        async def run():
+            return await asyncio.gather(*(
+                cache.get_or_fetch("market_data", "Test Suburb", "2000", fail) for _ in range(3)
+            ), return_exceptions=True)
+        
+        results = asyncio.run(run())
+        
+        assert all(isinstance(result, ValueError) for result in results)
+        assert asyncio.run(cache.backend.get(cache.make_key("market_data", "Test Suburb", "2000"))) is None
+    
+    def test_disabled_cache_always_fetches(self):
+        """Test that CACHE_ENABLED=false bypasses the cache"""
+        cache = ResponseCache(ttl=60, enabled=False)
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            return {}
+        
+        async def run():
+            for _ in range(3):
+                await cache.get_or_fetch("market_data", "Test Suburb", "2000", fetch)
+        
+        asyncio.run(run())
+        
+        assert len(calls) == 3
+    
+    def test_shared_backend_round_trip(self):
+        """Test the shared backend against a fake key-value store"""
+        store = FakeAsyncStore()
+        cache = ResponseCache(backend=SharedCacheBackend(store), ttl=3600, enabled=True)
+        
+        async def fetch():
+            return {"population": 15000}
+        
+        async def run():
+            await cache.get_or_fetch("census_data", "Test Suburb", "2000", fetch)
+            return await cache.get_or_fetch("census_data", "Test Suburb", "2000", fetch)
+        
+        assert asyncio.run(run()) == {"population": 15000}
+        assert cache.stats()["hits"] == 1
+        assert list(store.expiry.values()) == [3600]
+    
+    def test_data_fetcher_uses_cache(self):
+        """Test that DataFetcher serves repeated market lookups from the cache"""
+        cache = ResponseCache(ttl=60, enabled=True)
+        fetcher = DataFetcher(api_keys={"market_data": "key"}, cache=cache)
+        calls = []
+        
+        async def fake_get_json(source, params):
+            calls.append(source)
+            return {"suburb": params["suburb"]}
+        
+        fetcher._get_json = fake_get_json
+        
+        async def run():
+            for _ in range(3):
+                await fetcher.fetch_market_data("Test Suburb", "2000")
+        
+        asyncio.run(run())
+        
+        assert calls == ["market_data"]
+        assert cache.stats()["hits"] == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__])
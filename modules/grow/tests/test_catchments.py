@@ -0,0 +1,155 @@
+"""
+Tests for the school catchment engine
+Tests for the catchment R-tree and prepared point-in-polygon queries against brute force
+"""
+
+import pytest
+import numpy as np
+import json
+import shutil
+import sys
+import os
+
+# Add module path to sys.path (the engine uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from backend.scoring import main
+from backend.scoring.main import app
+from backend.spatial import catchments
+from backend.spatial.catchments import BoxTree, CatchmentIndex, PreparedPolygon, get_catchment_index, polygon_rings
+
+client = TestClient(app)
+
+def _star(rng, lon, lat, radius, vertices=60):
+    angles = np.sort(rng.uniform(0, 2 * np.pi, vertices))
+    radii = radius * rng.uniform(0.4, 1.0, vertices)
+    ring = np.column_stack([lon + radii * np.cos(angles), lat + radii * np.sin(angles)])
+    return np.vstack([ring, ring[:1]])
+
+def _ray_cast(rings, x, y):
+    inside = False
+    for ring in rings:
+        for (x0, y0), (x1, y1) in zip(ring, np.roll(ring, -1, axis=0)):
+            if (y0 > y) != (y1 > y) and x < x0 + (y - y0) * (x1 - x0) / (y1 - y0):
+                inside = not inside
+    return inside
+
+def _feature(catchment_id, rings, multi=False):
+    coordinates = [ring.tolist() for ring in rings]
+    geometry = {"type": "MultiPolygon", "coordinates": [[ring] for ring in coordinates]} if multi else {"type": "Polygon", "coordinates": coordinates}
+    return {"type": "Feature", "geometry": geometry, "properties": {"catchment_id": catchment_id, "name": f"School {catchment_id}"}}
+
+@pytest.fixture
+def catchment_dir(tmp_path):
+    square = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0], [0.0, 0.0]])
+    hole = np.array([[1.0, 1.0], [2.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]])
+    primary = {"type": "FeatureCollection", "features": [
+        _feature("P1", [square, hole]),
+        _feature("P2", [square + 10, square + 20], multi=True),
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [0, 0]}, "properties": {}}
+    ]}
+    secondary = {"type": "FeatureCollection", "features": [_feature("S1", [square * 3])]}
+    (tmp_path / "primary.geojson").write_text(json.dumps(primary))
+    (tmp_path / "secondary.geojson").write_text(json.dumps(secondary))
+    return str(tmp_path)
+
+class TestPreparedPolygon:
+    """Test class for banded ray casting"""
+    
+    def test_matches_brute_force(self):
+        """Test that prepared containment matches plain ray casting, with holes"""
+        rng = np.random.default_rng(11)
+        for _ in range(10):
+            rings = [_star(rng, 151.0, -33.8, 0.2), _star(rng, 151.0, -33.8, 0.05)]
+            polygon = PreparedPolygon(rings)
+            x = rng.uniform(150.7, 151.3, 500)
+            y = rng.uniform(-34.1, -33.5, 500)
+            expected = [_ray_cast(rings, px, py) for px, py in zip(x, y)]
+            assert polygon.contains(x, y).tolist() == expected
+    
+    def test_non_polygon_geometry_has_no_rings(self):
+        """Test that points and missing geometries are ignored"""
+        assert polygon_rings({"type": "Point", "coordinates": [0, 0]}) == []
+        assert polygon_rings(None) == []
+
+class TestBoxTree:
+    """Test class for the packed R-tree"""
+    
+    def test_matches_brute_force(self):
+        """Test that tree queries return exactly the boxes containing each point"""
+        rng = np.random.default_rng(5)
+        low = rng.uniform(0, 100, (3000, 2))
+        boxes = np.column_stack([low, low + rng.uniform(0.1, 5, (3000, 2))])
+        tree = BoxTree(boxes, node_size=8)
+        assert len(tree.levels) > 2
+        
+        x, y = rng.uniform(0, 100, 300), rng.uniform(0, 100, 300)
+        points, items = tree.query_points(x, y)
+        found = set(zip(points.tolist(), items.tolist()))
+        hits = (boxes[None, :, 0] <= x[:, None]) & (x[:, None] <= boxes[None, :, 2]) & (boxes[None, :, 1] <= y[:, None]) & (y[:, None] <= boxes[None, :, 3])
+        assert found == set(zip(*np.nonzero(hits)))
+        assert len(found) == len(points)
+    
+    def test_empty_tree(self):
+        """Test that an empty tree returns no pairs"""
+        points, items = BoxTree(np.empty((0, 4))).query_points([1.0], [1.0])
+        assert len(points) == len(items) == 0
+
+class TestCatchmentIndex:
+    """Test class for catchment lookups"""
+    
+    def test_containing(self, catchment_dir):
+        """Test lookups across types, holes and multipolygons"""
+        index = CatchmentIndex.from_directory(catchment_dir)
+        assert len(index) == 3
+        
+        results = index.containing([0.5, 1.5, 10.5, 20.5, 8.0, 50.0], [0.5, 1.5, 10.5, 20.5, 8.0, 50.0])
+        assert [[c["catchment_id"] for c in result] for result in results] == [["P1", "S1"], ["S1"], ["P2", "S1"], ["P2"], ["S1"], []]
+        assert results[0][0]["type"] == "Primary" and results[0][1]["type"] == "Secondary"
+        assert results[0][0]["name"] == "School P1"
+        
+        assert index.counts([0.5, 1.5, 50.0], [0.5, 1.5, 50.0]).tolist() == [2, 1, 0]
+        assert index.counts([0.5, 1.5, 50.0], [0.5, 1.5, 50.0], "Primary").tolist() == [1, 0, 0]
+    
+    def test_shared_index_follows_the_files(self, catchment_dir, tmp_path, monkeypatch):
+        """Test that the shared index is not cached while missing and reloads when files are added"""
+        directory = tmp_path / "shared"
+        directory.mkdir()
+        monkeypatch.setattr(catchments.Settings, "SCHOOL_CATCHMENTS_DIR", str(directory))
+        monkeypatch.setattr(catchments, "_catchment_index", None)
+        monkeypatch.setattr(catchments, "_catchment_index_source", None)
+        assert get_catchment_index() is None
+        
+        shutil.copy(os.path.join(catchment_dir, "secondary.geojson"), directory)
+        first = get_catchment_index()
+        assert len(first) == 1
+        assert get_catchment_index() is first
+        
+        shutil.copy(os.path.join(catchment_dir, "primary.geojson"), directory)
+        assert len(get_catchment_index()) == 3
+
+class TestCatchmentAPI:
+    """Test class for the catchment endpoints"""
+    
+    def test_lookup_endpoints(self, catchment_dir, monkeypatch):
+        """Test the single and batch endpoints"""
+        index = CatchmentIndex.from_directory(catchment_dir)
+        monkeypatch.setattr(main, "get_catchment_index", lambda: index)
+        
+        response = client.get("/api/catchments", params={"lon": 0.5, "lat": 0.5})
+        assert response.status_code == 200
+        assert [c["catchment_id"] for c in response.json()] == ["P1", "S1"]
+        
+        response = client.post("/api/catchments/lookup", json={"points": [{"lon": 20.5, "lat": 20.5}, {"lon": 50, "lat": 50}]})
+        assert response.status_code == 200
+        assert [[c["catchment_id"] for c in result] for result in response.json()] == [["P2"], []]
+    
+    def test_unavailable(self, monkeypatch):
+        """Test that a missing catchment dataset returns 503"""
+        monkeypatch.setattr(main, "get_catchment_index", lambda: None)
+        assert client.get("/api/catchments", params={"lon": 0.5, "lat": 0.5}).status_code == 503
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,130 @@
+"""
+Tests for concurrent data fetching
+Tests for concurrent data fetching against a local stub server
+"""
+
+import pytest
+import asyncio
+import json
+import threading
+import time
+import sys
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+# Add module path to sys.path (the fetcher uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.data.fetch import DataFetcher, SOURCE_PATHS
+
+# Simulated upstream latency per path in seconds
+STUB_DELAYS = {
+    "/properties": 0.2,
+    "/markets": 0.3,
+    "/census": 0.2,
+    "/infrastructure": 0.1
+}
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers every source path with a JSON body after a fixed delay"""
+    
+    failing_paths = set()
+    
+    def do_GET(self):
+        path = urlparse(self.path).path
+        time.sleep(STUB_DELAYS.get(path, 0))
+        
+        if path in self.failing_paths or path not in STUB_DELAYS:
+            self.send_response(500)
+            self.end_headers()
+            return
+        
+        body = json.dumps({"path": path, "api_key": self.headers.get("X-API-Key")}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture(scope="module")
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+def _fetcher(base_url, **kwargs):
+    return DataFetcher(
+        api_keys={source: f"key-{source}" for source in SOURCE_PATHS},
+        base_urls={source: base_url for source in SOURCE_PATHS},
+        **kwargs
+    )
+
+class TestDataFetcher:
+    """Test class for DataFetcher.fetch_all"""
+    
+    def test_fetch_all_runs_sources_concurrently(self, stub_server):
+        """Test that latency follows the slowest source, not the sum"""
+        async def run():
+            async with _fetcher(stub_server) as fetcher:
+                start = time.perf_counter()
+                result = await fetcher.fetch_all("Test Suburb", "2000", "123 Test Street")
+                return result, time.perf_counter() - start
+        
+        result, elapsed = asyncio.run(run())
+        
+        assert result["errors"] == {}
+        for source, path in SOURCE_PATHS.items():
+            assert result[source]["path"] == path
+            assert result[source]["api_key"] == f"key-{source}"
+        assert elapsed < sum(STUB_DELAYS.values()) * 0.75
+    
+    def test_fetch_all_handles_partial_failure(self, stub_server):
+        """Test that one failing source does not fail the others"""
+        _StubHandler.failing_paths = {"/census"}
+        try:
+            async def run():
+                async with _fetcher(stub_server) as fetcher:
+                    return await fetcher.fetch_all("Test Suburb", "2000", "123 Test Street")
+            
+            result = asyncio.run(run())
+        finally:
+            _StubHandler.failing_paths = set()
+        
+        assert result["census_data"] is None
+        assert "census_data" in result["errors"]
+        assert result["market_data"]["path"] == "/markets"
+    
+    def test_fetch_all_applies_per_source_timeout(self, stub_server):
+        """Test that a slow source times out without delaying the rest"""
+        async def run():
+            async with _fetcher(stub_server, timeouts={"market_data": 0.05}) as fetcher:
+                return await fetcher.fetch_all("Test Suburb", "2000")
+        
+        result = asyncio.run(run())
+        
+        assert result["market_data"] is None
+        assert "market_data" in result["errors"]
+        assert result["property_data"] is None
+        assert result["infrastructure_data"]["path"] == "/infrastructure"
+    
+    def test_placeholder_without_api_keys(self):
+        """Test that sources without API keys fall back to placeholder data"""
+        async def run():
+            async with DataFetcher(api_keys={}) as fetcher:
+                return await fetcher.fetch_all("Test Suburb", "2000", "123 Test Street")
+        
+        result = asyncio.run(run())
+        
+        assert result["errors"] == {}
+        assert result["market_data"]["suburb"] == "Test Suburb"
+        assert result["property_data"]["address"] == "123 Test Street"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
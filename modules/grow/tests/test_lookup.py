@@ -0,0 +1,94 @@
+"""
+Tests for the postcode and suburb lookup index
+Tests for the postcode and suburb lookup index
+"""
+
+import pytest
+import sys
+import os
+
+# Add module path to sys.path (the index uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from backend.data.lookup import LookupIndex, get_lookup_index, normalize_name
+from backend.scoring.main import ScoringRequest, app
+
+client = TestClient(app)
+
+@pytest.fixture(scope="module")
+def index():
+    return get_lookup_index()
+
+class TestLookupIndex:
+    """Test class for exact, prefix and fuzzy lookups"""
+    
+    @pytest.mark.parametrize("text", ["München-Schwabing", "MUNCHEN  schwabing", " münchen_schwabing "])
+    def test_normalize_name(self, text):
+        """Test case, diacritic and punctuation folding"""
+        assert normalize_name(text) == "munchen schwabing"
+    
+    def test_postcode_lookup(self, index):
+        """Test exact postcode lookup"""
+        results = index.by_postcode(" 10115 ")
+        
+        assert [result["name"] for result in results] == ["Berlin-Mitte"]
+        assert index.by_postcode("99999") == []
+    
+    def test_name_lookup_ignores_case_and_diacritics(self, index):
+        """Test exact suburb lookup"""
+        assert [result["postcode"] for result in index.by_name("koln innenstadt")] == ["50667"]
+        assert [result["kind"] for result in index.by_name("SOUTH YARRA - WEST")] == ["sa2"]
+    
+    def test_prefix_matches_any_word(self, index):
+        """Test that prefixes match the start of any word"""
+        names = [result["name"] for result in index.search("schwab", limit=5)]
+        
+        assert "München-Schwabing" in names
+        assert all(result["match"] == "prefix" for result in index.search("parra", limit=3))
+    
+    def test_fuzzy_matches_typos(self, index):
+        """Test trigram matching for misspelled names"""
+        results = index.search("Parramata", limit=5)
+        
+        assert results[0]["match"] == "fuzzy"
+        assert all("Parramatta" in result["name"] for result in results[:3])
+        assert [result["score"] for result in results] == sorted((result["score"] for result in results), reverse=True)
+    
+    def test_search_deduplicates_and_limits(self):
+        """Test that every entry appears once under its best match"""
+        index = LookupIndex([
+            {"name": "Glenelg", "postcode": "5045"},
+            {"name": "Glenelg North", "postcode": "5045"},
+            {"name": "Glenelg South", "postcode": "5045"}
+        ])
+        
+        results = index.search("glenelg", limit=2)
+        
+        assert [(result["name"], result["match"]) for result in results] == [("Glenelg", "exact"), ("Glenelg North", "prefix")]
+
+class TestLocationAPI:
+    """Test class for the lookup endpoints and request normalization"""
+    
+    def test_search_endpoint(self):
+        """Test the autocomplete endpoint"""
+        response = client.get("/api/locations/search", params={"q": "munchen", "limit": 3})
+        
+        assert response.status_code == 200
+        assert response.json()[0]["name"].startswith("München")
+    
+    def test_postcode_endpoint(self):
+        """Test the postcode endpoint"""
+        assert client.get("/api/locations/postcodes/22765").json()[0]["name"] == "Hamburg-Altona"
+        assert client.get("/api/locations/postcodes/00000").status_code == 404
+    
+    def test_scoring_request_normalization(self):
+        """Test that suburb and postcode whitespace is normalized"""
+        request = ScoringRequest(address="1 Street", suburb="  South   Yarra ", postcode=" 3141 ", property_type="residential")
+        
+        assert request.suburb == "South Yarra"
+        assert request.postcode == "3141"
+
+if __name__ == "__main__":
+    pytest.main([__file__])
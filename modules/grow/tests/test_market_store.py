@@ -0,0 +1,112 @@
+"""
+Tests for the time-series market store
+Tests for the time-series market store against per-suburb loops
+"""
+
+import pytest
+import math
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path (the store uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.data import market_store
+from backend.data.market_store import METRIC_FIELDS, MarketSeriesStore, get_market_store, month_number
+from backend.scoring.logic.scoring_algorithms import (
+    calculate_market_trends_score,
+    calculate_market_trends_score_batch,
+    properties_to_columns
+)
+
+def _store(months=80, suburbs=5, seed=2):
+    rng = np.random.default_rng(seed)
+    prices = 500000 * np.exp(np.cumsum(rng.normal(0.005, 0.02, (months, suburbs)), axis=0))
+    store = MarketSeriesStore()
+    for m in range(months):
+        store.append(month_number("2018-01") + m, {f"Suburb {s}": prices[m, s] for s in range(suburbs)})
+    return store, prices
+
+class TestMarketSeriesStore:
+    """Test class for ingestion and rolling metrics"""
+    
+    def test_rolling_metrics_match_loops(self):
+        """Test vectorized windows against a plain per-suburb computation"""
+        store, prices = _store()
+        metrics = store.rolling_metrics()
+        
+        t, s = 70, 3
+        assert metrics["price_growth_1y"][t, s] == pytest.approx(prices[t, s] / prices[t - 12, s] - 1)
+        assert metrics["price_growth_5y"][t, s] == pytest.approx(prices[t, s] / prices[t - 60, s] - 1)
+        assert metrics["momentum_3m"][t, s] == pytest.approx(prices[t, s] / prices[t - 3, s] - 1)
+        returns = [math.log(prices[i, s] / prices[i - 1, s]) for i in range(t - 11, t + 1)]
+        mean = sum(returns) / len(returns)
+        expected = math.sqrt(sum((r - mean) ** 2 for r in returns) / (len(returns) - 1) * 12)
+        assert metrics["volatility"][t, s] == pytest.approx(expected)
+        assert np.isnan(metrics["price_growth_5y"][59, s])
+    
+    def test_latest_metrics_equal_full_history(self):
+        """Test that latest values from the tail window equal the full computation"""
+        store, _ = _store()
+        full = store.rolling_metrics()
+        latest = store.latest_metrics()
+        
+        for field in METRIC_FIELDS:
+            assert np.array_equal(latest[field], full[field][-1], equal_nan=True)
+    
+    def test_append_only(self):
+        """Test that history cannot be rewritten"""
+        store = MarketSeriesStore()
+        store.append("2024-01", {"Glenelg": 900000})
+        store.append("2024-03", {"Glenelg": 910000})
+        store.append("2024-03", {"Brighton": 1200000})
+        
+        with pytest.raises(ValueError):
+            store.append("2024-02", {"Glenelg": 905000})
+        with pytest.raises(ValueError):
+            store.append("2024-03", {"GLENELG": 1})
+        assert store.prices.shape == (3, 2)
+        assert np.isnan(store.prices[1, 0])
+        assert store.latest("Brighton")["price_growth_1y"] is None
+    
+    def test_save_and_load(self, tmp_path):
+        """Test that a saved store loads with identical prices"""
+        store, _ = _store(months=20, suburbs=40)
+        store.save(str(tmp_path))
+        
+        loaded = MarketSeriesStore.load(str(tmp_path))
+        
+        assert loaded.latest_month == store.latest_month
+        assert np.array_equal(loaded.prices, store.prices)
+        assert loaded.latest("suburb 7") == store.latest("Suburb 7")
+    
+    def test_shared_store_follows_the_directory(self, tmp_path, monkeypatch):
+        """Test that the shared store is not cached while missing and reloads when replaced"""
+        monkeypatch.setattr(market_store.Settings, "MARKET_STORE_PATH", str(tmp_path))
+        monkeypatch.setattr(market_store, "_market_store", None)
+        monkeypatch.setattr(market_store, "_market_store_source", None)
+        assert get_market_store() is None
+        
+        _store(months=20, suburbs=3)[0].save(str(tmp_path))
+        first = get_market_store()
+        assert len(first.suburbs) == 3
+        assert get_market_store() is first
+        
+        _store(months=20, suburbs=5)[0].save(str(tmp_path))
+        assert len(get_market_store().suburbs) == 5
+    
+    def test_scoring_reads_latest_columns(self):
+        """Test that batch and scalar market trend scores agree on store values"""
+        store, _ = _store()
+        suburbs = ["Suburb 0", "Suburb 4", "Unknown"]
+        properties = [dict(store.latest(suburb) or {}, suburb=suburb) for suburb in suburbs]
+        
+        batch = calculate_market_trends_score_batch(store.latest_columns(suburbs))
+        
+        assert batch.tolist() == [calculate_market_trends_score(prop) for prop in properties]
+        assert batch[2] == 80.0
+        assert np.array_equal(calculate_market_trends_score_batch(properties_to_columns(properties)), batch)
+
+if __name__ == "__main__":
+    pytest.main([__file__])
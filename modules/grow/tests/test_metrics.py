@@ -0,0 +1,136 @@
+"""
+Tests for latency metrics and the sampling profiler
+Tests for histograms, stage timers, the /metrics endpoint and folded profiler output
+"""
+
+import pytest
+import asyncio
+import threading
+import sys
+import os
+
+# Add module path to sys.path (the metrics use package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from backend.alerts.check import AlertChecker
+from backend.scoring import main
+from backend.scoring.main import app
+from backend.shared.metrics import Histogram, MetricsRegistry, get_metrics, timed
+from backend.shared.profiler import SamplingProfiler
+
+client = TestClient(app)
+
+class TestHistogram:
+    """Test class for fixed-bucket histograms"""
+    
+    def test_buckets_and_quantiles(self):
+        """Test bucket placement, upper-bound quantiles and the overflow bucket"""
+        histogram = Histogram((0.001, 0.01, 0.1))
+        for value in [0.0005, 0.001, 0.005, 0.05, 5.0]:
+            histogram.observe(value)
+        assert histogram.counts == [2, 1, 1, 1]
+        assert histogram.count == 5
+        assert histogram.sum == pytest.approx(5.0565)
+        assert histogram.quantile(0.4) == 0.001
+        assert histogram.quantile(0.6) == 0.01
+        assert histogram.quantile(0.99) == 0.1
+        assert Histogram().quantile(0.5) is None
+
+class TestMetricsRegistry:
+    """Test class for stage timers and rendering"""
+    
+    def test_timers_and_prometheus_output(self):
+        """Test that timed blocks are recorded and rendered as cumulative buckets"""
+        registry = MetricsRegistry(bounds=(0.5, 1.0))
+        with registry.time("compute"):
+            pass
+        registry.observe("compute", 0.75)
+        registry.increment("rate_limited", 2)
+        
+        snapshot = registry.snapshot()
+        assert snapshot["counters"] == {"rate_limited": 2}
+        assert snapshot["stages"]["compute"]["count"] == 2
+        
+        text = registry.render_prometheus()
+        assert "grow_rate_limited_total 2" in text
+        assert 'grow_stage_seconds_bucket{stage="compute",le="0.5"} 1' in text
+        assert 'grow_stage_seconds_bucket{stage="compute",le="+Inf"} 2' in text
+        assert 'grow_stage_seconds_count{stage="compute"} 2' in text
+    
+    def test_timed_decorator(self):
+        """Test that sync and async functions are timed, including failures"""
+        registry = get_metrics()
+        
+        @timed("test.sync")
+        def fail():
+            raise ValueError("boom")
+        
+        @timed("test.async")
+        async def sleep():
+            await asyncio.sleep(0.01)
+            return 1
+        
+        with pytest.raises(ValueError):
+            fail()
+        assert asyncio.run(sleep()) == 1
+        assert registry.histogram("test.sync").count >= 1
+        assert registry.histogram("test.async").sum >= 0.01
+
+class TestMetricsEndpoint:
+    """Test class for the /metrics endpoint"""
+    
+    def test_stages_are_reported(self):
+        """Test that a scoring request and an alert check show up per stage"""
+        response = client.post("/api/scoring", json={
+            "address": "1 Example Street", "suburb": "Fitzroy", "postcode": "3065", "property_type": "residential"
+        })
+        assert response.status_code == 200
+        AlertChecker().check_all_alerts({"current_price": 1.0, "previous_price": 1.0}, {})
+        
+        stages = client.get("/metrics", params={"format": "json"}).json()["stages"]
+        for stage in ("compute", "serialize", "alerts", "request POST /api/scoring"):
+            assert stages[stage]["count"] >= 1
+        
+        text = client.get("/metrics").text
+        assert 'grow_stage_seconds_count{stage="compute"}' in text
+        assert "grow_scoring_batch_requests_total" in text
+
+class TestSamplingProfiler:
+    """Test class for the sampling profiler"""
+    
+    def test_captures_busy_thread(self):
+        """Test that a busy thread's frames appear in the folded stacks"""
+        stop = threading.Event()
+        
+        def busy_loop():
+            while not stop.is_set():
+                sum(range(1000))
+        
+        worker = threading.Thread(target=busy_loop, name="busy")
+        worker.start()
+        try:
+            folded = SamplingProfiler(interval=0.001).run(0.1)
+        finally:
+            stop.set()
+            worker.join()
+        
+        lines = [line for line in folded.splitlines() if "busy_loop" in line]
+        assert lines
+        stack, count = lines[0].rsplit(" ", 1)
+        assert stack.startswith("busy;") and int(count) > 0
+    
+    def test_endpoint_is_opt_in(self, monkeypatch):
+        """Test that /debug/profile is off by default and returns folded stacks when enabled"""
+        monkeypatch.setattr(main.Settings, "PROFILER_ENABLED", False)
+        assert client.post("/debug/profile", params={"seconds": 0.05}).status_code == 404
+        
+        monkeypatch.setattr(main.Settings, "PROFILER_ENABLED", True)
+        assert client.post("/debug/profile", params={"seconds": 1000}).status_code == 400
+        response = client.post("/debug/profile", params={"seconds": 0.05, "interval_ms": 5})
+        assert response.status_code == 200
+        assert response.text.strip()
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,141 @@
+"""
+Tests for POI infrastructure scoring
+Tests for the POI grid, accessibility scores and the infrastructure table
+"""
+
+import pytest
+import numpy as np
+import json
+import sys
+import os
+
+# Add module path to sys.path (the grid uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring.logic.scoring_algorithms import (
+    INFRASTRUCTURE_FALLBACK,
+    calculate_infrastructure_score,
+    calculate_infrastructure_score_batch
+)
+from backend.scoring.score_table import write_rows
+from backend.spatial import poi_grid
+from backend.spatial.poi_grid import (
+    POI_CATEGORIES,
+    InfrastructureTable,
+    PointGrid,
+    accessibility,
+    build_infrastructure_scores,
+    get_infrastructure_table,
+    haversine_km,
+    load_points
+)
+from backend.spatial.sa2_index import SA2Index
+
+@pytest.fixture
+def small_index():
+    return SA2Index(
+        codes=["1", "2", "3"],
+        names=["Inner", "Outer", "Remote"],
+        sa4_codes=["10", "10", "20"],
+        states=["NSW", "NSW", "NT"],
+        lon=[151.20, 151.40, 133.00],
+        lat=[-33.87, -33.70, -25.00]
+    )
+
+class TestPointGrid:
+    """Test class for grid radius queries"""
+    
+    def test_radius_matches_brute_force(self):
+        """Test that grid queries return the same distances as a full scan"""
+        rng = np.random.default_rng(3)
+        lon = rng.uniform(150.5, 151.5, 5000)
+        lat = rng.uniform(-34.3, -33.5, 5000)
+        grid = PointGrid(lon, lat)
+        
+        for x, y, radius in zip(rng.uniform(150.5, 151.5, 50), rng.uniform(-34.3, -33.5, 50), rng.uniform(0.5, 20, 50)):
+            expected = haversine_km(x, y, lon, lat)
+            expected = np.sort(expected[expected <= radius])
+            np.testing.assert_allclose(np.sort(grid.within_radius(x, y, radius)), expected)
+    
+    def test_empty_grid(self):
+        """Test that an empty grid returns no distances"""
+        grid = PointGrid([], [])
+        assert len(grid) == 0
+        assert len(grid.within_radius(151.2, -33.87, 5.0)) == 0
+
+class TestAccessibility:
+    """Test class for distance-decayed accessibility"""
+    
+    def test_closer_and_more_points_score_higher(self):
+        """Test that accessibility grows with proximity and density, bounded by 100"""
+        config = POI_CATEGORIES["schools"]
+        grid = PointGrid([151.20, 151.21, 151.22], [-33.87, -33.87, -33.87])
+        scores = accessibility(grid, [151.20, 151.25, 140.0], [-33.87, -33.87, -33.87], config)
+        assert scores[0] > scores[1] > scores[2] == 0.0
+        assert scores[0] < 100.0
+        
+        denser = PointGrid([151.20] * 30, [-33.87] * 30)
+        assert accessibility(denser, [151.20], [-33.87], config)[0] > scores[0]
+
+class TestInfrastructureTable:
+    """Test class for building and reading per-SA2 scores"""
+    
+    def test_build_and_lookup(self, small_index, tmp_path):
+        """Test that built scores round-trip through the table"""
+        poi_path = tmp_path / "schools.geojson"
+        poi_path.write_text(json.dumps({"type": "FeatureCollection", "features": [
+            {"type": "Feature", "geometry": {"type": "Point", "coordinates": [151.201, -33.871]}, "properties": {}},
+            {"type": "Feature", "geometry": None, "properties": {}}
+        ]}))
+        csv_path = tmp_path / "shops.csv"
+        csv_path.write_text("name,longitude,latitude\nA,151.2,-33.87\nB,,\n")
+        
+        points = {"schools": load_points(str(poi_path)), "shops": load_points(str(csv_path))}
+        assert len(points["schools"][0]) == 1 and len(points["shops"][0]) == 1
+        
+        rows = build_infrastructure_scores(small_index, points)
+        assert rows["schools"][0] > 0 and rows["transport"][0] == 0
+        assert rows["infrastructure_score"][0] > rows["infrastructure_score"][1] >= rows["infrastructure_score"][2] == 0
+        
+        table_path = str(tmp_path / "infrastructure.npy")
+        write_rows(table_path, rows)
+        table = InfrastructureTable(table_path)
+        assert table.get("1")["infrastructure_score"] == rows["infrastructure_score"][0]
+        assert table.get("9") is None
+        
+        scores = table.scores(["3", None, "1", "9"])
+        assert scores[0] == rows["infrastructure_score"][2]
+        assert scores[2] == rows["infrastructure_score"][0]
+        assert np.isnan(scores[1]) and np.isnan(scores[3])
+    
+    def test_shared_table_follows_the_file(self, small_index, tmp_path, monkeypatch):
+        """Test that the shared table is not cached while missing and reloads when rebuilt"""
+        table_path = str(tmp_path / "infrastructure.npy")
+        monkeypatch.setattr(poi_grid.Settings, "INFRASTRUCTURE_TABLE_PATH", table_path)
+        monkeypatch.setattr(poi_grid, "_infrastructure_table", None)
+        monkeypatch.setattr(poi_grid, "_infrastructure_table_source", None)
+        assert get_infrastructure_table() is None
+        
+        write_rows(table_path, build_infrastructure_scores(small_index, {}))
+        first = get_infrastructure_table()
+        assert first.get("1")["infrastructure_score"] == 0
+        assert get_infrastructure_table() is first
+        
+        points = {"schools": (np.array([151.201]), np.array([-33.871]))}
+        rows = build_infrastructure_scores(small_index, points)
+        write_rows(table_path, rows)
+        assert get_infrastructure_table().get("1")["infrastructure_score"] == rows["infrastructure_score"][0] > 0
+
+class TestInfrastructureScoring:
+    """Test class for infrastructure scores in the scoring algorithms"""
+    
+    def test_scalar_matches_batch(self):
+        """Test that table scores and the fallback agree between scalar and batch paths"""
+        values = [72.5, None, float("nan"), 0.0]
+        batch = calculate_infrastructure_score_batch({"infrastructure_score": np.array(values, dtype=object)})
+        scalar = [calculate_infrastructure_score({"infrastructure_score": value}) for value in values]
+        assert batch.tolist() == scalar == [72.5, INFRASTRUCTURE_FALLBACK, INFRASTRUCTURE_FALLBACK, 0.0]
+        assert calculate_infrastructure_score({}) == INFRASTRUCTURE_FALLBACK
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,160 @@
+"""
+Tests for portfolio aggregates
+Tests for incremental rollups and the portfolio endpoints
+"""
+
+import pytest
+import asyncio
+import random
+import sys
+import os
+
+# Add module path to sys.path (the portfolio service uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from backend.portfolio.aggregates import Portfolio
+from backend.scoring.main import HoldingRequest, app, make_holdings
+
+client = TestClient(app)
+
+def make_holding(property_id, score, value=500000.0, suburb="Fitzroy", sa4_code="206", growth=0.05, rental_yield=0.04):
+    return {
+        "property_id": property_id,
+        "suburb": suburb,
+        "sa2_code": None,
+        "sa4_code": sa4_code,
+        "value": value,
+        "overall_score": score,
+        "growth_potential": "A" if score >= 75 else "B",
+        "risk_level": "Low" if score >= 75 else "Medium",
+        "growth": growth,
+        "rental_yield": rental_yield
+    }
+
+class TestPortfolio:
+    """Test class for running portfolio aggregates"""
+    
+    def test_aggregates(self):
+        """Test score distribution, exposure and value-weighted growth and yield"""
+        portfolio = Portfolio("p")
+        portfolio.upsert(make_holding("a", 80.0, value=300000.0, growth=0.10, rental_yield=0.03))
+        portfolio.upsert(make_holding("b", 60.0, value=100000.0, suburb="Carlton", sa4_code="207", growth=-0.02, rental_yield=None))
+        
+        summary = portfolio.summary()
+        assert summary["holdings"] == 2
+        assert summary["total_value"] == 400000.0
+        assert summary["scores"]["mean"] == 70.0
+        assert summary["scores"]["std"] == pytest.approx(10.0)
+        assert [bucket["count"] for bucket in summary["scores"]["histogram"]][6:9] == [1, 0, 1]
+        assert summary["scores"]["growth_potential"]["A"] == 1
+        assert summary["weighted_growth"] == pytest.approx((300000 * 0.10 - 100000 * 0.02) / 400000)
+        assert summary["weighted_yield"] == pytest.approx(0.03)
+        assert summary["exposure"]["suburb"][0] == {"key": "Fitzroy", "holdings": 1, "value": 300000.0, "share": 0.75}
+        assert [entry["key"] for entry in summary["exposure"]["sa4"]] == ["206", "207"]
+    
+    def test_incremental_matches_rebuild(self):
+        """Test that random adds, rescores and removals leave the same aggregates as a full recompute"""
+        rng = random.Random(3)
+        portfolio = Portfolio("p")
+        for _ in range(2000):
+            property_id = str(rng.randrange(200))
+            if rng.random() < 0.3:
+                portfolio.remove(property_id)
+            else:
+                portfolio.upsert(make_holding(
+                    property_id,
+                    rng.uniform(0, 100),
+                    value=rng.choice([None, rng.uniform(1e5, 2e6)]),
+                    suburb=f"Suburb {rng.randrange(20)}",
+                    sa4_code=str(rng.randrange(5)),
+                    growth=rng.uniform(-0.1, 0.2)
+                ))
+        
+        incremental = portfolio.summary(top=100)
+        portfolio.rebuild()
+        rebuilt = portfolio.summary(top=100)
+        assert incremental["holdings"] == rebuilt["holdings"] > 0
+        assert incremental["weighted_yield"] == pytest.approx(rebuilt["weighted_yield"])
+        assert incremental["scores"]["histogram"] == rebuilt["scores"]["histogram"]
+        assert incremental["scores"]["risk_level"] == rebuilt["scores"]["risk_level"]
+        assert incremental["total_value"] == pytest.approx(rebuilt["total_value"])
+        assert incremental["weighted_growth"] == pytest.approx(rebuilt["weighted_growth"])
+        assert {e["key"]: e["holdings"] for e in incremental["exposure"]["suburb"]} == \
+            {e["key"]: e["holdings"] for e in rebuilt["exposure"]["suburb"]}
+    
+    def test_removals_leave_no_residue(self):
+        """Test that removing every contributing holding resets the weighted sums instead of leaving float residue"""
+        rng = random.Random(7)
+        for _ in range(200):
+            portfolio = Portfolio("p")
+            for i in range(5):
+                portfolio.upsert(make_holding(str(i), 70.0, value=rng.uniform(1e5, 2e6), growth=rng.uniform(-0.1, 0.2)))
+            portfolio.upsert(make_holding("unvalued", 70.0, value=None, growth=None, rental_yield=None))
+            for i in range(5):
+                portfolio.remove(str(i))
+            
+            summary = portfolio.summary()
+            assert summary["holdings"] == 1
+            assert summary["weighted_growth"] is None and summary["weighted_yield"] is None
+            assert summary["total_value"] == 0.0
+            assert summary["exposure"]["suburb"][0]["value"] == 0.0
+            assert summary["exposure"]["suburb"][0]["share"] is None
+    
+    def test_rescore_and_remove(self):
+        """Test that rescoring replaces a holding's contribution and removal empties the portfolio"""
+        portfolio = Portfolio("p")
+        assert portfolio.upsert(make_holding("a", 50.0)) is None
+        assert portfolio.upsert(make_holding("a", 90.0))["overall_score"] == 50.0
+        assert portfolio.summary()["scores"]["mean"] == 90.0
+        assert portfolio.remove("missing") is None
+        
+        portfolio.remove("a")
+        summary = portfolio.summary()
+        assert summary["holdings"] == 0 and summary["total_value"] == 0.0
+        assert summary["scores"]["mean"] is None and summary["weighted_growth"] is None
+        assert summary["exposure"] == {"suburb": [], "sa4": []}
+        
+        with pytest.raises(ValueError):
+            portfolio.upsert({"property_id": "b"})
+
+class TestPortfolioEndpoints:
+    """Test class for the portfolio API"""
+    
+    def test_upsert_get_and_remove(self):
+        """Test that holdings are scored on upsert and reflected in the dashboard"""
+        holdings = [
+            {"property_id": "h1", "address": "1 Example Street", "suburb": "Fitzroy", "postcode": "3065",
+             "property_type": "residential", "current_price": 900000, "previous_price": 800000},
+            {"property_id": "h2", "address": "2 Example Street", "suburb": "Carlton", "postcode": "3053",
+             "property_type": "residential", "current_price": 600000, "rental_yield": 0.04, "overall_score": 62.5}
+        ]
+        response = client.put("/api/portfolios/test-portfolio/holdings", json=holdings)
+        assert response.status_code == 200
+        summary = response.json()
+        assert summary["holdings"] == 2
+        assert summary["total_value"] == 1500000
+        assert summary["weighted_growth"] == pytest.approx(0.125)
+        assert summary["weighted_yield"] == pytest.approx(0.04)
+        
+        assert client.get("/api/portfolios/test-portfolio").json()["version"] == summary["version"]
+        assert client.delete("/api/portfolios/test-portfolio/holdings/h1").json()["holdings"] == 1
+        assert client.delete("/api/portfolios/test-portfolio/holdings/h1").status_code == 404
+        assert client.get("/api/portfolios/unknown").status_code == 404
+    
+    def test_holdings_scored_in_chunks(self):
+        """Test that chunked scoring gives the same holdings as a single chunk"""
+        requests = [
+            HoldingRequest(property_id=f"p{i}", address=f"{i} Example Street", suburb=suburb, postcode="3065",
+                           property_type="residential", overall_score=50.0 if i % 3 == 0 else None)
+            for i, suburb in enumerate(["Fitzroy", "Carlton", "Richmond", "Collingwood", "Brunswick"] * 2)
+        ]
+        
+        chunked = asyncio.run(make_holdings(requests, 2))
+        
+        assert chunked == asyncio.run(make_holdings(requests, 1000))
+        assert [holding["overall_score"] for holding in chunked][::3] == [50.0] * 4
+
+if __name__ == "__main__":
+    pytest.main([__file__])
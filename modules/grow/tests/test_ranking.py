@@ -0,0 +1,157 @@
+"""
+Tests for strategy-weighted SA2 ranking
+Tests for strategy-weighted SA2 ranking against a full sort
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path (the ranker uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from backend.scoring import main
+from backend.scoring.main import app
+from backend.scoring.ranking import SA2Ranker, STRATEGY_FACTORS, get_sa2_ranker
+from backend.spatial.sa2_index import get_sa2_index
+
+client = TestClient(app)
+
+WEIGHTS = {"yield": 20, "vacancy": 10, "growth5y": 30, "seifa": 10, "stock": 10, "infra": 20}
+
+@pytest.fixture
+def factor_file(tmp_path, monkeypatch):
+    # The repo ships no SA2 factor data; tests use random factors for every region
+    index = get_sa2_index()
+    rng = np.random.default_rng(0)
+    path = tmp_path / "sa2_factors.npz"
+    np.savez(path, codes=index.codes, **{factor: rng.uniform(0, 100, len(index)) for factor in STRATEGY_FACTORS})
+    monkeypatch.setattr(main.Settings, "SA2_FACTORS_PATH", str(path))
+    return path
+
+@pytest.fixture
+def ranker(factor_file):
+    return get_sa2_ranker()
+
+class TestSA2Ranker:
+    """Test class for SA2 ranking"""
+    
+    def test_top_k_matches_full_sort(self, ranker):
+        """Test that partial selection returns the same regions as a full sort"""
+        rng = np.random.default_rng(3)
+        for _ in range(50):
+            weights = dict(zip(STRATEGY_FACTORS, rng.uniform(0, 40, len(STRATEGY_FACTORS))))
+            k = int(rng.integers(1, 200))
+            scores = ranker.score(weights)
+            
+            positions, top_scores = ranker.top_k(weights, k)
+            
+            assert np.array_equal(top_scores, np.sort(scores)[::-1][:k])
+            assert np.array_equal(scores[positions], top_scores)
+    
+    def test_scores_are_weighted_means(self, ranker):
+        """Test that a single positive weight ranks by that factor alone"""
+        scores = ranker.score({"infra": 5})
+        
+        assert np.allclose(scores, ranker.factors[STRATEGY_FACTORS.index("infra")])
+        assert 0 <= scores.min() and scores.max() <= 100
+    
+    def test_state_filter(self, ranker):
+        """Test that results are restricted to the requested state"""
+        results = ranker.rank(WEIGHTS, 20, state="Tasmania")
+        
+        assert len(results) == 20
+        assert {result["state"] for result in results} == {"Tasmania"}
+        assert [result["rank"] for result in results] == list(range(1, 21))
+    
+    def test_from_npz_aligns_codes(self, tmp_path):
+        """Test that factor files are aligned to index positions by code"""
+        index = get_sa2_index()
+        codes = index.codes[::-1][:100]
+        path = tmp_path / "factors.npz"
+        np.savez(path, codes=codes, **{factor: np.arange(100.0) for factor in STRATEGY_FACTORS})
+        
+        ranker = SA2Ranker.from_npz(index, str(path))
+        
+        assert ranker.factors[0][index.position(str(codes[7]))] == 7.0
+        assert np.allclose(ranker.factors[0][index.position(str(index.codes[0]))], 49.5)
+    
+    def test_from_npz_fills_gaps_per_factor(self, tmp_path):
+        """Test that NaN in any factor, not just the first, is filled from that factor's mean"""
+        index = get_sa2_index()
+        columns = {factor: np.full(len(index), 10.0 * (f + 1)) for f, factor in enumerate(STRATEGY_FACTORS)}
+        columns["vacancy"][:5] = np.nan
+        columns["infra"][-1] = np.inf
+        path = tmp_path / "factors.npz"
+        np.savez(path, codes=index.codes, **columns)
+        
+        ranker = SA2Ranker.from_npz(index, str(path))
+        
+        assert np.all(np.isfinite(ranker.factors))
+        assert np.all(ranker.factors[STRATEGY_FACTORS.index("vacancy")] == 20.0)
+        assert ranker.factors[STRATEGY_FACTORS.index("infra")][-1] == 60.0
+    
+    def test_from_npz_rejects_empty_factor(self, tmp_path):
+        """Test that a factor without any finite value is rejected"""
+        index = get_sa2_index()
+        columns = {factor: np.ones(len(index)) for factor in STRATEGY_FACTORS}
+        columns["seifa"][:] = np.nan
+        path = tmp_path / "factors.npz"
+        np.savez(path, codes=index.codes, **columns)
+        
+        with pytest.raises(ValueError):
+            SA2Ranker.from_npz(index, str(path))
+    
+    @pytest.mark.parametrize("weights", [{"bogus": 1}, {"yield": -1}, {"yield": 0}])
+    def test_rejects_invalid_weights(self, ranker, weights):
+        """Test validation of strategy weights"""
+        with pytest.raises(ValueError):
+            ranker.weight_vector(weights)
+
+class TestRankingAPI:
+    """Test class for the ranking endpoint"""
+    
+    def test_rank_endpoint_without_factor_data(self, tmp_path, monkeypatch):
+        """Test that ranking is unavailable rather than made up when no factor file exists"""
+        monkeypatch.setattr(main.Settings, "SA2_FACTORS_PATH", str(tmp_path / "missing.npz"))
+        assert get_sa2_ranker() is None
+        
+        response = client.post("/api/scoring/rank", json={"weights": WEIGHTS, "k": 10})
+        assert response.status_code == 503
+    
+    def test_rank_endpoint(self, factor_file):
+        """Test that the endpoint returns the top k regions best first"""
+        response = client.post("/api/scoring/rank", json={"weights": WEIGHTS, "k": 10})
+        
+        assert response.status_code == 200
+        scores = [result["score"] for result in response.json()]
+        assert len(scores) == 10
+        assert scores == sorted(scores, reverse=True)
+    
+    def test_rank_endpoint_with_factor_gaps(self, tmp_path, monkeypatch):
+        """Test that NaN in a later factor column does not reach the response"""
+        index = get_sa2_index()
+        rng = np.random.default_rng(1)
+        columns = {factor: rng.uniform(0, 100, len(index)) for factor in STRATEGY_FACTORS}
+        columns["vacancy"][np.flatnonzero(index.states == "New South Wales")[:5]] = np.nan
+        path = tmp_path / "gaps.npz"
+        np.savez(path, codes=index.codes, **columns)
+        monkeypatch.setattr(main.Settings, "SA2_FACTORS_PATH", str(path))
+        
+        response = client.post("/api/scoring/rank", json={"weights": WEIGHTS, "k": 1000, "state": "New South Wales"})
+        
+        assert response.status_code == 200
+        assert all(result["score"] is not None for result in response.json())
+    
+    @pytest.mark.parametrize("body", [{"weights": {"bogus": 1}}, {"weights": WEIGHTS, "k": 0}])
+    def test_rank_endpoint_rejects_bad_requests(self, factor_file, body):
+        """Test that invalid weights and k are rejected"""
+        response = client.post("/api/scoring/rank", json=body)
+        
+        assert response.status_code == 400
+
+if __name__ == "__main__":
+    pytest.main([__file__])
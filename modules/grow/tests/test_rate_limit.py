@@ -0,0 +1,129 @@
+"""
+Tests for request rate limiting
+Tests for the token-bucket and shared backends and the rate limit middleware
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add module path to sys.path (the limiter uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.shared.rate_limit import InMemoryRateLimitBackend, RateLimitMiddleware, SharedRateLimitBackend
+
+class FakeClock:
+    """Manually advanced clock"""
+    
+    def __init__(self, now=0.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+class FakeCounterStore:
+    """Minimal stand-in for an asyncio Redis client"""
+    
+    def __init__(self):
+        self.counts = {}
+        self.expiry = {}
+    
+    async def incr(self, key):
+        self.counts[key] = self.counts.get(key, 0) + 1
+        return self.counts[key]
+    
+    async def expire(self, key, seconds):
+        self.expiry[key] = seconds
+
+class TestInMemoryRateLimitBackend:
+    """Test class for in-process token buckets"""
+    
+    def test_burst_then_refill(self):
+        """Test that a full bucket allows a burst and refills at requests / window"""
+        clock = FakeClock()
+        backend = InMemoryRateLimitBackend(requests=3, window=60, clock=clock)
+        
+        assert [backend.take("a")[0] for _ in range(4)] == [True, True, True, False]
+        assert backend.take("a")[1] == pytest.approx(20.0)
+        assert backend.take("b")[0]
+        
+        clock.now = 20.0
+        assert backend.take("a")[0]
+        assert not backend.take("a")[0]
+        
+        clock.now = 1000.0
+        assert [backend.take("a")[0] for _ in range(4)] == [True, True, True, False]
+    
+    def test_idle_buckets_are_evicted(self):
+        """Test that the bucket map stays bounded"""
+        clock = FakeClock()
+        backend = InMemoryRateLimitBackend(requests=1, window=10, max_keys=2, clock=clock)
+        backend.take("a")
+        backend.take("b")
+        clock.now = 5.0
+        backend.take("c")
+        assert len(backend) == 2
+        
+        clock.now = 20.0
+        backend.take("d")
+        assert len(backend) == 1
+    
+    def test_reset_refills_every_client(self):
+        """Test that reset drops all buckets"""
+        backend = InMemoryRateLimitBackend(requests=1, window=60, clock=FakeClock())
+        assert backend.take("a")[0] and not backend.take("a")[0]
+        
+        backend.reset()
+        assert len(backend) == 0
+        assert backend.take("a")[0]
+
+class TestSharedRateLimitBackend:
+    """Test class for the shared fixed-window backend"""
+    
+    def test_counts_per_window(self):
+        """Test that the allowance is shared and resets with the next window"""
+        store = FakeCounterStore()
+        clock = FakeClock(120.0)
+        backend = SharedRateLimitBackend(store, requests=2, window=60, clock=clock)
+        
+        async def run(count):
+            return [await backend.acquire("a") for _ in range(count)]
+        
+        results = asyncio.run(run(3))
+        assert [allowed for allowed, _ in results] == [True, True, False]
+        assert results[2][1] == pytest.approx(60.0)
+        assert store.expiry == {"grow:ratelimit:a:2": 60}
+        
+        clock.now = 180.0
+        assert asyncio.run(run(1))[0][0]
+
+class TestRateLimitMiddleware:
+    """Test class for the ASGI middleware"""
+    
+    def test_rejects_with_retry_after(self):
+        """Test 429 responses once a client's allowance is used, and exempt paths"""
+        app = FastAPI()
+        
+        @app.get("/ping")
+        async def ping():
+            return {"ok": True}
+        
+        @app.get("/health")
+        async def health():
+            return {"status": "healthy"}
+        
+        app.add_middleware(RateLimitMiddleware, backend=InMemoryRateLimitBackend(requests=2, window=60))
+        client = TestClient(app)
+        
+        assert [client.get("/ping").status_code for _ in range(3)] == [200, 200, 429]
+        response = client.get("/ping")
+        assert response.json() == {"detail": "Rate limit exceeded"}
+        assert response.headers["retry-after"] == "30"
+        assert client.get("/health").status_code == 200
+
+if __name__ == "__main__":
+    pytest.main([__file__])
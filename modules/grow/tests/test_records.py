@@ -0,0 +1,82 @@
+"""
+Tests for lightweight record types
+Tests for lightweight record types
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring.logic.scoring_algorithms import (
+    calculate_overall_score_batch,
+    classify_growth_potential_batch,
+    classify_risk_level_batch
+)
+from backend.shared.models import MarketData, PropertyData, ScoringResult
+from backend.shared.records import MarketBatch, MarketRecord, PropertyBatch, PropertyRecord, ScoringBatch, ScoringRecord
+
+class TestRecords:
+    """Test class for conversions between records and pydantic models"""
+    
+    def test_property_round_trip(self):
+        """Test PropertyData -> PropertyRecord -> PropertyData"""
+        model = PropertyData(
+            address="1 Example Street", suburb="Fitzroy", postcode="3065",
+            property_type="residential", current_price=900000, bedrooms=3
+        )
+        
+        assert PropertyRecord.from_model(model).to_model() == model
+    
+    def test_market_round_trip(self):
+        """Test MarketData -> MarketRecord -> MarketData"""
+        model = MarketData(suburb="Fitzroy", postcode="3065", median_price=1.2e6, days_on_market=30)
+        
+        assert MarketRecord.from_model(model).to_model() == model
+    
+    def test_scoring_round_trip_serializes_identically(self):
+        """Test that converted results produce the same JSON"""
+        model = ScoringResult(
+            overall_score=86.2, growth_potential="A+", risk_level="Low",
+            metrics={"location": 100, "infrastructure": 85, "market_trends": 80, "rental_yield": 75},
+            recommendations=["Optimize rental income"]
+        )
+        
+        assert ScoringRecord.from_model(model).to_model().model_dump_json() == model.model_dump_json()
+    
+    def test_property_batch_columns(self):
+        """Test that batches keep missing numbers as NaN and restore them as None"""
+        rows = [
+            {"address": "a", "suburb": "s", "postcode": "1", "property_type": "land", "bedrooms": 2},
+            PropertyRecord("b", "s", "2", "commercial", current_price=5.0),
+            PropertyData(address="c", suburb="s", postcode="3", property_type="residential", land_size=400)
+        ]
+        
+        batch = PropertyBatch.from_rows(rows)
+        
+        assert len(batch) == 3
+        assert batch["property_type"].tolist() == ["land", "commercial", "residential"]
+        assert batch["land_size"][2] == 400.0 and np.isnan(batch["current_price"][2])
+        assert np.isnan(batch["bedrooms"][1])
+        assert batch.record(0).bedrooms == 2
+        assert batch.record(1).bedrooms is None
+        assert batch.to_models()[1].property_type.value == "commercial"
+    
+    def test_scoring_batch_wraps_score_arrays(self):
+        """Test that scoring batches reuse the batch engine's arrays"""
+        scores = calculate_overall_score_batch({}, n=4)
+        
+        batch = ScoringBatch.from_scores(
+            scores,
+            classify_growth_potential_batch(scores["overall_score"]),
+            classify_risk_level_batch(scores["overall_score"])
+        )
+        
+        assert batch["overall_score"] is scores["overall_score"]
+        assert batch.to_models()[0].metrics.infrastructure == 85.0
+
+if __name__ == "__main__":
+    pytest.main([__file__])
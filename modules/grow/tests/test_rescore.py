@@ -0,0 +1,69 @@
+"""
+Tests for the nationwide rescoring job
+Tests for the nationwide rescoring job
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path (the job uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring.rescore import PartitionPlan, rescore_national
+from backend.scoring.score_table import ScoreTable, build_score_table
+from backend.spatial.sa2_index import get_sa2_index
+
+@pytest.fixture(scope="module")
+def index():
+    return get_sa2_index()
+
+def _inputs(index, count):
+    return {
+        code: {"median_price": 600000 + i, "rental_yield": 0.04, "suburb": f"Suburb {i}"}
+        for i, code in enumerate(index.codes[:count].tolist())
+    }
+
+class TestRescore:
+    """Test class for partitioned parallel rescoring"""
+    
+    @pytest.mark.parametrize("partition_by", ["sa4", "state"])
+    def test_partitions_cover_all_regions(self, index, partition_by):
+        """Test that partitions are contiguous, disjoint and complete"""
+        plan = PartitionPlan(index, partition_by=partition_by)
+        
+        ranges = [(start, end) for _, start, end in plan.partitions]
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(index)
+        assert all(previous[1] == current[0] for previous, current in zip(ranges, ranges[1:]))
+        assert len({name for name, _, _ in plan.partitions}) == len(plan.partitions)
+    
+    def test_matches_sequential_table(self, index, tmp_path):
+        """Test that the parallel job writes the same rows as a sequential build"""
+        inputs = _inputs(index, 300)
+        parallel_path = str(tmp_path / "parallel.npy")
+        sequential_path = str(tmp_path / "sequential.npy")
+        
+        report = rescore_national(parallel_path, inputs, workers=2, index=index)
+        build_score_table(sequential_path, {code: inputs.get(code, {}) for code in index.codes.tolist()})
+        
+        parallel = np.load(parallel_path)
+        sequential = np.load(sequential_path)
+        assert report["rows"] == len(index) == len(parallel)
+        assert sum(timing["rows"] for timing in report["partitions"].values()) == len(index)
+        for field in parallel.dtype.names:
+            if field != "updated_at":
+                assert np.array_equal(parallel[field], sequential[field])
+        assert sorted(os.listdir(tmp_path)) == ["parallel.npy", "sequential.npy"]
+    
+    def test_refresh_after_rescore_is_a_no_op(self, index, tmp_path):
+        """Test that stored input hashes match what ScoreTable.refresh computes"""
+        inputs = _inputs(index, 50)
+        path = str(tmp_path / "scores.npy")
+        
+        rescore_national(path, inputs, partition_by="state", workers=2, index=index)
+        
+        assert ScoreTable(path).refresh(inputs) == []
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,73 @@
+"""
+Tests for the fast-path scoring responses
+Tests for the fast-path scoring responses
+"""
+
+import pytest
+import random
+import sys
+import os
+from datetime import datetime, timezone
+
+# Add module path to sys.path (the responses use package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.responses import JSONResponse
+
+from backend.scoring.responses import ScoringResultResponse, encode_scoring_result
+from backend.shared.models import GrowthPotential, RiskLevel, ScoringResult
+
+def _default_body(result):
+    return JSONResponse(result.model_dump(mode="json")).body.decode("utf-8")
+
+def _result(score, recommendations=("Optimize rental income",), created_at=None):
+    return ScoringResult(
+        overall_score=score,
+        growth_potential=random.choice(list(GrowthPotential)),
+        risk_level=random.choice(list(RiskLevel)),
+        metrics={"location": score, "infrastructure": 85, "market_trends": 100 - score, "rental_yield": 1e-7},
+        recommendations=list(recommendations),
+        created_at=created_at or datetime(2025, 3, 1, 9, 30, 0, 123456)
+    )
+
+class TestScoringResultResponse:
+    """Test class for byte-identical fast-path serialization"""
+    
+    def test_matches_default_for_random_results(self):
+        """Test that the fast path reproduces FastAPI's default encoding exactly"""
+        random.seed(12)
+        for _ in range(2000):
+            result = _result(random.uniform(0, 100))
+            assert encode_scoring_result(result) == _default_body(result)
+    
+    @pytest.mark.parametrize("recommendations", [
+        [], ["Quote \" and backslash \\"], ["Ümlaut and emoji 😀"], ["\x00\x1f\x7f\t\n/"]
+    ])
+    def test_matches_default_for_strings(self, recommendations):
+        """Test escaping of recommendation strings"""
+        result = _result(50.5, recommendations)
+        
+        assert encode_scoring_result(result) == _default_body(result)
+    
+    @pytest.mark.parametrize("created_at", [datetime(2025, 1, 1), datetime(2025, 1, 1, tzinfo=timezone.utc)])
+    def test_matches_default_for_timestamps(self, created_at):
+        """Test naive and timezone-aware timestamps"""
+        result = _result(0.0, created_at=created_at)
+        
+        assert encode_scoring_result(result) == _default_body(result)
+    
+    def test_response_body(self):
+        """Test response bodies for single results and lists"""
+        results = [_result(score) for score in (0.0, 33.3, 86.2, 100.0)]
+        
+        assert ScoringResultResponse(results[0]).body == JSONResponse(results[0].model_dump(mode="json")).body
+        assert ScoringResultResponse(results).body == JSONResponse(
+            [result.model_dump(mode="json") for result in results]
+        ).body
+    
+    def test_other_content_renders_as_json(self):
+        """Test that non-result content falls back to JSONResponse"""
+        assert ScoringResultResponse({"detail": "x"}).body == JSONResponse({"detail": "x"}).body
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+"""
+Tests for the materialized score table
+Tests for the materialized score table
+"""
+
+import pytest
+import json
+import sys
+import os
+
+# Add module path to sys.path (the table uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from fastapi.testclient import TestClient
+
+from backend.scoring import main
+from backend.scoring.logic import weights
+from backend.scoring.logic.scoring_algorithms import calculate_overall_score
+from backend.scoring.score_table import ScoreTable, build_score_table
+
+def _inputs(count):
+    return {
+        str(101021000 + i): {"suburb": f"Suburb {i}", "postcode": str(2000 + i), "median_price": 700000 + i}
+        for i in range(count)
+    }
+
+class TestScoreTable:
+    """Test class for building, reading and refreshing the score table"""
+    
+    def test_build_and_lookup(self, tmp_path):
+        """Test that stored scores equal the scalar scoring path"""
+        path = str(tmp_path / "scores.npy")
+        inputs = _inputs(20)
+        
+        assert build_score_table(path, inputs) == 20
+        table = ScoreTable(path)
+        
+        row = table.get("101021005")
+        expected = calculate_overall_score(inputs["101021005"])
+        assert row["overall_score"] == expected["overall_score"]
+        assert row["component_scores"] == expected["component_scores"]
+        assert row["growth_potential"] == "A+"
+        assert table.get("999999999") is None
+    
+    def test_refresh_rescores_only_changed_suburbs(self, tmp_path):
+        """Test that unchanged inputs are skipped and new keys are appended"""
+        path = str(tmp_path / "scores.npy")
+        inputs = _inputs(10)
+        build_score_table(path, inputs)
+        table = ScoreTable(path)
+        
+        updated = dict(inputs)
+        updated["101021003"] = dict(inputs["101021003"], median_price=1)
+        updated["3000"] = {"suburb": "Melbourne", "postcode": "3000"}
+        
+        assert sorted(table.refresh(updated)) == ["101021003", "3000"]
+        assert len(table) == 11
+        assert "3000" in table
+        assert table.refresh(updated) == []
+    
+    def test_weight_change_rescores_everything(self, tmp_path, monkeypatch):
+        """Test that stored rows are stale once the weight profiles change"""
+        path = str(tmp_path / "scores.npy")
+        inputs = _inputs(5)
+        build_score_table(path, inputs)
+        table = ScoreTable(path)
+        assert table.refresh(inputs) == []
+        
+        weights_path = tmp_path / "weights.json"
+        weights_path.write_text(json.dumps({"overall": {"location": 0.7, "infrastructure": 0.1, "market_trends": 0.1, "rental_yield": 0.1}}))
+        monkeypatch.setattr(weights, "_registry", weights.WeightRegistry(path=str(weights_path)))
+        
+        assert sorted(table.refresh(inputs)) == sorted(inputs)
+        assert table.get("101021000")["overall_score"] == calculate_overall_score(inputs["101021000"])["overall_score"] == 94.0
+        assert table.refresh(inputs) == []
+    
+    def test_suburb_endpoint(self, tmp_path, monkeypatch):
+        """Test the API lookup endpoint against a built table"""
+        path = str(tmp_path / "scores.npy")
+        monkeypatch.setattr(main.Settings, "SCORE_TABLE_PATH", path)
+        client = TestClient(main.app)
+        
+        assert client.get("/api/scoring/suburbs/101021001").status_code == 503
+        
+        build_score_table(path, _inputs(3))
+        response = client.get("/api/scoring/suburbs/101021001")
+        
+        assert response.status_code == 200
+        assert response.json()["metrics"]["infrastructure"] == 85.0
+        assert client.get("/api/scoring/suburbs/4000").status_code == 404
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -16,7 +16,10 @@ from scoring.logic.scoring_algorithms import (
     calculate_infrastructure_score,
     calculate_market_trends_score,
     calculate_rental_yield_score,
-    calculate_overall_score
+    calculate_overall_score,
+    calculate_overall_score_batch,
+    properties_to_columns,
+    COMPONENTS
 )
 
 class TestScoringAlgorithms:
@@ -94,5 +97,44 @@ class TestScoringAlgorithms:
         assert "market_trends" in component_scores
         assert "rental_yield" in component_scores
 
+class TestBatchScoring:
+    """Test class for the vectorized batch scoring path"""
+    
+    def _sample_properties(self):
+        return [
+            {
+                "address": f"{i} Test Street",
+                "suburb": "Test Suburb",
+                "postcode": str(2000 + i),
+                "property_type": ["residential", "commercial", "industrial"][i % 3]
+            }
+            for i in range(25)
+        ]
+    
+    def test_batch_matches_scalar(self):
+        """Test that batch results equal the scalar results property by property"""
+        properties = self._sample_properties()
+        
+        batch = calculate_overall_score_batch(properties_to_columns(properties))
+        
+        assert batch["overall_score"].shape == (len(properties),)
+        for i, property_data in enumerate(properties):
+            scalar = calculate_overall_score(property_data)
+            assert batch["overall_score"][i] == scalar["overall_score"]
+            for key in COMPONENTS:
+                assert batch["component_scores"][key][i] == scalar["component_scores"][key]
+    
+    def test_batch_with_explicit_size(self):
+        """Test that an explicit batch size works without any columns"""
+        batch = calculate_overall_score_batch({}, n=3)
+        
+        assert len(batch["overall_score"]) == 3
+        assert set(batch["component_scores"]) == set(COMPONENTS)
+    
+    def test_batch_rejects_ragged_columns(self):
+        """Test that columns of different length are rejected"""
+        with pytest.raises(ValueError):
+            calculate_overall_score_batch({"suburb": ["A", "B"], "postcode": ["2000"]})
+
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
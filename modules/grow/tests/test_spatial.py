@@ -0,0 +1,82 @@
+"""
+Tests for the SA2 spatial index
+Tests for the SA2 spatial index against brute-force distances
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path (the index uses package-relative imports)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.spatial.sa2_index import SA2Index, chord_to_km, get_sa2_index, lonlat_to_unit
+
+@pytest.fixture(scope="module")
+def index():
+    return get_sa2_index()
+
+def _brute_force_km(index, lon, lat):
+    diff = lonlat_to_unit(index.lon, index.lat) - lonlat_to_unit(lon, lat)
+    return chord_to_km(np.linalg.norm(diff, axis=1))
+
+class TestSA2Index:
+    """Test class for SA2 index queries"""
+    
+    def test_loads_point_centroids(self, index):
+        """Test that all point features are loaded and null geometries skipped"""
+        assert 2000 < len(index) < 2473
+        assert index.position("101021007") is not None
+        assert index.position("197979799") is None
+    
+    def test_nearest_matches_brute_force(self, index):
+        """Test k-nearest results against a full scan"""
+        rng = np.random.default_rng(7)
+        for lon, lat in zip(rng.uniform(113, 154, 200), rng.uniform(-43, -11, 200)):
+            expected = np.sort(_brute_force_km(index, lon, lat))[:5]
+            
+            indices, distances = index.nearest_indices(lon, lat, k=5)
+            
+            assert np.allclose(distances, expected)
+            assert np.allclose(_brute_force_km(index, lon, lat)[indices], distances)
+    
+    def test_within_radius_matches_brute_force(self, index):
+        """Test radius results against a full scan"""
+        rng = np.random.default_rng(11)
+        for lon, lat, radius in zip(rng.uniform(113, 154, 100), rng.uniform(-43, -11, 100), rng.uniform(1, 250, 100)):
+            distances = _brute_force_km(index, lon, lat)
+            
+            indices, found = index.within_radius_indices(lon, lat, radius)
+            
+            assert set(indices.tolist()) == set(np.nonzero(distances <= radius)[0].tolist())
+            assert np.all(np.diff(found) >= 0)
+    
+    def test_within_bbox(self, index):
+        """Test bounding-box results against a full scan"""
+        box = (150.9, -34.0, 151.3, -33.7)
+        expected = np.nonzero(
+            (index.lon >= box[0]) & (index.lon <= box[2]) & (index.lat >= box[1]) & (index.lat <= box[3])
+        )[0]
+        
+        assert index.within_bbox_indices(*box).tolist() == expected.tolist()
+        assert len(expected) > 50
+    
+    def test_nearest_records(self, index):
+        """Test the dict result for the Sydney CBD"""
+        result = index.nearest(151.2093, -33.8688, k=1)[0]
+        
+        assert result["state"] == "New South Wales"
+        assert result["sa4_code"] == "117"
+        assert result["distance_km"] < 2
+    
+    def test_small_index(self):
+        """Test an index smaller than one leaf"""
+        index = SA2Index(["a", "b"], ["A", "B"], ["1", "1"], ["S", "S"], [150.0, 151.0], [-33.0, -34.0])
+        
+        indices, _ = index.nearest_indices(150.1, -33.1, k=5)
+        
+        assert indices.tolist() == [0, 1]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
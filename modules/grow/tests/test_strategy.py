@@ -15,8 +15,10 @@ from strategy.suggest import (
     generate_short_term_strategy,
     generate_medium_term_strategy,
     generate_long_term_strategy,
-    get_comprehensive_strategy
+    get_comprehensive_strategy,
+    get_comprehensive_strategy_batch
 )
+import numpy as np
 
 class TestStrategyRecommendations:
     """Test class for strategy recommendations"""
@@ -133,6 +135,34 @@ class TestStrategyRecommendations:
         assert len(strategy["short_term"]) > 0
         assert len(strategy["medium_term"]) > 0
         assert len(strategy["long_term"]) > 0
+    
+    def test_threshold_boundaries(self):
+        """Test that thresholds are strict lower bounds and missing scores fall to the lowest tier"""
+        assert generate_short_term_strategy({"overall_score": 80}) == generate_short_term_strategy({"overall_score": 61})
+        assert generate_short_term_strategy({"overall_score": 60}) == generate_short_term_strategy({})
+        assert generate_short_term_strategy({"overall_score": float("nan")}) == generate_short_term_strategy({})
+        assert generate_long_term_strategy({"metrics": {"market_trends": 80.01}})[0] == "Maximize value appreciation through market growth"
+        assert generate_medium_term_strategy({"growth_potential": "C"}) == generate_medium_term_strategy({})
+    
+    def test_returns_fresh_lists(self):
+        """Test that callers can mutate results without affecting later calls"""
+        first = generate_short_term_strategy({"overall_score": 90})
+        first.append("mutated")
+        assert generate_short_term_strategy({"overall_score": 90}) == [
+            "Focus on renovation for value appreciation", "Optimize rental income"
+        ]
+    
+    def test_batch_matches_scalar(self):
+        """Test that the vectorized engine returns the scalar recommendations for every input"""
+        scores = [0, 59.9, 60, 60.1, 79.9, 80, 80.1, 100, float("nan")]
+        grades = ["A+", "A", "B+", "B", "C", "", "a", "Z", "A+"]
+        
+        batch = get_comprehensive_strategy_batch(np.array(scores), grades, scores[::-1])
+        for i, (score, grade, trends) in enumerate(zip(scores, grades, scores[::-1])):
+            expected = get_comprehensive_strategy(
+                {"overall_score": score, "growth_potential": grade, "metrics": {"market_trends": trends}}
+            )
+            assert {key: list(value[i]) for key, value in batch.items()} == expected
 
 if __name__ == "__main__":
     pytest.main([__file__]) 
\ No newline at end of file
@@ -0,0 +1,142 @@
+"""
+Tests for the weight-profile registry
+Tests for the weight-profile registry
+"""
+
+import pytest
+import json
+import numpy as np
+import sys
+import os
+
+# Add module path to sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.scoring.logic.weights import (
+    DEFAULT_WEIGHT_PROFILES,
+    WeightProfile,
+    WeightRegistry,
+    get_growth_weights,
+    get_risk_weights,
+    get_scoring_weights,
+    get_weight_profile
+)
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+def _write_profiles(path, profiles):
+    # Write and replace so the file identity changes like a real deploy
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(profiles, f)
+    os.replace(tmp_path, path)
+
+class TestWeightProfile:
+    """Test class for compiled weight profiles"""
+    
+    def test_compiled_vector_is_normalized_and_read_only(self):
+        """Test that profiles compile to read-only vectors that sum to 1"""
+        profile = WeightProfile("custom", {"a": 0.5, "b": 0.3, "c": 0.2000001})
+        
+        assert profile.factors == ("a", "b", "c")
+        assert profile.vector.sum() == pytest.approx(1.0, abs=1e-15)
+        with pytest.raises(ValueError):
+            profile.vector[0] = 1.0
+        with pytest.raises(TypeError):
+            profile.mapping["a"] = 1.0
+    
+    @pytest.mark.parametrize("weights", [{"a": 0.5, "b": 0.4}, {"a": 1.5, "b": -0.5}, {"a": float("nan"), "b": 1.0}])
+    def test_rejects_invalid_weights(self, weights):
+        """Test that profiles must be non-negative and sum to 1"""
+        with pytest.raises(ValueError):
+            WeightProfile("custom", weights)
+    
+    def test_dot_matches_dot_columns(self):
+        """Test that scalar and column dot products agree bit for bit"""
+        profile = get_weight_profile("overall")
+        rng = np.random.default_rng(5)
+        columns = [rng.uniform(0, 100, 1000) for _ in profile.factors]
+        
+        expected = profile.dot_columns(columns)
+        
+        assert [profile.dot([column[i] for column in columns]) for i in range(1000)] == expected.tolist()
+    
+    def test_compatibility_wrappers_return_mutable_copies(self):
+        """Test that the dict-returning helpers hand out copies callers may modify"""
+        weights = get_scoring_weights("commercial")
+        weights["location"] = 0.0
+        
+        assert get_scoring_weights("commercial") == get_weight_profile("scoring.commercial").mapping
+        assert get_scoring_weights("commercial")["location"] == pytest.approx(0.35)
+        assert get_scoring_weights("unknown") == DEFAULT_WEIGHT_PROFILES["scoring.residential"]
+        assert type(get_risk_weights()) is dict and type(get_growth_weights()) is dict
+
+class TestWeightRegistry:
+    """Test class for hot-reloading weight profiles"""
+    
+    def test_reloads_changed_file(self, tmp_path):
+        """Test that file changes are picked up after the check interval"""
+        path = str(tmp_path / "weights.json")
+        clock = FakeClock()
+        registry = WeightRegistry(path=path, clock=clock)
+        assert registry.get("risk").mapping == DEFAULT_WEIGHT_PROFILES["risk"]
+        
+        _write_profiles(path, {"income": {"rental_yield": 0.7, "location": 0.3}})
+        assert "income" not in registry
+        
+        clock.now += 1.0
+        assert registry.get("income").factors == ("rental_yield", "location")
+        
+        os.remove(path)
+        clock.now += 1.0
+        registry.get("risk")
+        assert "income" not in registry
+    
+    def test_version_follows_profile_contents(self, tmp_path):
+        """Test that the version changes with the weights and is equal for equal profiles"""
+        path = str(tmp_path / "weights.json")
+        clock = FakeClock()
+        registry = WeightRegistry(path=path, clock=clock)
+        assert registry.version == WeightRegistry().version
+        
+        _write_profiles(path, {"overall": {"rental_yield": 0.4, "market_trends": 0.2, "infrastructure": 0.2, "location": 0.2}})
+        clock.now += 1.0
+        changed = registry.version
+        assert changed != WeightRegistry().version
+        assert changed == WeightRegistry(path=path).version
+    
+    def test_overrides_keep_default_factor_order(self, tmp_path):
+        """Test that overriding a built-in profile keeps its factor order"""
+        path = str(tmp_path / "weights.json")
+        _write_profiles(path, {"overall": {"rental_yield": 0.4, "market_trends": 0.2, "infrastructure": 0.2, "location": 0.2}})
+        
+        profile = WeightRegistry(path=path).get("overall")
+        
+        assert profile.factors == tuple(DEFAULT_WEIGHT_PROFILES["overall"])
+        assert profile.weights == (0.2, 0.2, 0.2, 0.4)
+    
+    @pytest.mark.parametrize("profiles", [
+        {"overall": {"location": 1.0}},
+        {"income": {"rental_yield": 60, "location": 40}},
+        ["not", "a", "mapping"]
+    ])
+    def test_invalid_file_keeps_previous_profiles(self, tmp_path, profiles):
+        """Test that an invalid file is ignored"""
+        path = str(tmp_path / "weights.json")
+        clock = FakeClock()
+        _write_profiles(path, {"income": {"rental_yield": 0.6, "location": 0.4}})
+        registry = WeightRegistry(path=path, clock=clock)
+        
+        _write_profiles(path, profiles)
+        clock.now += 1.0
+        
+        assert registry.get("income").weights == (0.6, 0.4)
+        assert registry.get("overall").mapping == DEFAULT_WEIGHT_PROFILES["overall"]
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: coerce_item with and without a precompiled SchemaCoercer.
+Uses synthetic records shaped like the schools dataset.
+"""
+import os
+import sys
+import random
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from load_json_to_dynamodb import SchemaCoercer, coerce_item  # noqa: E402
+
+
+SUBURBS = ["Parramatta", "Fitzroy", "Toowong", "Subiaco", "Glenelg", "Sandy Bay", "Braddon"]
+STATES = ["NSW", "VIC", "QLD", "WA", "SA", "TAS", "ACT", "NT"]
+
+
+def make_records(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        records.append({
+            "School_code": str(40000 + i),
+            "AgeID": str(rng.randint(1, 99999)),
+            "School_name": f"{rng.choice(SUBURBS)} Public School {i}",
+            "Suburb": rng.choice(SUBURBS),
+            "State": rng.choice(STATES),
+            "Postcode": str(rng.randint(800, 7999)),
+            "School_sector": rng.choice(["Government", "Catholic", "Independent"]),
+            "School_type": rng.choice(["Primary", "Secondary", "Combined"]),
+            "ICSEA": rng.choice([str(rng.randint(800, 1200)), "np"]),
+            "ICSEA_percentile": str(rng.randint(1, 99)),
+            "Teaching_staff": f"{rng.uniform(5, 120):.1f}",
+            "Total_enrolments": rng.choice([str(rng.randint(20, 2000)), ""]),
+            "Girls_enrolments": rng.randint(10, 1000),
+            "Boys_enrolments": rng.randint(10, 1000),
+            "Indigenous_pct": rng.choice([f"{rng.uniform(0, 40):.1f}", "np"]),
+            "LBOTE_pct": rng.uniform(0, 90),
+            "Latitude": f"{rng.uniform(-43.5, -10.5):.6f}",
+            "Longitude": f"{rng.uniform(113.0, 153.6):.6f}",
+            "Campus_type": "Single-campus",
+        })
+    return records
+
+
+def bench(label: str, fn, records: List[Dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for raw in records:
+            fn(raw)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<28} {best * 1e3:8.1f} ms  ({len(records) / best:,.0f} rec/s)")
+    return best
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    records = make_records(count)
+    coercer = SchemaCoercer.infer(records[:200])
+
+    # Output must be identical before timing means anything
+    for raw in records:
+        assert repr(coerce_item(raw, coercer)) == repr(coerce_item(raw)), raw
+
+    baseline = bench("to_decimal_if_number", coerce_item, records, repeat=3)
+    fast = bench("SchemaCoercer", lambda raw: coerce_item(raw, coercer), records, repeat=3)
+    print(f"speedup: {baseline / fast:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
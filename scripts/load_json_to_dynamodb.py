@@ -4,8 +4,13 @@ import sys
 import json
 import itertools
 import logging
+import random
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple
 
 import boto3
 from botocore.config import Config
@@ -59,11 +64,133 @@ def to_decimal_if_number(value: Any) -> Any:
     return value
 
 
-def coerce_item(raw: Dict[str, Any]) -> Dict[str, Any]:
-    item: Dict[str, Any] = {}
+# Plain ASCII numeric strings; anything else goes through to_decimal_if_number
+_NUMERIC_STRING = re.compile(r"-?(?:[0-9]+\.?[0-9]*|\.[0-9]+)")
+# Strings that to_decimal_if_number keeps as-is: a leading ASCII letter can never be
+# numeric, so only the 'np' NULL marker needs excluding
+_PLAIN_TEXT = re.compile(r"(?![Nn][Pp]\s*\Z)[A-Za-z]")
 
-    for key, value in raw.items():
-        item[key] = to_decimal_if_number(value)
+
+def _numeric_column(value: Any, _numeric=_NUMERIC_STRING.fullmatch, _text=_PLAIN_TEXT.match) -> Any:
+    if type(value) is str:
+        if _numeric(value):
+            return Decimal(value)
+        if _text(value):
+            return value
+    elif type(value) is int:
+        return Decimal(value)
+    return to_decimal_if_number(value)
+
+
+def _text_column(value: Any, _numeric=_NUMERIC_STRING.fullmatch, _text=_PLAIN_TEXT.match) -> Any:
+    if type(value) is str:
+        if _text(value):
+            return value
+        if _numeric(value):
+            return Decimal(value)
+    return to_decimal_if_number(value)
+
+
+def _int_column(value: Any) -> Any:
+    # Decimal(int) is exact, so it equals Decimal(str(value)) without the str round-trip
+    if type(value) is int:
+        return Decimal(value)
+    return to_decimal_if_number(value)
+
+
+def _float_column(value: Any) -> Any:
+    if type(value) is float:
+        try:
+            return Decimal(repr(value))
+        except InvalidOperation:
+            return value
+    return to_decimal_if_number(value)
+
+
+# Inline expressions mirroring the column converters above, used to compile a
+# single straight-line function per schema (no per-value call overhead)
+_INLINE_CONVERTERS = {
+    _numeric_column: "((D({v}) if N({v}) else ({v} if T({v}) else slow({v}))) if type({v}) is str"
+                     " else (D({v}) if type({v}) is int else slow({v})))",
+    _text_column: "(({v} if T({v}) else (D({v}) if N({v}) else slow({v}))) if type({v}) is str else slow({v}))",
+    _int_column: "(D({v}) if type({v}) is int else slow({v}))",
+    _float_column: "(D(repr({v})) if type({v}) is float else slow({v}))",
+    to_decimal_if_number: "slow({v})",
+}
+
+
+class SchemaCoercer:
+    """
+    Per-column converters inferred from a sample of records.
+    Each converter handles its column's common type directly and defers anything
+    unexpected to to_decimal_if_number, so output is always identical to it.
+    Records whose keys match the sampled key order use a compiled fast path.
+    """
+
+    def __init__(self, converters: Dict[str, Callable[[Any], Any]], keys: Tuple[str, ...] = ()) -> None:
+        self.converters = converters
+        self.keys = keys
+        self._compiled = self._compile(keys) if keys else None
+
+    @classmethod
+    def infer(cls, sample: Iterable[Dict[str, Any]]) -> "SchemaCoercer":
+        kinds: Dict[str, Dict[Callable[[Any], Any], int]] = {}
+        key_orders: Dict[Tuple[str, ...], int] = {}
+        for raw in sample:
+            if not isinstance(raw, dict):
+                continue
+            order = tuple(raw)
+            key_orders[order] = key_orders.get(order, 0) + 1
+            for key, value in raw.items():
+                if type(value) is str:
+                    kind = _numeric_column if _NUMERIC_STRING.fullmatch(value) else _text_column
+                elif type(value) is int:
+                    kind = _int_column
+                elif type(value) is float:
+                    kind = _float_column
+                else:
+                    kind = to_decimal_if_number
+                counts = kinds.setdefault(key, {})
+                counts[kind] = counts.get(kind, 0) + 1
+
+        converters = {key: max(counts, key=counts.get) for key, counts in kinds.items()}
+        keys = max(key_orders, key=key_orders.get) if key_orders else ()
+        return cls(converters, keys)
+
+    def _compile(self, keys: Tuple[str, ...]) -> Callable[[Iterable[Any]], Dict[str, Any]]:
+        names = [f"v{i}" for i in range(len(keys))]
+        entries = [
+            f"        {key!r}: {_INLINE_CONVERTERS[self.converters.get(key, to_decimal_if_number)].format(v=name)},"
+            for key, name in zip(keys, names)
+        ]
+        source = "\n".join(
+            ["def coerce(values):", f"    {', '.join(names)}, = values", "    return {"] + entries + ["    }"]
+        )
+        namespace = {
+            "D": Decimal,
+            "N": _NUMERIC_STRING.fullmatch,
+            "T": _PLAIN_TEXT.match,
+            "slow": to_decimal_if_number,
+        }
+        exec(source, namespace)  # noqa: S102 - source is built from repr()'d keys only
+        return namespace["coerce"]
+
+    def coerce_values(self, raw: Dict[str, Any]) -> Dict[str, Any]:
+        if self._compiled is not None and len(raw) == len(self.keys) and tuple(raw) == self.keys:
+            return self._compiled(raw.values())
+        get = self.converters.get
+        return {key: get(key, to_decimal_if_number)(value) for key, value in raw.items()}
+
+
+def coerce_item(raw: Dict[str, Any], coercer: Optional[SchemaCoercer] = None) -> Dict[str, Any]:
+    item: Dict[str, Any]
+
+    if coercer is not None:
+        item = coercer.coerce_values(raw)
+    else:
+        item = {}
+        for key, value in raw.items():
+            item[key] = to_decimal_if_number(value)
 
     # Build the primary key
     school_code = raw.get("School_code")
@@ -98,11 +225,299 @@ def chunked(iterable: Iterable[Any], size: int) -> Iterable[List[Any]]:
         yield batch
 
 
+def iter_json_array(f: IO[str], read_size: int = 1 << 16) -> Iterator[Any]:
+    """
+    Incrementally parse a top-level JSON array, yielding one element at a time.
+    Only the current read buffer and the element being decoded are held in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill() -> bool:
+        nonlocal buffer, pos, eof
+        chunk = f.read(read_size)
+        if not chunk:
+            eof = True
+            return False
+        buffer = buffer[pos:] + chunk
+        pos = 0
+        return True
+
+    def skip_whitespace() -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n":
+                pos += 1
+            if pos < len(buffer) or not fill():
+                return
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Expected the JSON file to contain an array of objects")
+    pos += 1
+
+    skip_whitespace()
+    if pos < len(buffer) and buffer[pos] == "]":
+        return
+
+    while True:
+        skip_whitespace()
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # The element may continue past the buffer; read more and retry
+                if eof or not fill():
+                    raise
+                continue
+            # A number at the buffer edge may be truncated ("12" of "123")
+            if end == len(buffer) and not eof and fill():
+                continue
+            break
+        pos = end
+        yield value
+
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ValueError("Unexpected end of JSON array")
+        if buffer[pos] == ",":
+            pos += 1
+        elif buffer[pos] == "]":
+            return
+        else:
+            raise ValueError(f"Unexpected character in JSON array: {buffer[pos]!r}")
+
+
+class AdaptiveBackoff:
+    """
+    Delay shared by all writer threads.
+    Grows on unprocessed items (throttling) and decays on clean writes.
+    """
+
+    def __init__(self, base_delay: float = 0.05, max_delay: float = 5.0) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.delay = 0.0
+        self._lock = threading.Lock()
+
+    def throttled(self) -> float:
+        with self._lock:
+            self.delay = min(self.max_delay, max(self.base_delay, self.delay * 2))
+            return self.delay
+
+    def succeeded(self) -> None:
+        with self._lock:
+            self.delay = self.delay / 2 if self.delay > self.base_delay else 0.0
+
+    def wait(self) -> None:
+        delay = self.delay
+        if delay:
+            # Jitter spreads retries from concurrent workers
+            time.sleep(delay * random.uniform(0.5, 1.0))
+
+
+class Checkpoint:
+    """
+    Tracks completed batches and persists the resume position.
+    Batches complete out of order; only the contiguous prefix is recorded.
+    """
+
+    def __init__(self, path: Optional[str], json_path: str, every: int = 20) -> None:
+        self.path = path
+        self.json_path = os.path.abspath(json_path)
+        self.every = every
+        self.next_index = 0
+        self._pending: Dict[int, int] = {}
+        self._completed_since_save = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> int:
+        if self.path and os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+            if state.get("json_path") != self.json_path:
+                raise ValueError(
+                    f"Checkpoint {self.path} belongs to {state.get('json_path')}, not {self.json_path}"
+                )
+            self.next_index = int(state["next_index"])
+        return self.next_index
+
+    def complete(self, start: int, end: int) -> None:
+        with self._lock:
+            self._pending[start] = end
+            while self.next_index in self._pending:
+                self.next_index = self._pending.pop(self.next_index)
+            self._completed_since_save += 1
+            if self._completed_since_save >= self.every:
+                self._save_locked()
+
+    def save(self) -> None:
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        self._completed_since_save = 0
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"json_path": self.json_path, "next_index": self.next_index}, f)
+        os.replace(tmp_path, self.path)
+
+
+def make_dynamodb_resource(aws_region: Optional[str] = None, endpoint_url: Optional[str] = None):
+    session = (
+        boto3.session.Session(region_name=aws_region)
+        if aws_region
+        else boto3.session.Session()
+    )
+    return session.resource(
+        "dynamodb",
+        endpoint_url=endpoint_url,
+        config=Config(retries={"max_attempts": 10, "mode": "standard"}),
+    )
+
+
+def write_batch(
+    dynamodb: Any,
+    table_name: str,
+    items: List[Dict[str, Any]],
+    backoff: AdaptiveBackoff,
+    max_attempts: int = 8,
+) -> int:
+    """
+    Write up to 25 items with BatchWriteItem, retrying unprocessed items.
+    Returns the number of retry rounds needed.
+    """
+    # BatchWriteItem rejects duplicate keys within one request; last row wins
+    unique = {item["school_id"]: item for item in items}
+    request_items = {table_name: [{"PutRequest": {"Item": item}} for item in unique.values()]}
+
+    retries = 0
+    for attempt in range(1, max_attempts + 1):
+        backoff.wait()
+        response = dynamodb.batch_write_item(RequestItems=request_items)
+        unprocessed = response.get("UnprocessedItems") or {}
+        if not unprocessed.get(table_name):
+            backoff.succeeded()
+            return retries
+        request_items = unprocessed
+        retries += 1
+        backoff.throttled()
+
+    raise RuntimeError(
+        f"{len(request_items[table_name])} items still unprocessed after {max_attempts} attempts"
+    )
+
+
+def load_items_streaming(
+    table_name: str,
+    json_path: str,
+    aws_region: Optional[str] = None,
+    log_every: int = 100,
+    workers: int = 8,
+    batch_size: int = 25,
+    checkpoint_path: Optional[str] = None,
+    endpoint_url: Optional[str] = None,
+    resource_factory: Optional[Callable[[], Any]] = None,
+) -> Dict[str, int]:
+    """
+    Stream the JSON array and write it with a pool of BatchWriteItem workers.
+    Memory stays bounded by the number of in-flight batches, not the file size.
+    """
+    if not 1 <= batch_size <= 25:
+        raise ValueError("batch_size must be between 1 and 25 (BatchWriteItem limit)")
+
+    if not os.path.exists(json_path):
+        logging.error(f"JSON not found: {json_path}")
+        sys.exit(1)
+
+    if resource_factory is None:
+        def resource_factory() -> Any:
+            return make_dynamodb_resource(aws_region, endpoint_url)
+
+    # boto3 resources are not thread-safe; each worker thread gets its own
+    local = threading.local()
+
+    def resource() -> Any:
+        if not hasattr(local, "dynamodb"):
+            local.dynamodb = resource_factory()
+        return local.dynamodb
+
+    checkpoint = Checkpoint(checkpoint_path, json_path)
+    resume_from = checkpoint.load()
+    if resume_from:
+        logging.info(f"Resuming from record {resume_from + 1}")
+
+    backoff = AdaptiveBackoff()
+    coercer: Optional[SchemaCoercer] = None
+    stats = {"written": 0, "skipped": 0, "retries": 0, "total": 0}
+    stats_lock = threading.Lock()
+
+    def process(start: int, rows: List[Any]) -> None:
+        items = []
+        skipped = 0
+        for offset, raw in enumerate(rows):
+            try:
+                items.append(coerce_item(raw, coercer))
+            except Exception as exc:  # noqa: BLE001 - log and continue
+                logging.warning(f"Skip row {start + offset + 1}: {exc}")
+                skipped += 1
+        retries = write_batch(resource(), table_name, items, backoff) if items else 0
+        checkpoint.complete(start, start + len(rows))
+        with stats_lock:
+            stats["written"] += len(items)
+            stats["skipped"] += skipped
+            stats["retries"] += retries
+
+    logging.info(f"Streaming JSON: {json_path} ({workers} workers)")
+    max_in_flight = workers * 2
+    in_flight: Set[Future] = set()
+
+    def drain(until: int) -> None:
+        nonlocal in_flight
+        while len(in_flight) > until:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                future.result()
+
+    with open(json_path, "r", encoding="utf-8") as f, ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            records = enumerate(iter_json_array(f))
+            for batch in chunked(records, batch_size):
+                start = batch[0][0]
+                stats["total"] = batch[-1][0] + 1
+                if coercer is None:
+                    coercer = SchemaCoercer.infer(raw for _, raw in batch)
+                if start + len(batch) <= resume_from:
+                    continue
+                rows = [raw for index, raw in batch if index >= resume_from]
+                start = max(start, resume_from)
+
+                drain(max_in_flight - 1)
+                in_flight.add(pool.submit(process, start, rows))
+
+                if stats["total"] // log_every != (stats["total"] - len(batch)) // log_every:
+                    logging.info(f"Queued {stats['total']} …")
+            drain(0)
+        finally:
+            checkpoint.save()
+
+    logging.info(
+        f"Done. Written: {stats['written']}, Skipped: {stats['skipped']}, "
+        f"Retries: {stats['retries']}, Total: {stats['total']}"
+    )
+    return stats
+
+
 def load_items(
     table_name: str,
     json_path: str,
     aws_region: Optional[str] = None,
     log_every: int = 100,
+    sample_size: int = 200,
 ) -> None:
     session = (
         boto3.session.Session(region_name=aws_region)
@@ -132,11 +547,12 @@ def load_items(
 
     written = 0
     skipped = 0
+    coercer = SchemaCoercer.infer(data[:sample_size])
 
     with table.batch_writer(overwrite_by_pkeys=["school_id"]) as batch_writer:
         for i, raw in enumerate(data, start=1):
             try:
-                item = coerce_item(raw)
+                item = coerce_item(raw, coercer)
                 batch_writer.put_item(Item=item)
                 written += 1
             except Exception as exc:  # noqa: BLE001 - log and continue
@@ -180,11 +596,53 @@ def parse_args():
         default=int(os.environ.get("LOG_EVERY", "100")),
         help="Progress log interval (default: 100)",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Parse the file incrementally and write with a pool of workers",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("WORKERS", "8")),
+        help="Parallel BatchWriteItem workers in --stream mode (default: 8)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        dest="batch_size",
+        type=int,
+        default=25,
+        help="Items per BatchWriteItem request in --stream mode (max/default: 25)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        dest="checkpoint_path",
+        default=os.environ.get("CHECKPOINT_PATH"),
+        help="Checkpoint file for resuming an interrupted --stream load",
+    )
+    parser.add_argument(
+        "--endpoint-url",
+        dest="endpoint_url",
+        default=os.environ.get("DYNAMODB_ENDPOINT_URL"),
+        help="DynamoDB endpoint, e.g. http://localhost:8000 for DynamoDB Local",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
+    if args.stream:
+        load_items_streaming(
+            table_name=args.table_name,
+            json_path=args.json_path,
+            aws_region=args.aws_region,
+            log_every=args.log_every,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            checkpoint_path=args.checkpoint_path,
+            endpoint_url=args.endpoint_url,
+        )
+        return
     load_items(
         table_name=args.table_name,
         json_path=args.json_path,
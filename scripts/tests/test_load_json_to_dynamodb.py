@@ -0,0 +1,175 @@
+"""
+Tests for the streaming DynamoDB loader
+Tests for the streaming DynamoDB loader against a local stand-in
+"""
+
+import pytest
+import io
+import json
+import random
+from decimal import Decimal
+import threading
+import sys
+import os
+
+# Add scripts path to sys.path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import load_json_to_dynamodb as loader
+
+
+class FakeDynamoDB:
+    """
+    In-memory stand-in for the DynamoDB service resource.
+    Returns every n-th request's items as unprocessed to exercise retries.
+    """
+
+    def __init__(self, throttle_every: int = 0, fail_after: int = 0):
+        self.tables = {}
+        self.calls = 0
+        self.throttle_every = throttle_every
+        self.fail_after = fail_after
+        self._lock = threading.Lock()
+
+    def batch_write_item(self, RequestItems):
+        with self._lock:
+            self.calls += 1
+            if self.fail_after and self.calls > self.fail_after:
+                raise ConnectionError("simulated crash")
+            unprocessed = {}
+            for table_name, requests in RequestItems.items():
+                assert len(requests) <= 25
+                keys = [request["PutRequest"]["Item"]["school_id"] for request in requests]
+                assert len(keys) == len(set(keys)), "duplicate keys in one request"
+                if self.throttle_every and self.calls % self.throttle_every == 0:
+                    unprocessed[table_name] = requests
+                    continue
+                table = self.tables.setdefault(table_name, {})
+                for request in requests:
+                    item = request["PutRequest"]["Item"]
+                    table[item["school_id"]] = item
+            return {"UnprocessedItems": unprocessed}
+
+
+def _write_records(tmp_path, records):
+    path = tmp_path / "schools.json"
+    path.write_text(json.dumps(records), encoding="utf-8")
+    return str(path)
+
+
+def _records(count):
+    return [
+        {"School_code": str(1000 + i), "School_name": f"School {i}", "ICSEA": str(900 + i), "Enrolments": "np"}
+        for i in range(count)
+    ]
+
+
+EDGE_VALUES = [
+    "", " ", "np", "NP", " np ", "np\n", "npx", "n", "123", " 12 ", "-1.5", "5.", ".5", "-.5",
+    "-", ".", "1-2", "1.2.3", "\u0661\u0662", "\u00b2", "abc", "Abc 12", "12abc", "-abc", "1e5",
+    "nan", "N/A", 1, 0, -5, 10 ** 30, 1.5, float("inf"), True, False, None,
+    [1, "2", "np"], {"a": "3", "b": ""}, Decimal("1.10"),
+]
+
+
+class TestSchemaCoercer:
+    """Test class for the precompiled per-column coercer"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_to_decimal_if_number(self, seed):
+        """Test identical output for every edge value in every column kind"""
+        rng = random.Random(seed)
+        keys = ["a", "b", "c", "d", "it's"]
+        sample = [{key: rng.choice(EDGE_VALUES) for key in keys} for _ in range(10)]
+        coercer = loader.SchemaCoercer.infer(sample)
+
+        for _ in range(500):
+            row_keys = keys if rng.random() < 0.5 else rng.sample(keys, rng.randint(1, len(keys)))
+            raw = {key: rng.choice(EDGE_VALUES) for key in row_keys}
+            expected = {key: loader.to_decimal_if_number(value) for key, value in raw.items()}
+            assert repr(coercer.coerce_values(raw)) == repr(expected)
+
+    def test_coerce_item_matches_without_coercer(self):
+        """Test that coerce_item output does not depend on the coercer"""
+        records = _records(20)
+        coercer = loader.SchemaCoercer.infer(records)
+
+        for raw in records:
+            assert repr(loader.coerce_item(raw, coercer)) == repr(loader.coerce_item(raw))
+
+
+class TestIterJsonArray:
+    """Test class for the incremental JSON array parser"""
+
+    @pytest.mark.parametrize("read_size", [1, 3, 17, 1 << 16])
+    def test_matches_json_load(self, read_size):
+        """Test that small read sizes produce the same records as json.load"""
+        records = _records(50) + [123456789, "a]b", [], {}]
+        text = json.dumps(records, indent=2)
+
+        assert list(loader.iter_json_array(io.StringIO(text), read_size)) == records
+
+    def test_rejects_non_array(self):
+        """Test that a top-level object is rejected"""
+        with pytest.raises(ValueError):
+            list(loader.iter_json_array(io.StringIO('{"a": 1}')))
+
+
+class TestLoadItemsStreaming:
+    """Test class for the streaming loader"""
+
+    def test_writes_all_records_with_retries(self, tmp_path):
+        """Test that all rows arrive despite unprocessed items"""
+        records = _records(300) + [{"School_name": "No key"}]
+        json_path = _write_records(tmp_path, records)
+        fake = FakeDynamoDB(throttle_every=3)
+
+        stats = loader.load_items_streaming(
+            "schools", json_path, workers=4, resource_factory=lambda: fake
+        )
+
+        table = fake.tables["schools"]
+        assert stats["written"] == 300
+        assert stats["skipped"] == 1
+        assert stats["retries"] > 0
+        assert len(table) == 300
+        assert table["1000"] == loader.coerce_item(records[0])
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        """Test that a crashed load resumes without rewriting finished batches"""
+        records = _records(500)
+        json_path = _write_records(tmp_path, records)
+        checkpoint_path = str(tmp_path / "load.checkpoint")
+
+        crashing = FakeDynamoDB(fail_after=6)
+        with pytest.raises(ConnectionError):
+            loader.load_items_streaming(
+                "schools", json_path, workers=1, batch_size=25,
+                checkpoint_path=checkpoint_path, resource_factory=lambda: crashing
+            )
+
+        with open(checkpoint_path, encoding="utf-8") as f:
+            next_index = json.load(f)["next_index"]
+        assert next_index == 150
+
+        resumed = FakeDynamoDB()
+        stats = loader.load_items_streaming(
+            "schools", json_path, workers=3, batch_size=25,
+            checkpoint_path=checkpoint_path, resource_factory=lambda: resumed
+        )
+
+        assert stats["written"] == 350
+        assert set(resumed.tables["schools"]) == {str(1000 + i) for i in range(150, 500)}
+
+    def test_rejects_oversized_batches(self, tmp_path):
+        """Test that batch sizes above the BatchWriteItem limit are rejected"""
+        json_path = _write_records(tmp_path, _records(1))
+
+        with pytest.raises(ValueError):
+            loader.load_items_streaming(
+                "schools", json_path, batch_size=26, resource_factory=FakeDynamoDB
+            )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])